@@ -0,0 +1,91 @@
+"""
+Page-load benchmark of the lean browser profile against the plain one.
+
+Loads the fixture list and the /info, /live and /scorecard tabs of the
+first few listed matches in two real headless Chrome sessions, one from
+create_driver(lean=False) (the original options) and one from
+create_driver(lean=True), and reports per tab:
+
+  - load time     driver.get() + wait_for_ready()
+  - requests      resources fetched (blocked ones never show up)
+  - KB            bytes transferred, from the Performance API
+
+Needs Chrome, chromedriver and network access to crex.live (or a site
+given with --base-url).
+
+    python -m benchmarks.bench_browser [--matches 3] [--repeat 3]
+"""
+import argparse
+import statistics
+import time
+
+import scrapper
+from driver_pool import WEBDRIVER_PATH, create_driver
+from readiness import wait_for_ready
+
+# Bytes and request count of everything the current page loaded so far
+_TRANSFER_JS = """
+const entries = performance.getEntriesByType('navigation')
+  .concat(performance.getEntriesByType('resource'));
+return {
+  requests: entries.length,
+  bytes: entries.reduce(function (sum, e) { return sum + (e.transferSize || 0); }, 0)
+};
+"""
+
+
+def tab_urls(base_url, matches):
+    urls = [("match_list", base_url + "/fixtures/match-list")]
+    for match_dict in matches:
+        tabs = scrapper.build_tab_urls(match_dict["link"])
+        urls += [(tab, tabs[tab]) for tab in ("info", "live", "scorecard")]
+    return urls
+
+
+def load(driver, tab, url):
+    start = time.perf_counter()
+    driver.get(url)
+    wait_for_ready(driver, tab)
+    elapsed = time.perf_counter() - start
+    transfer = driver.execute_script(_TRANSFER_JS)
+    return elapsed, transfer["requests"], transfer["bytes"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default=scrapper.CREX_BASE_URL)
+    parser.add_argument("--matches", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--webdriver-path", default=WEBDRIVER_PATH)
+    args = parser.parse_args()
+
+    live, upcoming, concluded = scrapper.get_match_data(base_url=args.base_url)
+    urls = tab_urls(args.base_url, (live + upcoming + concluded)[: args.matches])
+
+    results = {}
+    for profile, lean in (("plain", False), ("lean", True)):
+        driver = create_driver(args.webdriver_path, lean=lean)
+        try:
+            for _ in range(args.repeat):
+                for tab, url in urls:
+                    results.setdefault((tab, profile), []).append(load(driver, tab, url))
+        finally:
+            driver.quit()
+
+    print(f"\n{len(urls)} pages x {args.repeat}")
+    print(f"  {'tab':<12}{'profile':<8}{'load ms':>10}{'requests':>10}{'KB':>10}")
+    for tab in ("match_list", "info", "live", "scorecard"):
+        for profile in ("plain", "lean"):
+            samples = results.get((tab, profile))
+            if not samples:
+                continue
+            print(
+                f"  {tab:<12}{profile:<8}"
+                f"{statistics.median(s[0] for s in samples) * 1000:>10.0f}"
+                f"{statistics.median(s[1] for s in samples):>10.0f}"
+                f"{statistics.median(s[2] for s in samples) / 1024:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Size of the typed records from normalize.py vs the scraped string dicts.
+
+For every recorded match, compares the raw info/live/scorecard dicts
+with their normalized form: in-memory size (deep sys.getsizeof), JSON
+bytes and BSON bytes (what a Mongo document costs), plus the time the
+normalization stage takes per match.
+
+    python -m benchmarks.bench_normalize [--repeat N]
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+
+import bson
+
+from benchmarks.corpus import load_recorded_matches
+from normalize import normalize_info, normalize_live, normalize_scorecard
+
+SECTIONS = {
+    "info_data": normalize_info,
+    "live_data": normalize_live,
+    "scorecard_data": normalize_scorecard,
+}
+
+
+def deep_sizeof(obj, seen=None):
+    """Bytes held by `obj` and everything it references (shared objects once)."""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    return size
+
+
+def measure(doc):
+    return {
+        "memory": deep_sizeof(doc),
+        "json": len(json.dumps(doc, ensure_ascii=False).encode("utf-8")),
+        "bson": len(bson.encode({"d": doc})),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    records = load_recorded_matches()
+    print(f"{len(records)} recorded matches\n")
+    print(f"{'section':<16}{'n':>4}{'metric':>8}{'raw':>12}{'typed':>12}{'saved':>9}")
+
+    for section, normalize in SECTIONS.items():
+        raw_docs, typed_docs = [], []
+        for record in records:
+            typed = normalize(record.get(section))
+            if typed is not None:
+                raw_docs.append(record[section])
+                typed_docs.append(typed)
+        if not raw_docs:
+            continue
+
+        raw = [measure(d) for d in raw_docs]
+        typed = [measure(d) for d in typed_docs]
+        for metric in ("memory", "json", "bson"):
+            raw_total = sum(m[metric] for m in raw)
+            typed_total = sum(m[metric] for m in typed)
+            saved = 1 - typed_total / raw_total if raw_total else 0
+            print(f"{section:<16}{len(raw_docs):>4}{metric:>8}"
+                  f"{raw_total:>12,}{typed_total:>12,}{saved:>8.0%}")
+
+        samples = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for doc in raw_docs:
+                normalize(doc)
+            samples.append(time.perf_counter() - start)
+        per_doc = statistics.median(samples) / len(raw_docs) * 1e6
+        print(f"{'':<16}{'':>4}{'time':>8}{per_doc:>20.1f}us per match\n")
+
+
+if __name__ == "__main__":
+    main()
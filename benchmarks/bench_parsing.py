@@ -0,0 +1,136 @@
+"""
+Micro-benchmark of the HTML parsing backends.
+
+Compares BeautifulSoup with html.parser vs lxml (and a raw selectolax
+parse, when installed) on the saved crex.live.html and on the tab pages
+rendered from the recorded matches, and shows what the class index in
+parsing.ParsedPage saves over repeated soup.find() scans.
+
+    python -m benchmarks.bench_parsing [--repeat N]
+"""
+import argparse
+import statistics
+import time
+
+import parsing
+import scrapper
+from benchmarks.corpus import SAVED_PAGE, build_corpus
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+TAB_PARSERS = {
+    "info": scrapper.parse_match_info,
+    "live": scrapper.parse_live_data,
+    "scorecard": scrapper.parse_scorecard,
+}
+
+# Lookups parse_match_info does, repeated to show index vs full scans
+INFO_LOOKUPS = [
+    "match-date match-venue",
+    "match-info-date",
+    "s-name",
+    "toss-wrap",
+    "team1-wins",
+    "team2-wins",
+    "venue-left-wrapper",
+    "venue-pace-wrap",
+    "align-center weather-wrap",
+]
+
+
+def _time(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def available_backends():
+    backends = ["html.parser"]
+    try:
+        import lxml  # noqa: F401
+
+        backends.append("lxml")
+    except ImportError:
+        pass
+    return backends
+
+
+def bench_raw_parse(pages, repeat):
+    print(f"\n{'page':<28}{'KB':>8}" + "".join(f"{b:>14}" for b in available_backends())
+          + (f"{'selectolax':>14}" if HTMLParser else ""))
+    for name, html in pages:
+        row = f"{name:<28}{len(html) / 1024:>8.0f}"
+        for backend in available_backends():
+            row += f"{_time(lambda: parsing.make_soup(html, backend), repeat):>12.2f}ms"
+        if HTMLParser:
+            row += f"{_time(lambda: HTMLParser(html), repeat):>12.2f}ms"
+        print(row)
+
+
+def bench_tab_parsers(corpus, repeat):
+    print("\nFull tab parse (parse + extraction), median per page:")
+    print(f"{'tab':<12}{'pages':>6}" + "".join(f"{b:>14}" for b in available_backends()))
+    original = parsing.DEFAULT_BACKEND
+    try:
+        for tab, parse_fn in TAB_PARSERS.items():
+            pages = [html for path, html in corpus.items() if path.endswith("/" + tab)]
+            row = f"{tab:<12}{len(pages):>6}"
+            for backend in available_backends():
+                parsing.DEFAULT_BACKEND = backend
+                total = sum(_time(lambda: parse_fn(html), repeat) for html in pages)
+                row += f"{total / max(len(pages), 1):>12.2f}ms"
+            print(row)
+    finally:
+        parsing.DEFAULT_BACKEND = original
+
+
+def bench_index(corpus, repeat):
+    html = next(html for path, html in corpus.items() if path.endswith("/info"))
+    soup = parsing.make_soup(html)
+
+    def scans():
+        for class_ in INFO_LOOKUPS:
+            soup.find(class_=class_)
+
+    index = parsing.ParsedPage(html)
+
+    def indexed():
+        for class_ in INFO_LOOKUPS:
+            index.first(class_)
+
+    build = _time(lambda: parsing.ParsedPage(html), repeat) - _time(
+        lambda: parsing.make_soup(html), repeat
+    )
+    print(f"\n{len(INFO_LOOKUPS)} lookups on an /info page:")
+    print(f"  soup.find() scans : {_time(scans, repeat):.3f}ms")
+    print(f"  class index hits  : {_time(indexed, repeat):.3f}ms "
+          f"(+{max(build, 0):.3f}ms one-off index build)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = build_corpus()
+    pages = []
+    with open(SAVED_PAGE, encoding="utf-8") as f:
+        pages.append(("crex.live.html", f.read()))
+    for suffix in ("/match-list", "/info", "/live", "/scorecard", "/squads"):
+        path = next((p for p in corpus if p.endswith(suffix)), None)
+        if path:
+            pages.append((suffix.lstrip("/") + " (recorded)", corpus[path]))
+
+    bench_raw_parse(pages, args.repeat)
+    bench_tab_parsers(corpus, args.repeat)
+    bench_index(corpus, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
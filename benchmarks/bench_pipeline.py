@@ -0,0 +1,178 @@
+"""
+End-to-end benchmark of the scraping pipeline against a local fake crex.
+
+Starts benchmarks.fake_crex.FakeCrexServer on the recorded corpus and
+runs the real scraper functions against it, with ReplayDrivers in the
+DriverPool standing in for Chrome:
+
+  - get_match_data()               fixture-list fetch + parse
+  - scrape_all_tabs_for_match()    every tab of every match, per-tab latency
+  - parse_* on the served pages    parse time per tab, without any I/O
+  - real_time_scraping_loop()      one cycle, wall time and peak memory
+                                   per tracked match
+
+    python -m benchmarks.bench_pipeline [--latency 0.05] [--matches N]
+"""
+import argparse
+import contextlib
+import io
+import statistics
+import time
+import tracemalloc
+
+import scrapper
+from benchmarks.fake_crex import FakeCrexServer, ReplayDriver
+from driver_pool import DriverPool
+from fetcher import HttpFetcher
+
+PAGE_PARSERS = {
+    "match-list": scrapper.parse_match_list,
+    "info": scrapper.parse_match_info,
+    "live": scrapper.parse_live_data,
+    "scorecard": scrapper.parse_scorecard,
+}
+
+
+def percentiles(samples):
+    """(p50, p90, p99) in milliseconds."""
+    if len(samples) < 2:
+        value = samples[0] * 1000 if samples else 0.0
+        return value, value, value
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return cuts[49] * 1000, cuts[89] * 1000, cuts[98] * 1000
+
+
+def report(name, samples, pages=None):
+    p50, p90, p99 = percentiles(samples)
+    line = f"  {name:<22}{len(samples):>6}{p50:>10.1f}{p90:>10.1f}{p99:>10.1f}"
+    if pages is not None:
+        line += f"{pages / sum(samples):>12.1f}"
+    print(line)
+
+
+def header(title, rate=False):
+    print(f"\n{title}")
+    print(f"  {'':<22}{'n':>6}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}"
+          + (f"{'pages/s':>12}" if rate else ""))
+
+
+@contextlib.contextmanager
+def quiet():
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+@contextlib.contextmanager
+def timed_tabs(samples):
+    """Records the latency of every scrapper.scrape_tab() call by tab."""
+    original = scrapper.scrape_tab
+
+    def wrapper(tab, url, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original(tab, url, *args, **kwargs)
+        finally:
+            samples.setdefault(tab, []).append(time.perf_counter() - start)
+
+    scrapper.scrape_tab = wrapper
+    try:
+        yield
+    finally:
+        scrapper.scrape_tab = original
+
+
+def bench_match_list(server, pool, fetcher, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with quiet():
+            matches = scrapper.get_match_data(pool=pool, fetcher=fetcher, base_url=server.base_url)
+        samples.append(time.perf_counter() - start)
+    header("get_match_data()", rate=True)
+    report("match-list", samples, pages=repeat)
+    return matches
+
+
+def bench_all_tabs(server, pool, fetcher, matches):
+    tab_samples, match_samples = {}, []
+    before = sum(server.requests.values())
+    with timed_tabs(tab_samples):
+        for match_dict in matches:
+            start = time.perf_counter()
+            with quiet():
+                scrapper.scrape_all_tabs_for_match(match_dict, pool=pool, fetcher=fetcher)
+            match_samples.append(time.perf_counter() - start)
+    pages = sum(server.requests.values()) - before
+
+    header("scrape_all_tabs_for_match()", rate=True)
+    report("match (all tabs)", match_samples, pages=pages)
+    for tab in scrapper.TABS:
+        report(tab, tab_samples.get(tab, []))
+
+
+def bench_parse(server, repeat):
+    header("Parse only (served pages, no I/O)")
+    for tab, parse_fn in PAGE_PARSERS.items():
+        pages = [html for path, html in server.pages.items() if path.endswith("/" + tab)]
+        samples = []
+        for html in pages:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                parse_fn(html)
+                samples.append(time.perf_counter() - start)
+        report(tab, samples)
+
+
+def bench_loop_cycle(server, pool, fetcher, workers):
+    tracemalloc.start()
+    start = time.perf_counter()
+    with quiet():
+        tracked = scrapper.real_time_scraping_loop(
+            poll_interval=0,
+            pool=pool,
+            fetcher=fetcher,
+            max_workers=workers,
+            base_url=server.base_url,
+            max_cycles=1,
+        )
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    count = max(len(tracked), 1)
+    print(f"\nreal_time_scraping_loop(), one cycle with {workers} worker(s)")
+    print(f"  tracked matches       {len(tracked):>8}")
+    print(f"  cycle wall time       {elapsed * 1000:>8.1f} ms")
+    print(f"  peak memory           {peak / 1024:>8.0f} KB "
+          f"({peak / 1024 / count:.0f} KB per tracked match)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.05,
+                        help="seconds the fake server waits before each response")
+    parser.add_argument("--matches", type=int, default=10,
+                        help="matches to scrape with scrape_all_tabs_for_match()")
+    parser.add_argument("--pool-size", type=int, default=scrapper.DRIVER_POOL_SIZE)
+    parser.add_argument("--workers", type=int, default=scrapper.LIVE_WORKERS)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with FakeCrexServer(latency=args.latency) as server:
+        pool = DriverPool(size=args.pool_size, driver_factory=ReplayDriver)
+        fetcher = HttpFetcher()
+        try:
+            print(f"Fake crex at {server.base_url}: {len(server.pages)} pages, "
+                  f"{args.latency * 1000:.0f} ms latency")
+            live, upcoming, concluded = bench_match_list(server, pool, fetcher, args.repeat)
+            bench_all_tabs(server, pool, fetcher, (live + upcoming + concluded)[: args.matches])
+            bench_parse(server, args.repeat)
+            bench_loop_cycle(server, pool, fetcher, args.workers)
+            print(f"\nHTTP fetcher: {fetcher.hits} hits, {fetcher.fallbacks} browser fallbacks")
+        finally:
+            fetcher.close()
+            pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Parity check and cost comparison of the two /live extraction engines.
+
+Serves synthetic live pages (benchmarks.corpus.sample_live_states()) from
+a local FakeCrexServer, loads each one in a real headless Chrome and
+extracts it both ways:
+
+  - python   driver.page_source + parse_live_data()
+  - in-page  one execute_script(_LIVE_JS) returning JSON
+
+Prints every page where the two disagree, the bytes each engine moves
+over the WebDriver connection and the time per page. Exits with status 1
+on any mismatch (tests/test_live_extractor.py runs the same comparison
+without a browser). Needs Chrome and chromedriver.
+
+    python -m benchmarks.check_live_extractor [--pages 50] [--webdriver-path chromedriver]
+"""
+import argparse
+import json
+import sys
+import time
+
+import scrapper
+from benchmarks.corpus import render_live_page, sample_live_states
+from benchmarks.fake_crex import FakeCrexServer
+from driver_pool import WEBDRIVER_PATH, create_driver
+from readiness import wait_for_ready
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--webdriver-path", default=WEBDRIVER_PATH)
+    args = parser.parse_args()
+
+    states = sample_live_states(args.pages, seed=args.seed)
+    pages = {f"/scoreboard/check/{i}/live": render_live_page(s) for i, s in enumerate(states)}
+
+    mismatches = 0
+    source_bytes = json_bytes = 0
+    python_time = in_page_time = 0.0
+    with FakeCrexServer(pages) as server:
+        driver = create_driver(args.webdriver_path)
+        try:
+            for path in pages:
+                driver.get(server.base_url + path)
+                wait_for_ready(driver, "live")
+
+                start = time.perf_counter()
+                page_source = driver.page_source
+                expected = scrapper.parse_live_data(page_source)
+                python_time += time.perf_counter() - start
+
+                start = time.perf_counter()
+                actual = scrapper.extract_live_in_page(driver)
+                in_page_time += time.perf_counter() - start
+
+                source_bytes += len(page_source.encode("utf-8"))
+                json_bytes += len(json.dumps(actual).encode("utf-8"))
+                if actual != expected:
+                    mismatches += 1
+                    print(f"MISMATCH {path}")
+                    print(f"  python:  {expected}")
+                    print(f"  in-page: {actual}")
+        finally:
+            driver.quit()
+
+    count = len(pages)
+    print(f"\n{count} live pages, {mismatches} mismatches")
+    print(f"  {'':<10}{'KB/page':>10}{'ms/page':>10}")
+    print(f"  {'python':<10}{source_bytes / 1024 / count:>10.1f}{python_time * 1000 / count:>10.1f}")
+    print(f"  {'in-page':<10}{json_bytes / 1024 / count:>10.1f}{in_page_time * 1000 / count:>10.1f}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
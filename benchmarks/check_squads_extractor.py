@@ -0,0 +1,98 @@
+"""
+Parity check of the two squads extraction paths.
+
+Serves the squads pages of the seed corpus (plus one page with nested
+markup and irregular whitespace in the player rows) from a local
+FakeCrexServer, loads each one in a real headless Chrome and extracts it
+both ways:
+
+  - clicking   one click per team button, panel parsed by parse_squad_rows()
+  - in-page    one execute_async_script(_SQUADS_JS) for every team
+
+Prints every page where the two disagree and the time per page. Exits
+with status 1 on any mismatch (tests/test_squads_extractor.py runs the
+same comparison without a browser). Needs Chrome and chromedriver.
+
+    python -m benchmarks.check_squads_extractor [--webdriver-path chromedriver]
+"""
+import argparse
+import sys
+import time
+
+import scrapper
+from benchmarks.corpus import build_corpus, render_squads_page
+from benchmarks.fake_crex import FakeCrexServer
+from driver_pool import WEBDRIVER_PATH, create_driver
+from readiness import READY, wait_for_ready
+
+# Rows as a site template may render them: text split across elements,
+# newlines and indentation inside the cells
+NESTED_ROWS_PAGE = render_squads_page({"squads": []}).replace(
+    '<div class="info-right-wrapper"></div>',
+    '<div class="info-right-wrapper">'
+    '<button class="playingxi-button">\n  <span>NZ</span>\n</button>'
+    '<button class="playingxi-button"><span>SL</span> </button>'
+    '<div class="playingxi-card">'
+    '<div class="playingxi-card-row"><div class="p-name">\n  Kane\n  <span>Williamson</span>'
+    ' <span>(c)</span>\n</div><div class="bat-ball-type"> Right-hand\tbat </div></div>'
+    '<div class="playingxi-card-row"><div class="p-name">Tom<span>Latham</span></div></div>'
+    '</div>'
+    '<div class="playingxi-card on-bench-wrap">'
+    '<div class="playingxi-card-row"><div class="p-name"> Ish  Sodhi </div>'
+    '<div class="bat-ball-type"><span>Leg</span>\n<span>break</span></div></div>'
+    '</div></div>',
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--webdriver-path", default=WEBDRIVER_PATH)
+    args = parser.parse_args()
+
+    pages = {
+        path: html for path, html in build_corpus().items()
+        if path.endswith("/squads") and "playingxi-button" in html
+    }
+    pages["/scoreboard/check/nested/squads"] = NESTED_ROWS_PAGE
+
+    mismatches = 0
+    clicking_time = in_page_time = 0.0
+    with FakeCrexServer(pages) as server:
+        driver = create_driver(args.webdriver_path)
+        try:
+            for path in pages:
+                driver.get(server.base_url + path)
+                outcome, _ = wait_for_ready(driver, "squads")
+                if outcome != READY:
+                    mismatches += 1
+                    print(f"NOT READY {path}: {outcome}")
+                    continue
+
+                start = time.perf_counter()
+                expected = scrapper._squads_by_clicking(driver)
+                clicking_time += time.perf_counter() - start
+
+                driver.get(server.base_url + path)
+                wait_for_ready(driver, "squads")
+                start = time.perf_counter()
+                actual = scrapper.extract_squads_in_page(driver)
+                in_page_time += time.perf_counter() - start
+
+                if actual != expected:
+                    mismatches += 1
+                    print(f"MISMATCH {path}")
+                    print(f"  clicking: {expected}")
+                    print(f"  in-page:  {actual}")
+        finally:
+            driver.quit()
+
+    count = len(pages)
+    print(f"\n{count} squads pages, {mismatches} mismatches")
+    print(f"  {'':<10}{'ms/page':>10}")
+    print(f"  {'clicking':<10}{clicking_time * 1000 / count:>10.1f}")
+    print(f"  {'in-page':<10}{in_page_time * 1000 / count:>10.1f}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,357 @@
+"""
+Seed corpus for the offline benchmarks.
+
+Renders crex-like HTML pages (fixture list, /info, /live, /scorecard,
+/squads) back out of the structures recorded in initial_scrape.json and
+all_matches_data.json, using the same classes the scrapers look for, so
+the parsers can be exercised without hitting crex.live.
+"""
+import html
+import json
+import os
+import random
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RECORDED_FILES = ("initial_scrape.json", "all_matches_data.json")
+SAVED_PAGE = os.path.join(REPO_ROOT, "crex.live.html")
+
+# Unrelated markup (nav, ads, footers) so pages have a realistic DOM size
+FILLER_BLOCKS = 150
+
+
+def _e(text):
+    return html.escape(str(text))
+
+
+def _page(body, filler=FILLER_BLOCKS):
+    noise = "".join(
+        f'<div class="ad-slot nav-item-{i % 7}"><span class="label">Promo {i}</span>'
+        f'<a href="/news/{i}">Headline {i}</a></div>'
+        for i in range(filler)
+    )
+    return (
+        "<!DOCTYPE html><html><head><title>crex</title>"
+        '<script>window.__data = {};</script></head><body>'
+        f'<header class="site-header">{noise[: len(noise) // 2]}</header>'
+        f"<main>{body}</main>"
+        f'<footer class="site-footer">{noise[len(noise) // 2:]}</footer>'
+        "</body></html>"
+    )
+
+
+# ----------------------------------------------------------------------
+# 1) LOADING RECORDED MATCHES
+# ----------------------------------------------------------------------
+def load_recorded_matches():
+    """
+    Returns every recorded match record (live, upcoming and concluded)
+    from the JSON files in the repo root.
+    """
+    records = []
+    for name in RECORDED_FILES:
+        path = os.path.join(REPO_ROOT, name)
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        for category in ("live", "upcoming", "concluded"):
+            for record in data.get(category, []):
+                records.append(dict(record, category=category))
+    return records
+
+
+def match_path(record):
+    """URL path of a recorded match, without the trailing tab."""
+    link = record.get("match_link") or record.get("link") or ""
+    path = link.split("crex.live", 1)[-1]
+    for tab in ("/live", "/info", "/scorecard", "/squads"):
+        if path.endswith(tab):
+            return path[: -len(tab)]
+    return path
+
+
+# ----------------------------------------------------------------------
+# 2) PAGE RENDERERS
+# ----------------------------------------------------------------------
+def render_fixture_list(records):
+    cards = []
+    for record in records:
+        teams = record.get("teams") or []
+        path = match_path(record)
+        category = record.get("category")
+        if category == "live":
+            live = record.get("live_data") or {}
+            tag = '<span class="liveTag">LIVE</span>'
+            team_html = "".join(
+                f'<div class="team-info"><span class="team-name">{_e(t)}</span>'
+                f'<span class="team-score">{_e(live.get("score", "0/0"))}</span>'
+                f'<span class="total-overs">0.0</span></div>'
+                for t in teams
+            )
+            href = path + "/live"
+        elif category == "upcoming":
+            date = (record.get("info_data") or {}).get("match_date", "N/A")
+            tag = (
+                f'<div class="not-started"><span class="start-text">{_e(date)}</span>'
+                f'<span class="time">T20</span></div>'
+            )
+            team_html = "".join(
+                f'<div class="team-info"><span class="team-name">{_e(t)}</span></div>'
+                for t in teams
+            )
+            href = path + "/info"
+        else:
+            tag = (
+                '<div class="result"><span>Result</span>'
+                '<span class="reason">Recorded match</span></div>'
+            )
+            team_html = "".join(
+                f'<div class="team-info"><span class="team-name">{_e(t)}</span>'
+                f'<span class="team-score">0/0</span><span class="total-overs">20.0</span></div>'
+                for t in teams
+            )
+            href = path + "/scorecard"
+        cards.append(
+            f'<div class="match-card-container"><a href="{_e(href)}">{tag}{team_html}</a></div>'
+        )
+    return _page("".join(cards))
+
+
+def render_info_page(info, squads_data=None):
+    """
+    The /info tab. crex shows the squads panel on the same page (the
+    scraper opens /info for squads too), so it is appended when given.
+    """
+    info = info if isinstance(info, dict) else {}
+    teams = "".join(
+        f'<div class="form-team-name">{_e(t)}</div>' for t in info.get("teams_name", [])
+    )
+    h2h = info.get("head_to_head") or ["N/A", "N/A"]
+    results = "".join(
+        f'<div class="global-match-card gmc-without-logo">{_e(r)}</div>'
+        for r in info.get("match_result", [])
+    )
+    body = (
+        '<div class="match-info-card">'
+        f'<div class="match-date match-venue">{_e(info.get("match_venue", ""))}</div>'
+        f'<div class="match-info-date">{_e(info.get("match_date", ""))}</div>'
+        f'<div class="s-name">{_e(info.get("series_name", ""))}</div>'
+        f'<div class="toss-wrap"><p>{_e(info.get("toss_info", ""))}</p></div>'
+        "</div>"
+        f"{teams}"
+        f'<div class="team1-wins">{_e(h2h[0])}</div><div class="team2-wins">{_e(h2h[-1])}</div>'
+        f"{results}"
+        f'<table class="table table-borderless colHeader"><tr><td>{_e(info.get("scorecard_table", ""))}</td></tr></table>'
+        f'<div class="align-center weather-wrap">{_e(info.get("venue_details", ""))}</div>'
+        f'<div class="venue-left-wrapper">{_e(info.get("venue_stats", ""))}</div>'
+        f'<div class="venue-pace-wrap">{_e(info.get("pace_vs_spin_on_venue", ""))}</div>'
+    )
+    if squads_data is not None:
+        body += _squads_panel(squads_data)
+    return _page(body)
+
+
+def render_live_page(live):
+    live = live if isinstance(live, dict) else {}
+    blocks = []
+    for b in live.get("batsmen", []):
+        strike = '<div class="circle-strike-icon"></div>' if b.get("on_strike") else ""
+        blocks.append(
+            '<div class="batsmen-partnership">'
+            f'<div class="batsmen-name"><p>{_e(b["name"])}</p></div>'
+            f'<div class="batsmen-score"><p>{_e(b["runs"])}</p><p>({_e(b["balls"])})</p>{strike}</div>'
+            '<div class="player-strike-wrapper">'
+            f'<div class="strike-rate">4s: {_e(b["fours"])}</div>'
+            f'<div class="strike-rate">6s: {_e(b["sixes"])}</div>'
+            f'<div class="strike-rate">SR: {_e(b["sr"])}</div>'
+            "</div></div>"
+        )
+    bowler = live.get("bowler") or {}
+    if bowler:
+        blocks.append(
+            '<div class="batsmen-partnership">'
+            f'<div class="batsmen-name">{_e(bowler["name"])}</div>'
+            f'<div class="batsmen-score bowler"><p>{_e(bowler["figures"])}</p><p>{_e(bowler["overs"])}</p></div>'
+            '<div class="player-strike-wrapper"><div class="strike-rate">'
+            f'<span> Econ: </span><span> {_e(bowler["economy"])} </span></div></div>'
+            "</div>"
+        )
+    slides = []
+    for over in live.get("overs_timeline", []):
+        balls = "".join(f'<div class="over-ball">{_e(x)}</div>' for x in over["balls"])
+        slides.append(
+            '<div class="overs-slide"><div class="content">'
+            f'<span>{_e(over["over_title"])}</span>{balls}'
+            f'<div class="total">= {_e(over["total"])}</div></div></div>'
+        )
+    prob = ""
+    win = live.get("win_probability")
+    if isinstance(win, dict) and len(win) >= 2:
+        names = "".join(f'<div class="teamNameScreenText">{_e(t)}</div>' for t in win)
+        pcts = "".join(f'<div class="percentageScreenText">{_e(p)}%</div>' for p in win.values())
+        prob = f'<div class="progressBarContainer">{names}{pcts}</div>'
+    body = (
+        '<div class="container live-screen-wrap">'
+        f'<div class="playing-batsmen-wrapper">{"".join(blocks)}</div>'
+        f'<div class="overs-timeline">{"".join(slides)}</div>'
+        f"{prob}</div>"
+    )
+    return _page(body)
+
+
+def _table(rows, columns, name_key):
+    trs = []
+    for row in rows:
+        cells = [f'<td><span class="player-name">{_e(row[name_key])}</span></td>']
+        cells += [f"<td>{_e(row[c])}</td>" for c in columns]
+        trs.append("<tr>" + "".join(cells) + "</tr>")
+    return (
+        '<div class="card score-card"><table class="bowler-table"><tbody>'
+        + "".join(trs)
+        + "</tbody></table></div>"
+    )
+
+
+def render_scorecard_page(scorecard):
+    scorecard = scorecard if isinstance(scorecard, dict) else {}
+    parts = ['<div class="score"></div>']
+    for innings in scorecard.get("batting", []):
+        parts.append('<div class="table-heading"><h3>Batting</h3></div>')
+        parts.append(
+            _table(innings, ["runs", "balls", "fours", "sixes", "strike_rate"], "batter")
+        )
+    for innings in scorecard.get("bowling", []):
+        parts.append('<div class="table-heading"><h3>Bowling</h3></div>')
+        parts.append(
+            _table(
+                innings,
+                ["overs", "maidens", "runs_conceded", "wickets", "economy"],
+                "bowler",
+            )
+        )
+    ytb = scorecard.get("yet_to_bat", [])
+    if ytb:
+        players = "".join(
+            f'<div class="custom-width"><div class="content"><div class="name">{_e(p["name"])}</div>'
+            f'<p>Avg: <span>{_e(p["average"])}</span></p></div></div>'
+            for p in ytb
+        )
+        parts.append(f'<h3>Yet to bat</h3><div class="yet-to-bat">{players}</div>')
+    fow = scorecard.get("fall_of_wickets", [])
+    if fow:
+        trs = "".join(
+            f'<tr><td><span class="player-name">{_e(w["batsman"])}</span></td>'
+            f'<td>{_e(w["score"])}</td><td>{_e(w["overs"])}</td></tr>'
+            for w in fow
+        )
+        parts.append(
+            '<h3>FALL OF WICKETS</h3><div class="card score-card"><table class="bowler-table">'
+            f"<tbody>{trs}</tbody></table></div>"
+        )
+    partnerships = scorecard.get("partnerships", [])
+    if partnerships:
+        blocks = "".join(
+            f'<div class="p-section-wrapper"><div class="p-wckt-info">{_e(p["wicket"])}</div>'
+            '<div class="p-info-wrapper">'
+            f'<div class="p-data"><p>{_e(p["batter1"])}</p><span class="run-highlight">{_e(p["batter1_stats"])}</span></div>'
+            f'<div class="p-data"><p class="p-runs">{_e(p["total_runs"])}</p></div>'
+            f'<div class="p-data"><p>{_e(p["batter2"])}</p><span class="run-highlight">{_e(p["batter2_stats"])}</span></div>'
+            "</div></div>"
+            for p in partnerships
+        )
+        parts.append(f'<div class="partnership-section">{blocks}</div>')
+    return _page("".join(parts))
+
+
+def _squads_panel(squads_data):
+    squads = squads_data.get("squads") if isinstance(squads_data, dict) else None
+    squads = squads if isinstance(squads, list) else []
+    buttons = "".join(
+        f'<button class="playingxi-button">{_e(t["team_name"])}</button>' for t in squads
+    )
+
+    def rows(players):
+        return "".join(
+            f'<div class="playingxi-card-row"><div class="p-name">{_e(p["player_name"])}</div>'
+            f'<div class="bat-ball-type">{_e(p["player_type"])}</div></div>'
+            for p in players
+        )
+
+    teams = "".join(
+        f'<div class="team-squad" data-team="{_e(t["team_name"])}">'
+        f'<div class="playingxi-card">{rows(t["playing_11"])}</div>'
+        f'<div class="playingxi-card on-bench-wrap">{rows(t["on_bench"])}</div></div>'
+        for t in squads
+    )
+    return f'<div class="info-right-wrapper">{buttons}{teams}</div>'
+
+
+def sample_live_states(count, seed=0):
+    """
+    Synthetic /live states in the parse_live_data() format (the recorded
+    matches have no live data), e.g. for checking live extractors.
+    """
+    rng = random.Random(seed)
+    states = []
+    for i in range(count):
+        batsmen = []
+        for b in range(rng.choice((0, 1, 2, 2, 2))):
+            runs, balls = rng.randint(0, 120), rng.randint(1, 80)
+            batsmen.append({
+                "name": f"Batter {i}-{b}",
+                "runs": str(runs),
+                "balls": str(balls),
+                "fours": str(rng.randint(0, 10)),
+                "sixes": str(rng.randint(0, 6)),
+                "sr": f"{runs * 100 / balls:.2f}",
+                "on_strike": b == 0,
+            })
+        bowler = {}
+        if batsmen:
+            bowler = {
+                "name": f"Bowler {i}",
+                "figures": f"{rng.randint(0, 4)}-{rng.randint(0, 60)}",
+                "overs": f"({rng.randint(0, 9)}.{rng.randint(0, 5)})",
+                "economy": f"{rng.uniform(3, 15):.2f}",
+            }
+        overs = []
+        for o in range(rng.randint(0, 4)):
+            balls = [rng.choice(("0", "1", "2", "4", "6", "W", "1wd", "4lb")) for _ in range(6)]
+            overs.append({
+                "over_title": f"Over {o + 1}",
+                "balls": balls,
+                "total": str(rng.randint(0, 24)),
+            })
+        win = "N/A"
+        if batsmen and rng.random() < 0.7:
+            pct = rng.randint(1, 99)
+            win = {f"T{i}A": str(pct), f"T{i}B": str(100 - pct)}
+        states.append({
+            "batsmen": batsmen,
+            "bowler": bowler,
+            "overs_timeline": overs,
+            "win_probability": win,
+        })
+    return states
+
+
+def render_squads_page(squads_data):
+    return _page(_squads_panel(squads_data))
+
+
+def build_corpus():
+    """
+    Returns {url_path: html} for the fixture list and every tab of every
+    recorded match.
+    """
+    records = load_recorded_matches()
+    pages = {"/fixtures/match-list": render_fixture_list(records)}
+    for record in records:
+        path = match_path(record)
+        pages[path + "/info"] = render_info_page(
+            record.get("info_data"), record.get("squads_data")
+        )
+        pages[path + "/live"] = render_live_page(record.get("live_data"))
+        pages[path + "/scorecard"] = render_scorecard_page(record.get("scorecard_data"))
+        pages[path + "/squads"] = render_squads_page(record.get("squads_data"))
+    return pages
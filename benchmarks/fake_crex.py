@@ -0,0 +1,214 @@
+"""
+Local stand-in for crex.live used by the offline benchmarks.
+
+FakeCrexServer serves the seed corpus (benchmarks.corpus.build_corpus())
+over HTTP on 127.0.0.1, optionally with a fixed per-request latency, so
+HttpFetcher hits a real socket. ReplayDriver is a minimal webdriver that
+loads those pages over HTTP and answers the calls the scrapers make
+(readiness probe, squads buttons and clicks, the single-pass squads
+script, the live-tab watcher, page_source), so the browser paths can be timed without Chrome.
+The injected scripts themselves are not run: their results are replayed
+from the Python parsers.
+"""
+import threading
+import time
+import urllib.request
+
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from selenium.webdriver.common.by import By
+
+import parsing
+import scrapper
+from benchmarks.corpus import build_corpus
+
+
+# ----------------------------------------------------------------------
+# 1) HTTP SERVER
+# ----------------------------------------------------------------------
+class FakeCrexServer:
+    """
+    Serves {path: html} pages on a free local port.
+
+        with FakeCrexServer() as server:
+            get_match_data(base_url=server.base_url, fetcher=HttpFetcher())
+    """
+
+    def __init__(self, pages=None, latency=0.0, port=0):
+        self.pages = pages if pages is not None else build_corpus()
+        self.latency = latency
+        self.requests = Counter()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                server.requests[path] += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                html = server.pages.get(path)
+                body = (html if html is not None else "Not found").encode("utf-8")
+                self.send_response(200 if html is not None else 404)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="fake-crex", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+# ----------------------------------------------------------------------
+# 2) REPLAY WEBDRIVER
+# ----------------------------------------------------------------------
+class _Element:
+    def __init__(self, driver, tag, index=None):
+        self._driver = driver
+        self._tag = tag
+        self._index = index
+
+    @property
+    def text(self):
+        return self._tag.get_text(strip=True)
+
+    def click(self):
+        self._driver._active_team = self._index
+
+    def get_attribute(self, name):
+        if name == "outerHTML":
+            return self._driver._outer_html(self._tag)
+        return self._tag.get(name)
+
+
+class ReplayDriver:
+    """
+    Answers the webdriver calls made by the scrapers from pages fetched
+    over HTTP. A static page never mutates, so the readiness probe
+    reports it as quiet as soon as it is loaded.
+
+    Clicking a squads button shows only that team's players, like the
+    real tab switch does.
+    """
+
+    def __init__(self, timeout=10):
+        self.timeout = timeout
+        self.current_url = "about:blank"
+        self.page_source = ""
+        self._page = None
+        self._active_team = 0
+        self._watch_changed = None
+
+    def get(self, url):
+        with urllib.request.urlopen(url, timeout=self.timeout) as response:
+            self.page_source = response.read().decode("utf-8")
+        self.current_url = url
+        self._page = parsing.ParsedPage(self.page_source)
+        self._active_team = 0
+        self._watch_changed = None
+
+    def execute_script(self, script, *args):
+        if "__crexMutation" in script:
+            return self._probe(*args)
+        if "__crexWatch" in script:
+            return self._watch(script)
+        if "click()" in script and args:
+            args[0].click()
+        return None
+
+    def execute_async_script(self, script, *args):
+        if "playingxi-button" in script:
+            return self._squads()
+        return None
+
+    def _squads(self):
+        """
+        Stands in for _SQUADS_JS, which cannot run here: the squads the
+        button-by-button path parses from this page. Whether the script
+        itself agrees is tested by tests/test_squads_extractor.py (and in
+        Chrome by check_squads_extractor).
+        """
+        if self._page is None or self._page.first("info-right-wrapper") is None:
+            return None
+        return scrapper._squads_by_clicking(self)
+
+    def _watch(self, script):
+        """LiveWatcher's observer: a loaded page changes once, when loaded."""
+        if "new MutationObserver" in script:
+            self._watch_changed = True
+            return None
+        if self._watch_changed is None:
+            return None
+        changed, self._watch_changed = self._watch_changed, False
+        if not changed:
+            return {"changed": False}
+        return {"changed": True, "live": scrapper.parse_live_data(self.page_source)}
+
+    def _probe(self, ready=(), no_data=(), no_data_text=()):
+        soup = self._page.soup if self._page else None
+        text = soup.get_text() if soup else ""
+        return {
+            "ready": bool(soup) and any(soup.select_one(sel) for sel in ready),
+            "noData": bool(soup) and (
+                any(soup.select_one(sel) for sel in no_data)
+                or any(t in text for t in no_data_text)
+            ),
+            "quietMs": 10 ** 6,
+            "state": "complete",
+        }
+
+    def find_elements(self, by, value):
+        if by != By.CLASS_NAME or self._page is None:
+            return []
+        return [
+            _Element(self, tag, index)
+            for index, tag in enumerate(self._page.all(value))
+        ]
+
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise LookupError(f"No element with class {value!r}")
+        return elements[0]
+
+    def _outer_html(self, tag):
+        if "info-right-wrapper" not in (tag.get("class") or []):
+            return str(tag)
+        # Keep only the squad of the team whose button was clicked last
+        wrapper = parsing.make_soup(str(tag))
+        for index, block in enumerate(wrapper.find_all("div", class_="team-squad")):
+            if index != self._active_team:
+                block.decompose()
+        return str(wrapper)
+
+    def quit(self):
+        self._page = None
@@ -0,0 +1,129 @@
+import json
+import os
+import time
+
+from datetime import datetime
+
+TRACKER_CHECKPOINT = "tracker_state.json"
+# Seconds between checkpoints written by the real-time loop
+CHECKPOINT_INTERVAL = 15
+# Checkpoints older than this are ignored: a cold start is cheaper than
+# resuming matches that have long finished
+RESUME_MAX_AGE = 6 * 60 * 60
+
+_VERSION = 2
+
+
+def _encode_tracked(tracked_matches):
+    encoded = {}
+    for link, state in tracked_matches.items():
+        state = dict(state)
+        if isinstance(state.get("last_scraped"), datetime):
+            state["last_scraped"] = state["last_scraped"].isoformat()
+        encoded[link] = state
+    return encoded
+
+
+def _decode_tracked(tracked):
+    for state in tracked.values():
+        if state.get("last_scraped"):
+            state["last_scraped"] = datetime.fromisoformat(state["last_scraped"])
+    return tracked
+
+
+# ----------------------------------------------------------------------
+# ON-DISK CHECKPOINT OF THE REAL-TIME TRACKER
+# ----------------------------------------------------------------------
+class TrackerCheckpoint:
+    """
+    Periodic snapshot of what real_time_scraping_loop() keeps in memory,
+    in one JSON file at `path`, so a restart resumes where it stopped:
+
+      tracked       tracked_matches by match ID (link, match dict, last_scraped, poll state)
+      detector      last snapshot and hashes per match (ChangeDetector)
+      scheduler     next-due time and unchanged streak per match (PollScheduler)
+      bootstrapped  fixture links whose initial scrape is done
+
+    run_scraper() skips the initial scrape of bootstrapped matches and the
+    loop restores the rest before its first poll ("warm resume").
+    """
+
+    def __init__(self, path=TRACKER_CHECKPOINT, interval=CHECKPOINT_INTERVAL,
+                 max_age=RESUME_MAX_AGE):
+        self.path = path
+        self.interval = interval
+        self.max_age = max_age
+
+        self.bootstrapped = set()
+        self._state = None
+        self._saved_at = None  # monotonic time of the last save
+
+    def load(self):
+        """Reads the checkpoint; returns it, or None if missing or too old."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get("version") != _VERSION or time.time() - state["saved_at"] > self.max_age:
+            return None
+        self._state = state
+        self.bootstrapped = set(state.get("bootstrapped", ()))
+        return state
+
+    def known_matches(self):
+        """Fixture links that need no initial scrape."""
+        if self._state is None:
+            self.load()
+        known = set(self.bootstrapped)
+        if self._state is not None:
+            known.update(
+                s["match_dict"]["link"] for s in self._state["tracked"].values()
+            )
+        return known
+
+    def mark_bootstrapped(self, links):
+        """Records finished initial scrapes (and forgets the others)."""
+        self.bootstrapped = set(links)
+        state = self._state or {
+            "version": _VERSION, "tracked": {}, "detector": {}, "scheduler": {},
+        }
+        state["bootstrapped"] = sorted(self.bootstrapped)
+        state["saved_at"] = time.time()
+        self._write(state)
+        self._state = state
+
+    def restore(self, tracked_matches, detector, scheduler):
+        """Fills the loop's state from the checkpoint; returns how many matches."""
+        if self._state is None and self.load() is None:
+            return 0
+        state = self._state
+        tracked = _decode_tracked(state["tracked"])
+        tracked_matches.update(tracked)
+        detector.restore({l: s for l, s in state["detector"].items() if l in tracked})
+        scheduler.restore({l: e for l, e in state["scheduler"].items() if l in tracked})
+        for link in tracked:
+            scheduler.add(link)
+        return len(tracked)
+
+    def due(self):
+        return self._saved_at is None or time.monotonic() - self._saved_at >= self.interval
+
+    def save(self, tracked_matches, detector, scheduler):
+        state = {
+            "version": _VERSION,
+            "saved_at": time.time(),
+            "bootstrapped": sorted(self.bootstrapped),
+            "tracked": _encode_tracked(tracked_matches),
+            "detector": detector.export(),
+            "scheduler": scheduler.export(),
+        }
+        self._write(state)
+        self._state = state
+
+    def _write(self, state):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, default=str)
+        os.replace(tmp, self.path)
+        self._saved_at = time.monotonic()
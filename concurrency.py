@@ -0,0 +1,125 @@
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class DeadlineExceeded(Exception):
+    """Raised (as a result value) for a job that ran past its deadline."""
+
+
+# ----------------------------------------------------------------------
+# BOUNDED, DEADLINE-AWARE RUNNER FOR BLOCKING SELENIUM JOBS
+# ----------------------------------------------------------------------
+class ConcurrentRunner:
+    """
+    Runs blocking scrape jobs on a fixed-size thread pool, so the time per
+    cycle follows the slowest job instead of the sum of all of them.
+
+    Each job is a callable taking a `threading.Event`. The event is set
+    once the job's deadline passes (or the runner is cancelled); jobs
+    should check it between page loads and bail out early. Selenium calls
+    that are already in flight cannot be interrupted, so a hung job keeps
+    its worker until the call returns - its result is simply dropped.
+    """
+
+    def __init__(self, max_workers=4, job_deadline=None):
+        self.max_workers = max_workers
+        self.job_deadline = job_deadline
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="scrape-worker"
+        )
+
+    def run(self, jobs, deadline=None, on_result=None):
+        """
+        Args:
+          jobs (dict): key -> callable(cancel_event)
+          deadline (float): optional overall budget in seconds for this call
+          on_result (callable): optional on_result(key, result, error), called
+            from the calling thread as soon as each job finishes or times out
+
+        Returns:
+          dict key -> (result, error). `error` is None on success, the
+          raised exception on failure, or DeadlineExceeded on timeout.
+        """
+        started_at = {}
+        cancel_events = {}
+        futures = {}
+
+        for key, fn in jobs.items():
+            cancel_event = threading.Event()
+            cancel_events[key] = cancel_event
+            futures[self._executor.submit(self._call, fn, cancel_event, started_at, key)] = key
+
+        results = {}
+        pending = set(futures)
+        overall_end = time.monotonic() + deadline if deadline is not None else None
+
+        while pending:
+            now = time.monotonic()
+
+            # Time out jobs whose own deadline (measured from start) passed
+            for fut in list(pending):
+                key = futures[fut]
+                start = started_at.get(key)
+                over_job = (
+                    self.job_deadline is not None
+                    and start is not None
+                    and now - start > self.job_deadline
+                )
+                over_all = overall_end is not None and now > overall_end
+                if over_job or over_all:
+                    cancel_events[key].set()
+                    fut.cancel()
+                    pending.discard(fut)
+                    results[key] = (None, DeadlineExceeded(key))
+                    if on_result is not None:
+                        on_result(key, None, results[key][1])
+
+            if not pending:
+                break
+
+            done, pending = wait(pending, timeout=self._next_timeout(
+                pending, futures, started_at, overall_end
+            ), return_when=FIRST_COMPLETED)
+
+            for fut in done:
+                key = futures[fut]
+                try:
+                    results[key] = (fut.result(), None)
+                except Exception as exc:
+                    results[key] = (None, exc)
+                if on_result is not None:
+                    on_result(key, *results[key])
+
+        return results
+
+    def _next_timeout(self, pending, futures, started_at, overall_end):
+        """
+        Seconds until the earliest deadline among the pending jobs, so the
+        wait() above wakes up in time to cancel it.
+        """
+        now = time.monotonic()
+        candidates = []
+        if overall_end is not None:
+            candidates.append(overall_end - now)
+        if self.job_deadline is not None:
+            for fut in pending:
+                start = started_at.get(futures[fut])
+                if start is None:
+                    # Still queued; re-check shortly once it has started
+                    candidates.append(0.5)
+                else:
+                    candidates.append(start + self.job_deadline - now)
+        if not candidates:
+            return None
+        return max(0.0, min(candidates))
+
+    @staticmethod
+    def _call(fn, cancel_event, started_at, key):
+        started_at[key] = time.monotonic()
+        if cancel_event.is_set():
+            raise DeadlineExceeded(key)
+        return fn(cancel_event)
+
+    def shutdown(self, wait_for_jobs=False):
+        self._executor.shutdown(wait=wait_for_jobs, cancel_futures=True)
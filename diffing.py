@@ -0,0 +1,231 @@
+import hashlib
+import json
+
+from storage import match_id_from_url
+
+
+def fingerprint(data):
+    """
+    Stable hash of a parsed structure (dict keys sorted), used to tell
+    whether anything changed since the previous poll.
+    """
+    encoded = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+def _as_dict(data):
+    return data if isinstance(data, dict) else {}
+
+
+def _current_over(live_data):
+    """The most recent over in the timeline, or None."""
+    overs = _as_dict(live_data).get("overs_timeline") or []
+    return overs[-1] if overs else None
+
+
+# ----------------------------------------------------------------------
+# 1) DELTA EVENTS BETWEEN TWO SNAPSHOTS
+# ----------------------------------------------------------------------
+def diff_snapshots(prev_live, cur_live, prev_scorecard, cur_scorecard):
+    """
+    Compares two (live_data, scorecard_data) snapshots of one match and
+    returns a list of compact events:
+      - {"type": "new_ball", "over": ..., "ball": ...}
+      - {"type": "wicket", "batsman": ..., "score": ..., "overs": ...}
+      - {"type": "bowler_change", "from": ..., "to": ...}
+      - {"type": "innings_change", "innings": n}
+    """
+    events = []
+    prev_live, cur_live = _as_dict(prev_live), _as_dict(cur_live)
+    prev_scorecard, cur_scorecard = _as_dict(prev_scorecard), _as_dict(cur_scorecard)
+
+    # New balls in the current over (or the whole over if it just started)
+    prev_over = _current_over(prev_live)
+    cur_over = _current_over(cur_live)
+    if cur_over:
+        prev_balls = prev_over.get("balls", []) if prev_over else []
+        cur_balls = cur_over.get("balls", [])
+        if cur_balls == prev_balls:
+            new_balls = []
+        elif cur_balls[: len(prev_balls)] == prev_balls:
+            # Same over, more balls bowled
+            new_balls = cur_balls[len(prev_balls):]
+        else:
+            # A new over started
+            new_balls = cur_balls
+        for ball in new_balls:
+            events.append(
+                {"type": "new_ball", "over": cur_over.get("over_title"), "ball": ball}
+            )
+
+    # Wickets: prefer the scorecard's fall of wickets, else batsmen leaving
+    prev_fow = prev_scorecard.get("fall_of_wickets") or []
+    cur_fow = cur_scorecard.get("fall_of_wickets") or []
+    if cur_fow or prev_fow:
+        for wicket in cur_fow[len(prev_fow):]:
+            events.append({"type": "wicket", **wicket})
+    else:
+        prev_names = {b.get("name") for b in prev_live.get("batsmen", [])}
+        cur_names = {b.get("name") for b in cur_live.get("batsmen", [])}
+        if prev_names and cur_names:
+            for name in sorted(prev_names - cur_names):
+                events.append({"type": "wicket", "batsman": name})
+
+    # Bowler change
+    prev_bowler = _as_dict(prev_live.get("bowler")).get("name")
+    cur_bowler = _as_dict(cur_live.get("bowler")).get("name")
+    if prev_bowler and cur_bowler and prev_bowler != cur_bowler:
+        events.append({"type": "bowler_change", "from": prev_bowler, "to": cur_bowler})
+
+    # Innings change: a new batting table appeared on the scorecard
+    prev_innings = len(prev_scorecard.get("batting") or [])
+    cur_innings = len(cur_scorecard.get("batting") or [])
+    if prev_innings and cur_innings > prev_innings:
+        events.append({"type": "innings_change", "innings": cur_innings})
+
+    return events
+
+
+# ----------------------------------------------------------------------
+# 2) PER-MATCH CHANGE DETECTOR FOR THE LIVE LOOP
+# ----------------------------------------------------------------------
+class ChangeDetector:
+    """
+    Remembers the last snapshot of every tracked match and reports, for a
+    new one, whether anything changed and which delta events happened.
+    """
+
+    def __init__(self):
+        self._last = {}  # link -> {"live", "scorecard", "live_hash", "scorecard_hash"}
+
+    def detect(self, link, live_data, scorecard_data):
+        """
+        Returns a dict:
+          changed (bool):           anything differs from the last poll
+          first (bool):             first snapshot seen for this match
+          live_changed (bool)
+          scorecard_changed (bool)
+          events (list):            delta events (empty on the first poll)
+          fingerprint (str):        hash of the whole snapshot
+
+        A tab passed as None was not scraped this time (failed poll): it
+        counts as unchanged and the last good copy is kept, so the next
+        good poll is diffed against that copy and not against nothing.
+        """
+        prev = self._last.get(link)
+        live_ok, scorecard_ok = live_data is not None, scorecard_data is not None
+        if prev is not None:
+            if not live_ok:
+                live_data = prev["live"]
+            if not scorecard_ok:
+                scorecard_data = prev["scorecard"]
+        live_hash = fingerprint(live_data)
+        scorecard_hash = fingerprint(scorecard_data)
+
+        result = {
+            "first": prev is None,
+            "live_changed": live_ok and (prev is None or prev["live_hash"] != live_hash),
+            "scorecard_changed": scorecard_ok and (
+                prev is None or prev["scorecard_hash"] != scorecard_hash
+            ),
+            "events": [],
+            "fingerprint": fingerprint([live_hash, scorecard_hash]),
+        }
+        result["changed"] = result["live_changed"] or result["scorecard_changed"]
+
+        if prev is not None and result["changed"]:
+            result["events"] = diff_snapshots(
+                prev["live"], live_data, prev["scorecard"], scorecard_data
+            )
+
+        self._last[link] = {
+            "live": live_data,
+            "scorecard": scorecard_data,
+            "live_hash": live_hash,
+            "scorecard_hash": scorecard_hash,
+        }
+        return result
+
+    def latest(self, link):
+        """(live_data, scorecard_data) of the last snapshot, or (None, None)."""
+        prev = self._last.get(link)
+        return (prev["live"], prev["scorecard"]) if prev is not None else (None, None)
+
+    def forget(self, link):
+        self._last.pop(link, None)
+
+    def export(self):
+        """Last snapshot of every match, for TrackerCheckpoint."""
+        return dict(self._last)
+
+    def restore(self, state):
+        self._last.update(state)
+
+
+# ----------------------------------------------------------------------
+# 3) LINK-KEYED INDEX OF THE FIXTURE LIST
+# ----------------------------------------------------------------------
+FIXTURE_CATEGORIES = ("live", "upcoming", "concluded")
+
+
+class FixtureIndex:
+    """
+    Remembers every fixture card from the last refresh, keyed by match
+    ID (a match's card links to /live while it is live and to /scorecard
+    once it is over), with its category and a fingerprint of the card.
+    update() returns only what changed since then, so the loop's work per
+    refresh is proportional to the changes, not to the length of the list.
+    """
+
+    def __init__(self):
+        self._cards = {}  # match_id -> (category, fingerprint)
+
+    def __len__(self):
+        return len(self._cards)
+
+    def __contains__(self, match_id):
+        return match_id in self._cards
+
+    def update(self, live, upcoming, concluded):
+        """
+        Returns a dict:
+          live / upcoming / concluded (list): match dicts that are new in
+            that category (added, or moved from another one) or whose
+            card changed (scores, overs, start time)
+          removed (list): match IDs no longer on the list
+          unchanged (int): cards identical to the last refresh
+
+        A match listed more than once keeps its first card (live cards
+        come first).
+        """
+        changes = {category: [] for category in FIXTURE_CATEGORIES}
+        changes["unchanged"] = 0
+        cards = {}
+        for category, matches in zip(FIXTURE_CATEGORIES, (live, upcoming, concluded)):
+            for m in matches:
+                if not m.get("link"):
+                    continue
+                match_id = match_id_from_url(m["link"])
+                if match_id in cards:
+                    continue
+                card = cards[match_id] = (category, fingerprint(m))
+                if self._cards.get(match_id) == card:
+                    changes["unchanged"] += 1
+                else:
+                    changes[category].append(m)
+        changes["removed"] = [m for m in self._cards if m not in cards]
+        self._cards = cards
+        return changes
+
+    def seed(self, match_ids, category="live"):
+        """
+        Registers matches known from elsewhere (a warm resume) without a
+        card: the next update() reports them as changed if they are
+        listed, and as removed if they are not.
+        """
+        for match_id in match_ids:
+            self._cards.setdefault(match_id, (category, None))
+
+    def forget(self, match_id):
+        """The match is reported again by the next update()."""
+        self._cards.pop(match_id, None)
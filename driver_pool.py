@@ -0,0 +1,356 @@
+import os
+import queue
+import threading
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
+
+from metrics import METRICS
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+WEBDRIVER_PATH = "chromedriver.exe"
+
+# Lean profile: the parsers only read the DOM, so images, media, fonts and
+# third-party ad/analytics requests are blocked, the page counts as loaded
+# once the DOM is parsed (readiness.wait_for_ready() then waits for the
+# content), and Chrome's own background traffic is turned off.
+LEAN_BROWSER = True
+# DevTools URL patterns: "*" is the only wildcard and must cover the
+# whole URL (hence the trailing "*" for query strings)
+BLOCKED_URL_PATTERNS = (
+    # images and team logos
+    "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*",
+    # fonts
+    "*.woff*", "*.ttf*", "*.otf*", "*.eot*",
+    # media
+    "*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*",
+    # ads, analytics and social widgets
+    "*doubleclick.net*", "*googlesyndication.com*", "*googleadservices.com*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*googletagservices.com*",
+    "*adservice.google.*", "*facebook.net*", "*connect.facebook.*",
+    "*scorecardresearch.com*", "*amazon-adsystem.com*", "*taboola.com*",
+    "*outbrain.com*", "*hotjar.com*", "*clarity.ms*", "*onesignal.com*",
+)
+LEAN_ARGUMENTS = (
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-notifications",
+    "--no-first-run",
+    "--mute-audio",
+    "--blink-settings=imagesEnabled=false",
+)
+
+
+# ----------------------------------------------------------------------
+# 1) DRIVER FACTORY
+# ----------------------------------------------------------------------
+def create_driver(webdriver_path=WEBDRIVER_PATH, lean=None, page_load_strategy=None):
+    """
+    Launches one headless Chrome session. Every scraper gets its browser
+    from here (through DriverPool/TabPool or checkout_driver()). With
+    `lean` (default LEAN_BROWSER) the lean profile above is applied.
+    `page_load_strategy` overrides the profile's ("eager" when lean).
+    """
+    lean = LEAN_BROWSER if lean is None else lean
+    service = Service(webdriver_path)
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    if lean:
+        options.page_load_strategy = "eager"
+        for argument in LEAN_ARGUMENTS:
+            options.add_argument(argument)
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+    if page_load_strategy is not None:
+        options.page_load_strategy = page_load_strategy
+
+    driver = webdriver.Chrome(service=service, options=options)
+    if lean:
+        block_requests(driver)
+    return driver
+
+
+def block_requests(driver, patterns=BLOCKED_URL_PATTERNS):
+    """
+    Blocks requests matching `patterns` in the driver's current tab
+    (DevTools Network.setBlockedURLs is per tab, so TabPool calls this for
+    every tab it opens). Drivers without DevTools access are left alone.
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+    except (AttributeError, WebDriverException):
+        pass
+
+
+def is_driver_healthy(driver):
+    """
+    Cheap liveness probe: asking for the current URL is a round trip to
+    the browser, so it fails fast if Chrome or chromedriver has died.
+    """
+    try:
+        driver.current_url
+        return True
+    except WebDriverException:
+        return False
+
+
+# ----------------------------------------------------------------------
+# 2) POOL OF WARM, REUSABLE SESSIONS
+# ----------------------------------------------------------------------
+class DriverPool:
+    """
+    Keeps up to `size` headless Chrome sessions alive and hands them out
+    to scrapers. A session is recycled (quit and relaunched lazily) when:
+      - it has served `max_pages` checkouts
+      - it fails the health check on checkout
+      - the borrower returns it with `broken=True` (crash mid-scrape)
+    """
+
+    def __init__(self, size=2, max_pages=50, checkout_timeout=120,
+                 driver_factory=create_driver):
+        self.size = size
+        self.max_pages = max_pages
+        self.checkout_timeout = checkout_timeout
+        self.driver_factory = driver_factory
+
+        self._idle = queue.LifoQueue()
+        self._pages = {}  # id(driver) -> pages served
+        self._drivers = {}  # id(driver) -> running session
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def warm_up(self, count=None):
+        """
+        Starts `count` sessions up front (defaults to the full pool size)
+        so the first scrape does not pay the browser startup cost.
+        """
+        count = self.size if count is None else min(count, self.size)
+        while True:
+            with self._lock:
+                if self._created >= count:
+                    break
+                self._created += 1
+            try:
+                driver = self._launch()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+            self._idle.put(driver)
+
+    def checkout(self):
+        """
+        Returns a healthy driver, launching a new one if the pool has
+        spare capacity, otherwise blocking until one is released.
+        """
+        if self._closed:
+            raise RuntimeError("DriverPool is closed")
+
+        deadline = time.monotonic() + self.checkout_timeout
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = None
+
+            if driver is None:
+                launch = False
+                with self._lock:
+                    if self._created < self.size:
+                        self._created += 1
+                        launch = True
+                if launch:
+                    try:
+                        driver = self._launch()
+                    except Exception:
+                        with self._lock:
+                            self._created -= 1
+                        raise
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("No WebDriver session became available")
+                    try:
+                        driver = self._idle.get(timeout=remaining)
+                    except queue.Empty:
+                        raise TimeoutError("No WebDriver session became available")
+
+            if is_driver_healthy(driver):
+                self._pages[id(driver)] = self._pages.get(id(driver), 0) + 1
+                return driver
+
+            # Dead session => drop it and try again
+            self._discard(driver)
+
+    def release(self, driver, broken=False):
+        """
+        Gives a driver back to the pool. Crashed or worn-out sessions are
+        quit so the next checkout launches a fresh one.
+        """
+        pages = self._pages.get(id(driver), 0)
+        if self._closed or broken or pages >= self.max_pages:
+            self._discard(driver)
+            return
+
+        self._idle.put(driver)
+
+    def _launch(self):
+        with METRICS.timer("driver_startup"):
+            driver = self.driver_factory()
+        self._pages[id(driver)] = 0
+        with self._lock:
+            self._drivers[id(driver)] = driver
+        return driver
+
+    def _discard(self, driver):
+        self._pages.pop(id(driver), None)
+        with self._lock:
+            self._drivers.pop(id(driver), None)
+        with self._lock:
+            self._created -= 1
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def memory_bytes(self):
+        """
+        Memory of every running Chrome session (see browser_memory()), or
+        None if it cannot be measured on this platform.
+        """
+        with self._lock:
+            drivers = list(self._drivers.values())
+        return sum_memory(browser_memory(driver) for driver in drivers)
+
+    def close(self):
+        """
+        Quits every idle session. Sessions still checked out are quit when
+        they are released.
+        """
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+
+# ----------------------------------------------------------------------
+# 3) MEMORY OF THE BROWSER PROCESSES
+# ----------------------------------------------------------------------
+def process_tree_memory(pid):
+    """
+    Memory of a process and all of its descendants in bytes: proportional
+    set size (shared pages split between the processes sharing them) where
+    the platform reports it, resident set size otherwise. Uses psutil if
+    installed, else /proc (Linux). Returns None if neither is available.
+    """
+    if psutil is not None:
+        try:
+            root = psutil.Process(pid)
+            total = 0
+            for proc in [root] + root.children(recursive=True):
+                try:
+                    info = proc.memory_full_info()
+                except (psutil.AccessDenied, AttributeError):
+                    info = proc.memory_info()
+                total += getattr(info, "pss", info.rss)
+            return total
+        except psutil.Error:
+            return None
+
+    if not os.path.isdir("/proc"):
+        return None
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    total = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        stack.extend(children.get(current, ()))
+        total += _proc_memory(current)
+    return total
+
+
+def _proc_memory(pid):
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def browser_memory(driver):
+    """
+    Memory of one WebDriver session: chromedriver plus the Chrome
+    processes it started. None if it cannot be measured.
+    """
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    if process is None:
+        return None
+    return process_tree_memory(process.pid)
+
+
+def sum_memory(values):
+    """Sum of the measurable values, or None if none was measurable."""
+    values = [v for v in values if v is not None]
+    return sum(values) if values else None
+
+
+# ----------------------------------------------------------------------
+# 4) HELPERS USED BY THE SCRAPERS
+# ----------------------------------------------------------------------
+def checkout_driver(pool=None):
+    """
+    Borrows a driver from `pool`, or launches a one-off session when the
+    caller did not pass a pool (the original behaviour).
+    """
+    if pool is None:
+        with METRICS.timer("driver_startup"):
+            return create_driver()
+    return pool.checkout()
+
+
+def release_driver(pool, driver, broken=False):
+    """
+    Counterpart of checkout_driver(): returns the session to the pool, or
+    quits it if it was a one-off.
+    """
+    if pool is None:
+        driver.quit()
+    else:
+        pool.release(driver, broken=broken)
@@ -0,0 +1,86 @@
+import re
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+
+def has_classes(html, class_names):
+    """
+    Cheap check (no parsing) that every class in `class_names` appears in
+    some class="..." attribute of `html`.
+    """
+    for class_name in class_names:
+        pattern = r"""class=["'][^"']*(?<![\w-])%s(?![\w-])""" % re.escape(class_name)
+        if not re.search(pattern, html):
+            return False
+    return True
+
+
+# ----------------------------------------------------------------------
+# PLAIN HTTP BACKEND (keep-alive, gzip, pooled connections)
+# ----------------------------------------------------------------------
+class HttpFetcher:
+    """
+    Fetches pages with a pooled requests.Session instead of a browser.
+
+    fetch() only returns the HTML when every required class is present in
+    the raw response; otherwise it returns None and the caller falls back
+    to Selenium (e.g. the content is rendered client-side).
+    """
+
+    def __init__(self, pool_size=10, timeout=10, retries=2, headers=None):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=retries, backoff_factor=0.3, status_forcelist=(502, 503, 504)
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # How often the HTTP path was enough vs. needed the browser
+        self.hits = 0
+        self.fallbacks = 0
+
+    def fetch(self, url, required_classes=()):
+        """
+        Returns the page HTML, or None if the request failed or the needed
+        selectors are missing from the static HTML.
+        """
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException:
+            self.fallbacks += 1
+            return None
+
+        if response.status_code != 200:
+            self.fallbacks += 1
+            return None
+
+        html = response.text
+        if required_classes and not has_classes(html, required_classes):
+            self.fallbacks += 1
+            return None
+
+        self.hits += 1
+        return html
+
+    def close(self):
+        self.session.close()
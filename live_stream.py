@@ -0,0 +1,217 @@
+import json
+import threading
+import time
+
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+STREAM_PORT = 9109
+# A comment line is sent this often (s) on idle streams, so proxies and
+# clients can tell a quiet match from a dead connection
+KEEPALIVE = 15
+# Events kept per match while a slow client has not caught up
+MAX_COALESCED_EVENTS = 60
+MAX_SUBSCRIBERS = 5000
+
+
+# ----------------------------------------------------------------------
+# 1) PER-MATCH TOPICS WITH COALESCING SUBSCRIBERS
+# ----------------------------------------------------------------------
+class Subscription:
+    """
+    One reader's pending updates: at most one message per match. An
+    update for a match that is still pending replaces it (latest state
+    wins) and appends its events, so a slow reader falls behind by
+    matches, never by a growing queue.
+    """
+
+    def __init__(self, topics):
+        self.topics = topics  # None = every match
+        self._pending = OrderedDict()  # match_id -> message
+        self._cond = threading.Condition()
+        self.closed = False
+
+    def push(self, message):
+        with self._cond:
+            previous = self._pending.pop(message["match_id"], None)
+            if previous is not None:
+                events = (previous["events"] + message["events"])[-MAX_COALESCED_EVENTS:]
+                message = dict(
+                    message, events=events, coalesced=previous.get("coalesced", 0) + 1
+                )
+            self._pending[message["match_id"]] = message
+            self._cond.notify()
+
+    def wait(self, timeout=None):
+        """Pending messages, oldest match first; [] after `timeout`."""
+        with self._cond:
+            if not self._pending and not self.closed:
+                self._cond.wait(timeout)
+            messages = list(self._pending.values())
+            self._pending.clear()
+            return messages
+
+    def close(self):
+        with self._cond:
+            self.closed = True
+            self._cond.notify()
+
+
+class LiveBroker:
+    """
+    Fans live updates from the scraping loop out to any number of
+    subscribers. Each match is a topic (its match ID); the latest state of
+    every live match is kept so a new subscriber starts from a snapshot.
+    publish() never blocks on readers.
+    """
+
+    def __init__(self, max_subscribers=MAX_SUBSCRIBERS):
+        self.max_subscribers = max_subscribers
+        self._snapshots = {}  # match_id -> last message
+        self._topics = {}  # match_id -> set of Subscriptions
+        self._everything = set()  # Subscriptions to all matches
+        self._subscriptions = set()
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def subscribe(self, match_ids=None):
+        """
+        Returns (subscription, snapshots), or None when full. `match_ids`
+        None subscribes to every match.
+        """
+        topics = set(match_ids) if match_ids else None
+        subscription = Subscription(topics)
+        with self._lock:
+            if len(self._subscriptions) >= self.max_subscribers:
+                return None
+            self._subscriptions.add(subscription)
+            if topics is None:
+                self._everything.add(subscription)
+                snapshots = list(self._snapshots.values())
+            else:
+                for match_id in topics:
+                    self._topics.setdefault(match_id, set()).add(subscription)
+                snapshots = [self._snapshots[m] for m in topics if m in self._snapshots]
+        return subscription, snapshots
+
+    def unsubscribe(self, subscription):
+        subscription.close()
+        with self._lock:
+            self._subscriptions.discard(subscription)
+            self._everything.discard(subscription)
+            for match_id in subscription.topics or ():
+                subscribers = self._topics.get(match_id)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._topics[match_id]
+
+    def subscriber_count(self):
+        return len(self._subscriptions)
+
+    def publish(self, match_id, state, events=()):
+        """Sends the match's new state (and delta events) to its subscribers."""
+        with self._lock:
+            self._seq += 1
+            message = dict(
+                state, match_id=match_id, seq=self._seq, events=list(events),
+                published_at=time.time(),
+            )
+            if message.get("status") == "Concluded":
+                self._snapshots.pop(match_id, None)
+            else:
+                self._snapshots[match_id] = dict(message, events=[])
+            subscribers = self._everything | self._topics.get(match_id, set())
+        for subscription in subscribers:
+            subscription.push(message)
+        return message
+
+    def conclude(self, match_id):
+        """Final message for a match; it no longer gets a snapshot."""
+        return self.publish(match_id, {"status": "Concluded"})
+
+    def close(self):
+        with self._lock:
+            subscribers = list(self._subscriptions)
+        for subscription in subscribers:
+            subscription.close()
+
+
+# ----------------------------------------------------------------------
+# 2) SERVER-SENT EVENTS ENDPOINT
+# ----------------------------------------------------------------------
+def format_event(kind, message):
+    data = json.dumps(message, ensure_ascii=False, default=str)
+    return f"id: {message['seq']}\nevent: {kind}\ndata: {data}\n\n".encode("utf-8")
+
+
+class StreamServer:
+    """
+    Serves `broker` as Server-Sent Events:
+
+      GET /stream                       every live match
+      GET /stream?match=<id>&match=...  only these matches
+
+    A stream opens with one "snapshot" event per match that has a state,
+    then carries one "update" event per (possibly coalesced) change.
+    """
+
+    def __init__(self, broker, host="127.0.0.1", port=STREAM_PORT, keepalive=KEEPALIVE):
+        self.broker = broker
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlsplit(self.path)
+                if url.path != "/stream":
+                    self.send_error(404)
+                    return
+                subscribed = broker.subscribe(parse_qs(url.query).get("match"))
+                if subscribed is None:
+                    self.send_error(503, "Too many subscribers")
+                    return
+                subscription, snapshots = subscribed
+                try:
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/event-stream")
+                    self.send_header("Cache-Control", "no-cache")
+                    self.send_header("Access-Control-Allow-Origin", "*")
+                    self.end_headers()
+                    for message in snapshots:
+                        self.wfile.write(format_event("snapshot", message))
+                    self.wfile.flush()
+                    while not subscription.closed:
+                        messages = subscription.wait(keepalive)
+                        if not messages:
+                            self.wfile.write(b": keepalive\n\n")
+                        for message in messages:
+                            self.wfile.write(format_event("update", message))
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    broker.unsubscribe(subscription)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/stream"
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="live-stream", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.broker.close()
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -0,0 +1,146 @@
+import threading
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from metrics import METRICS
+from readiness import READY, wait_for_ready
+
+# Containers whose mutations mean the live data changed
+WATCHED_SELECTORS = (
+    ".playing-batsmen-wrapper",
+    ".overs-timeline",
+    ".progressBarContainer",
+)
+# Watched tabs are reloaded this often (s) in case the page's own
+# updates stalled (dropped socket, sleeping tab)
+WATCH_RELOAD = 10 * 60
+# Poll interval (s) for watched matches: one cheap script call per tick
+WATCH_TICK = 2
+
+# Installs one MutationObserver on the document (the watched containers
+# may be re-rendered wholesale) that counts mutations inside them.
+_INSTALL_JS = """
+const selectors = arguments[0];
+const watch = window.__crexWatch = {version: 1, drained: 0};
+const inside = function (node) {
+  const el = node.nodeType === 1 ? node : node.parentElement;
+  return !!el && selectors.some(function (sel) {
+    return el.closest(sel) || (el.querySelector && el.querySelector(sel));
+  });
+};
+new MutationObserver(function (mutations) {
+  if (mutations.some(function (m) { return inside(m.target); })) watch.version++;
+}).observe(document.body, {
+  childList: true, subtree: true, characterData: true, attributes: true
+});
+"""
+
+# Drains the change counter; runs the extractor only if something changed.
+# `null` means the observer is gone (page reloaded or navigated away).
+_DRAIN_JS = """
+const watch = window.__crexWatch;
+if (!watch) return null;
+if (watch.version === watch.drained) return {changed: false};
+watch.drained = watch.version;
+return {changed: true, live: (function () { %s })()};
+"""
+
+
+# ----------------------------------------------------------------------
+# LONG-LIVED LIVE TABS, READ ONLY WHEN THEIR DOM CHANGED
+# ----------------------------------------------------------------------
+class LiveWatcher:
+    """
+    Keeps one browser session open on the /live page of each watched
+    match and lets the page update itself in place. A MutationObserver
+    counts changes to the batsmen, overs timeline and win probability
+    containers; poll() drains that counter in one script call and only
+    runs `extract_js` (which must return the live dict) when it moved.
+
+    At most `max_watched` matches hold a session from `pool` at a time;
+    poll() returns the NOT_WATCHED sentinel for the rest so the caller
+    can fall back to reloading the page. Watched matches are meant to be
+    polled every `tick` seconds; a poll that finds nothing costs one
+    script call.
+    """
+
+    NOT_WATCHED = object()
+
+    def __init__(self, pool, extract_js, max_watched=2, reload_after=WATCH_RELOAD,
+                 tick=WATCH_TICK, selectors=WATCHED_SELECTORS):
+        self.pool = pool
+        self.max_watched = max_watched
+        self.reload_after = reload_after
+        self.tick = tick
+        self.selectors = list(selectors)
+        self._drain_js = _DRAIN_JS % extract_js
+
+        self._sessions = {}  # link -> {"driver", "url", "loaded_at"}
+        self._lock = threading.Lock()
+
+    def __contains__(self, link):
+        return link in self._sessions
+
+    def _open(self, link, url):
+        with self._lock:
+            if link in self._sessions or len(self._sessions) >= self.max_watched:
+                return self._sessions.get(link)
+            session = self._sessions[link] = {"driver": None, "url": url, "loaded_at": None}
+        try:
+            session["driver"] = self.pool.checkout()
+        except Exception:
+            with self._lock:
+                self._sessions.pop(link, None)
+            raise
+        return session
+
+    def _load(self, session):
+        driver = session["driver"]
+        with METRICS.timer("navigate", tab="live"):
+            driver.get(session["url"])
+        outcome, _ = wait_for_ready(driver, "live")
+        driver.execute_script(_INSTALL_JS, self.selectors)
+        session["loaded_at"] = time.monotonic()
+        return outcome
+
+    def poll(self, link, url):
+        """
+        Returns the live dict if the page changed since the last poll (or
+        was just (re)loaded), None if nothing changed, or NOT_WATCHED if
+        no session is free for this match.
+        """
+        session = self._open(link, url)
+        if session is None:
+            return self.NOT_WATCHED
+
+        try:
+            for _ in range(2):
+                loaded_at = session["loaded_at"]
+                if loaded_at is None or time.monotonic() - loaded_at >= self.reload_after:
+                    if self._load(session) != READY:
+                        return {"live_data": "N/A"}
+                with METRICS.timer("watch_drain", tab="live"):
+                    drained = session["driver"].execute_script(self._drain_js)
+                if drained is not None:
+                    return drained["live"] if drained["changed"] else None
+                # Observer lost (the page reloaded itself): load it again
+                session["loaded_at"] = None
+        except WebDriverException:
+            self.unwatch(link, broken=True)
+            raise
+
+        # The observer does not survive a fresh load: stop watching
+        self.unwatch(link)
+        return self.NOT_WATCHED
+
+    def unwatch(self, link, broken=False):
+        """Closes the match's tab and returns its session to the pool."""
+        with self._lock:
+            session = self._sessions.pop(link, None)
+        if session is not None and session["driver"] is not None:
+            self.pool.release(session["driver"], broken=broken)
+
+    def close(self):
+        for link in list(self._sessions):
+            self.unwatch(link)
@@ -0,0 +1,203 @@
+import bisect
+import json
+import threading
+import time
+
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# Stages recorded by the scrapers (label "stage"):
+#   driver_startup   launching a Chrome session
+#   http_fetch       plain HTTP GET through HttpFetcher
+#   navigate         driver.get()
+#   readiness_wait   wait_for_ready()
+#   page_source      transferring driver.page_source
+#   parse            building the BeautifulSoup tree
+#   extract          pulling fields out of the tree (excludes "parse")
+#   watch_drain      checking (and, if changed, reading) a watched live tab
+#   mongo_write      one insert_many / update_one round trip
+#   tab_total        one tab end to end
+#   match_total      one match (all of its tabs) end to end
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+METRICS_PORT = 9108
+
+
+# ----------------------------------------------------------------------
+# 1) HISTOGRAMS
+# ----------------------------------------------------------------------
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense."""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        total = 0
+        for bound, count in zip(list(self.buckets) + ["+Inf"], self.counts):
+            total += count
+            yield bound, total
+
+
+# ----------------------------------------------------------------------
+# 2) REGISTRY, TIMERS AND CONTEXT LABELS
+# ----------------------------------------------------------------------
+class MetricsRegistry:
+    """
+    Collects stage timings as histograms keyed by (stage, tab).
+
+    Labels that are not passed explicitly come from the current thread's
+    context (see labels()), so a scraper deep in the call stack only has
+    to name its stage. The match ID is kept out of the histograms (one
+    series per match would grow without bound) but written to the JSON
+    log, if enabled.
+    """
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._json_log = None
+
+    # Context ----------------------------------------------------------
+    def _context(self):
+        if not hasattr(self._local, "labels"):
+            self._local.labels = {}
+            self._local.timers = []
+        return self._local
+
+    @contextmanager
+    def labels(self, **labels):
+        """Sets default labels (tab, match) for observations in this thread."""
+        context = self._context()
+        previous = context.labels
+        context.labels = dict(previous, **labels)
+        try:
+            yield
+        finally:
+            context.labels = previous
+
+    # Recording --------------------------------------------------------
+    def observe(self, stage, seconds, **labels):
+        labels = dict(self._context().labels, **labels)
+        key = (stage, labels.get("tab", ""))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+            if self._json_log is not None:
+                record = dict(labels, ts=time.time(), stage=stage, seconds=round(seconds, 6))
+                self._json_log.write(json.dumps(record, default=str) + "\n")
+                self._json_log.flush()
+
+    @contextmanager
+    def timer(self, stage, exclusive=False, **labels):
+        """
+        Times the block as `stage`. With exclusive=True, time spent in
+        nested timers is subtracted, e.g. "extract" minus its "parse".
+        `labels` also apply to observations nested in the block.
+        """
+        timers = self._context().timers
+        frame = [0.0]  # time spent in nested timers
+        timers.append(frame)
+        start = time.perf_counter()
+        try:
+            with self.labels(**labels):
+                yield
+        finally:
+            elapsed = time.perf_counter() - start
+            timers.pop()
+            if timers:
+                timers[-1][0] += elapsed
+            self.observe(stage, elapsed - frame[0] if exclusive else elapsed, **labels)
+
+    # Output -----------------------------------------------------------
+    def enable_json_log(self, path):
+        """Appends one JSON line per observation to `path`."""
+        with self._lock:
+            self._json_log = open(path, "a", encoding="utf-8")
+
+    def close(self):
+        with self._lock:
+            if self._json_log is not None:
+                self._json_log.close()
+                self._json_log = None
+
+    def snapshot(self):
+        """{(stage, tab): (count, sum)}"""
+        with self._lock:
+            return {key: (h.count, h.sum) for key, h in self._histograms.items()}
+
+    def render(self):
+        """Prometheus text exposition format."""
+        lines = [
+            "# HELP crex_stage_seconds Time spent in each scraper stage.",
+            "# TYPE crex_stage_seconds histogram",
+        ]
+        with self._lock:
+            for (stage, tab), histogram in sorted(self._histograms.items()):
+                labels = f'stage="{stage}",tab="{tab}"'
+                for bound, total in histogram.cumulative():
+                    lines.append(f'crex_stage_seconds_bucket{{{labels},le="{bound}"}} {total}')
+                lines.append(f"crex_stage_seconds_sum{{{labels}}} {histogram.sum:.6f}")
+                lines.append(f"crex_stage_seconds_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+METRICS = MetricsRegistry()
+
+
+# ----------------------------------------------------------------------
+# 3) HTTP ENDPOINT
+# ----------------------------------------------------------------------
+class MetricsServer:
+    """Serves registry.render() at http://<host>:<port>/metrics."""
+
+    def __init__(self, registry=METRICS, host="127.0.0.1", port=METRICS_PORT):
+        self.registry = registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="metrics", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -0,0 +1,199 @@
+import queue
+import threading
+import time
+
+from collections import namedtuple
+
+from pymongo.errors import AutoReconnect, BulkWriteError, ConnectionFailure
+
+from metrics import METRICS
+
+
+# An update_one(filter, update, upsert=True) queued through the writer
+Upsert = namedtuple("Upsert", ["filter", "update"])
+
+
+def coalesce_upserts(upserts):
+    """
+    Merges queued upserts that target the same filter, so a match updated
+    several times within one batch costs a single round trip. Later
+    "$set" values win; other operators are merged the same way.
+    """
+    merged = {}
+    for upsert in upserts:
+        key = repr(sorted(upsert.filter.items()))
+        if key not in merged:
+            merged[key] = Upsert(upsert.filter, {op: dict(v) for op, v in upsert.update.items()})
+            continue
+        for op, fields in upsert.update.items():
+            merged[key].update.setdefault(op, {}).update(fields)
+    return list(merged.values())
+
+
+# ----------------------------------------------------------------------
+# WRITE-BEHIND, BATCHED MONGODB WRITER
+# ----------------------------------------------------------------------
+class BatchedWriter:
+    """
+    Buffers documents in a bounded queue and writes them from a background
+    thread with insert_many(ordered=False), so a slow Mongo never blocks
+    the scraping loop. Queued Upsert items are coalesced per filter and
+    applied with update_one(..., upsert=True).
+
+    - A batch is flushed when it reaches `batch_size` documents or when
+      `flush_interval` seconds have passed since its first document.
+    - write() blocks for at most `put_timeout` seconds when the queue is
+      full (backpressure); after that the document is dropped and counted.
+    - Connection errors are retried with exponential backoff, up to
+      `max_retries` times per batch. Duplicate-key errors on a retried
+      batch (documents that made it in before the failure) are ignored.
+
+    Works with any pymongo-compatible collection, e.g. mongomock's.
+    """
+
+    def __init__(self, collection, batch_size=100, flush_interval=1.0,
+                 max_queue=10000, put_timeout=1.0, max_retries=5):
+        self.collection = collection
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.max_retries = max_retries
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._stop = threading.Event()
+        self._thread = None
+
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.retries = 0
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="mongo-writer", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def write(self, doc):
+        """
+        Queues `doc` for insertion (or an Upsert to apply). Returns False if it had to be dropped
+        because the queue stayed full for `put_timeout` seconds.
+        """
+        try:
+            self._queue.put(doc, timeout=self.put_timeout)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            kind = doc.get("type", "doc") if isinstance(doc, dict) else "upsert"
+            print(f"[MongoWriter] Queue full, dropped a {kind} document")
+            return False
+
+    def flush(self):
+        """Blocks until every queued document has been handled."""
+        self._queue.join()
+
+    def close(self, timeout=30):
+        """Flushes what is queued and stops the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self):
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "retries": self.retries,
+        }
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch:
+                try:
+                    self._flush(batch)
+                except Exception as exc:
+                    # Never let one bad batch kill the writer thread
+                    self.failed += len(batch)
+                    print(f"[MongoWriter] Failed to write {len(batch)} documents: {exc!r}")
+                for _ in batch:
+                    self._queue.task_done()
+            elif self._stop.is_set():
+                return
+
+    def _next_batch(self):
+        try:
+            first = self._queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            return []
+
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._stop.is_set():
+                # When stopping, take what is already queued without waiting
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except queue.Empty:
+                    break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch):
+        inserts = [item for item in batch if not isinstance(item, Upsert)]
+        upserts = coalesce_upserts(item for item in batch if isinstance(item, Upsert))
+
+        if inserts:
+            self._with_retry(len(inserts), lambda attempt: self._insert(inserts, attempt))
+        for upsert in upserts:
+            self._with_retry(1, lambda attempt, u=upsert: self._upsert(u))
+
+    def _insert(self, docs, attempt):
+        try:
+            with METRICS.timer("mongo_write", collection=self.collection.name, op="insert"):
+                result = self.collection.insert_many(docs, ordered=False)
+            self.written += len(result.inserted_ids)
+        except BulkWriteError as exc:
+            errors = exc.details.get("writeErrors", [])
+            self.written += exc.details.get("nInserted", 0)
+            # On a retry, duplicate keys are documents that an earlier
+            # attempt of this batch already wrote
+            rejected = [
+                e for e in errors if not (attempt > 0 and e.get("code") == 11000)
+            ]
+            self.written += len(errors) - len(rejected)
+            self.failed += len(rejected)
+            if rejected:
+                print(
+                    f"[MongoWriter] {len(rejected)} documents rejected: "
+                    f"{rejected[0].get('errmsg')}"
+                )
+
+    def _upsert(self, upsert):
+        with METRICS.timer("mongo_write", collection=self.collection.name, op="upsert"):
+            self.collection.update_one(upsert.filter, upsert.update, upsert=True)
+        self.written += 1
+
+    def _with_retry(self, count, write):
+        delay = 0.5
+        for attempt in range(self.max_retries + 1):
+            try:
+                write(attempt)
+                return
+            except (AutoReconnect, ConnectionFailure) as exc:
+                if attempt == self.max_retries:
+                    self.failed += count
+                    print(f"[MongoWriter] Giving up on {count} documents: {exc}")
+                    return
+                self.retries += 1
+                time.sleep(delay)
+                delay = min(delay * 2, 10)
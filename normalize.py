@@ -0,0 +1,428 @@
+import re
+from collections import namedtuple
+
+
+# Balls per innings by format, matched in a fixture's type text, link,
+# series name or result description; first match wins. Tests and
+# first-class matches have no limit, nor do unrecognised formats
+FORMAT_BALLS = (
+    (re.compile(r"\bt10\b", re.I), 60),
+    (re.compile(r"\b(t20i?|twenty20)\b", re.I), 120),
+    (re.compile(r"\b(odi|one[- ]day|list[- ]a)\b", re.I), 300),
+    (re.compile(r"\b(test|first[- ]class)\b", re.I), None),
+)
+
+
+# ----------------------------------------------------------------------
+# 1) SCALAR PARSERS
+# ----------------------------------------------------------------------
+def scrape_failed(data):
+    """
+    Whether a tab scraper returned a failure marker instead of parsed
+    data: "N/A", {"Error": ...} or {"<tab>": "N/A"} (timeout, no data).
+    """
+    if data is None or data == "N/A":
+        return True
+    if isinstance(data, dict):
+        return "Error" in data or list(data.values()) == ["N/A"]
+    return False
+
+
+def to_int(text):
+    """ "163" -> 163; anything unparsable ("N/A", "", "-") -> None."""
+    if text is None:
+        return None
+    match = re.search(r"-?\d+", str(text).replace(",", ""))
+    return int(match.group()) if match else None
+
+
+def to_float(text):
+    """ "300.00" -> 300.0; anything unparsable -> None."""
+    if text is None:
+        return None
+    match = re.search(r"-?\d+(?:\.\d+)?", str(text))
+    return float(match.group()) if match else None
+
+
+def overs_to_balls(text):
+    """
+    Overs as legal deliveries: "18.1" -> 109, "(2.0)" -> 12, "20" -> 120.
+    Returns None for "Yet to bat", "N/A", etc.
+    """
+    if text is None:
+        return None
+    match = re.search(r"(\d+)(?:\.(\d))?", str(text))
+    if not match:
+        return None
+    return int(match.group(1)) * 6 + int(match.group(2) or 0)
+
+
+def parse_score(text):
+    """ "163/2" or "163-2" -> (163, 2); "111" -> (111, None)."""
+    match = re.search(r"(\d+)(?:\s*[/-]\s*(\d+))?", str(text or ""))
+    if not match:
+        return None, None
+    wickets = int(match.group(2)) if match.group(2) is not None else None
+    return int(match.group(1)), wickets
+
+
+def parse_figures(text):
+    """Bowling figures "1-35" (wickets-runs) -> (1, 35)."""
+    match = re.search(r"(\d+)\s*-\s*(\d+)", str(text or ""))
+    if not match:
+        return None, None
+    return int(match.group(1)), int(match.group(2))
+
+
+# ----------------------------------------------------------------------
+# 2) LIVE TAB
+# ----------------------------------------------------------------------
+def normalize_live(live_data):
+    """
+    Typed form of scrape_live_data() output. Returns None when the live
+    tab was not available.
+    """
+    if not isinstance(live_data, dict) or "batsmen" not in live_data:
+        return None
+
+    batsmen = [
+        {
+            "name": b.get("name"),
+            "runs": to_int(b.get("runs")),
+            "balls": to_int(b.get("balls")),
+            "fours": to_int(b.get("fours")),
+            "sixes": to_int(b.get("sixes")),
+            "sr": to_float(b.get("sr")),
+            "on_strike": bool(b.get("on_strike")),
+        }
+        for b in live_data.get("batsmen", [])
+    ]
+
+    bowler = None
+    raw_bowler = live_data.get("bowler") or {}
+    if raw_bowler:
+        wickets, runs = parse_figures(raw_bowler.get("figures"))
+        bowler = {
+            "name": raw_bowler.get("name"),
+            "wickets": wickets,
+            "runs": runs,
+            "balls": overs_to_balls(raw_bowler.get("overs")),
+            "economy": to_float(raw_bowler.get("economy")),
+        }
+
+    overs = [
+        {
+            "title": o.get("over_title"),
+            "over": to_int(o.get("over_title")),
+            "balls": o.get("balls", []),
+            "runs": to_int(o.get("total")),
+        }
+        for o in live_data.get("overs_timeline", [])
+    ]
+
+    win_probability = None
+    if isinstance(live_data.get("win_probability"), dict):
+        win_probability = {
+            team: to_int(pct) for team, pct in live_data["win_probability"].items()
+        }
+
+    return {
+        "batsmen": batsmen,
+        "bowler": bowler,
+        "overs": overs,
+        "win_probability": win_probability,
+    }
+
+
+# ----------------------------------------------------------------------
+# 3) SCORECARD TAB
+# ----------------------------------------------------------------------
+def normalize_scorecard(scorecard_data):
+    """
+    Typed form of get_scorecard_data() output. Returns None when the
+    scorecard was not available.
+    """
+    if not isinstance(scorecard_data, dict) or "batting" not in scorecard_data:
+        return None
+
+    batting = [
+        [
+            {
+                "batter": row.get("batter"),
+                "runs": to_int(row.get("runs")),
+                "balls": to_int(row.get("balls")),
+                "fours": to_int(row.get("fours")),
+                "sixes": to_int(row.get("sixes")),
+                "sr": to_float(row.get("strike_rate")),
+            }
+            for row in innings
+        ]
+        for innings in scorecard_data.get("batting", [])
+    ]
+    bowling = [
+        [
+            {
+                "bowler": row.get("bowler"),
+                "balls": overs_to_balls(row.get("overs")),
+                "maidens": to_int(row.get("maidens")),
+                "runs": to_int(row.get("runs_conceded")),
+                "wickets": to_int(row.get("wickets")),
+                "economy": to_float(row.get("economy")),
+            }
+            for row in innings
+        ]
+        for innings in scorecard_data.get("bowling", [])
+    ]
+
+    fall_of_wickets = []
+    for w in scorecard_data.get("fall_of_wickets", []):
+        runs, wicket = parse_score(w.get("score"))
+        fall_of_wickets.append(
+            {
+                "batsman": w.get("batsman"),
+                "runs": runs,
+                "wicket": wicket,
+                "ball": overs_to_balls(w.get("overs")),
+            }
+        )
+
+    partnerships = []
+    for p in scorecard_data.get("partnerships", []):
+        # total_runs looks like "14(17)" => runs(balls)
+        total = re.match(r"(\d+)\s*\((\d+)\)", p.get("total_runs", ""))
+        partnerships.append(
+            {
+                "wicket": to_int(p.get("wicket")),
+                "batter1": p.get("batter1"),
+                "batter1_runs": to_int(p.get("batter1_stats")),
+                "batter2": p.get("batter2"),
+                "batter2_runs": to_int(p.get("batter2_stats")),
+                "runs": int(total.group(1)) if total else to_int(p.get("total_runs")),
+                "balls": int(total.group(2)) if total else None,
+            }
+        )
+
+    yet_to_bat = [
+        {"name": p.get("name"), "average": to_float(p.get("average"))}
+        for p in scorecard_data.get("yet_to_bat", [])
+    ]
+
+    return {
+        "batting": batting,
+        "bowling": bowling,
+        "fall_of_wickets": fall_of_wickets,
+        "partnerships": partnerships,
+        "yet_to_bat": yet_to_bat,
+    }
+
+
+# ----------------------------------------------------------------------
+# 4) INFO TAB (run-together text blobs)
+# ----------------------------------------------------------------------
+# "MLS162/620.0BRH Won 4th T20I, BBL 2024-25BRH18.1163/2"
+#  team1 score/wkts overs, "<winner> Won <desc>", team2 overs score/wkts
+# Team1's runs and overs run together ("SL1039.5": 103 in 9.5 overs, or
+# 10 in 39.5), so they are split by parse_match_result(). Multi-innings
+# (Test) results like "AUS474&234AUS Won ..." are not parsed.
+_RESULT_RE = re.compile(
+    r"^(?P<team1>[A-Z][A-Z0-9-]*?)(?P<innings1>\d+(?:/\d+)?\.\d)"
+    r"(?:(?P<winner>[A-Za-z][\w-]*) [Ww]on|Match (?:Drawn|Tied)) (?P<desc>.*?)"
+    r"(?P<team2>[A-Z][A-Z0-9-]*?)(?P<overs2>\d{1,2}\.[0-5])(?P<runs2>\d+?)(?:/(?P<wkts2>10|\d))?$"
+)
+# Compact typed rows (stored as arrays); the raw strings stay in info_data
+MatchResult = namedtuple(
+    "MatchResult",
+    ["team1", "team1_runs", "team1_wickets", "team1_balls",
+     "team2", "team2_runs", "team2_wickets", "team2_balls", "winner"],
+)
+VenueRecord = namedtuple("VenueRecord", ["team", "against", "runs", "wickets"])
+
+# "10  Matches Played  10  60%  Win  20%  155  Avg Score  152  ..."
+_H2H_ROWS = ("Matches Played", "Win", "Avg Score", "Highest Score", "Lowest Score")
+
+
+def format_balls(text):
+    """
+    (recognised, balls per innings) of the format named in `text`
+    (FORMAT_BALLS); balls is None for unlimited or unknown formats.
+    """
+    if text and text != "N/A":
+        for pattern, balls in FORMAT_BALLS:
+            if pattern.search(text.replace("-", " ")):
+                return True, balls
+    return False, None
+
+
+def _innings_splits(text):
+    """
+    Possible (runs, wickets, balls) readings of a run-together first
+    innings: "162/620.0" -> (162, 6, 120); "1039.5" -> (10, 10, 239) and
+    (103, 10, 59). Readings with an impossible over ("9.6") are left out.
+    """
+    head, _, ball = text.rpartition(".")
+    runs, slash, rest = head.partition("/")
+    if not slash:
+        runs, rest = "", head
+    splits = []
+    for digits in (2, 1):
+        overs, before = rest[-digits:], rest[:-digits]
+        if slash:
+            wickets = before
+        else:
+            runs, wickets = before, "10"
+        if (runs and wickets and len(overs) == digits and int(ball) <= 5
+                and not (digits == 2 and overs[0] == "0") and int(wickets) <= 10
+                and not (len(wickets) > 1 and wickets[0] == "0")):
+            splits.append((int(runs), int(wickets), int(overs) * 6 + int(ball)))
+    return splits
+
+
+def parse_match_result(text):
+    """
+    One of the teams' recent results as a MatchResult, or None when the
+    text does not parse (or gives an innings longer than its format).
+    """
+    match = _RESULT_RE.match(text or "")
+    if not match:
+        return None
+    g = match.groupdict()
+    _, limit = format_balls(g["desc"])
+    team2_balls = overs_to_balls(g["overs2"])
+    if limit is not None and team2_balls > limit:
+        return None
+    fits = [s for s in _innings_splits(g["innings1"]) if limit is None or s[2] <= limit]
+    if not fits:
+        return None
+    runs1, wickets1, balls1 = fits[0]
+    return MatchResult(
+        g["team1"], runs1, wickets1, balls1,
+        g["team2"], int(g["runs2"]), int(g["wkts2"]) if g["wkts2"] else 10, team2_balls,
+        g["winner"],
+    )
+
+
+def parse_h2h_table(text):
+    """
+    Team-vs-team table: {"matches_played": [10, 10], "win_pct": [60, 20],
+    "avg_score": [155, 152], ...} (team1 value, team2 value).
+    """
+    if not text or text == "N/A":
+        return None
+    table = {}
+    for label in _H2H_ROWS:
+        match = re.search(r"(\d+)%?\s+" + re.escape(label) + r"\s+(\d+)%?", text)
+        if match:
+            key = "win_pct" if label == "Win" else label.lower().replace(" ", "_")
+            table[key] = [int(match.group(1)), int(match.group(2))]
+    return table or None
+
+
+def parse_venue_stats(text):
+    """
+    "64MatchesWin Bat first45%Win Bowl first47%Avg 1st Inns167Avg 2st Inns153
+    Highest Totalby BRH vs SYS224-5 ..." -> typed venue record.
+    """
+    if not text or text == "N/A":
+        return None
+    stats = {}
+    patterns = {
+        "matches": r"^(\d+)Matches",
+        "win_bat_first_pct": r"Win Bat first(\d+)%",
+        "win_bowl_first_pct": r"Win Bowl first(\d+)%",
+        "avg_first_innings": r"Avg 1st Inns(\d+)",
+        "avg_second_innings": r"Avg 2(?:st|nd) Inns(\d+)",
+    }
+    for key, pattern in patterns.items():
+        match = re.search(pattern, text)
+        if match:
+            stats[key] = int(match.group(1))
+
+    records = {
+        "highest_total": "Highest Total",
+        "lowest_total": "Lowest Total",
+        "highest_chased": "Highest Chased",
+        "lowest_defended": "Lowest Defended",
+    }
+    for key, label in records.items():
+        match = re.search(
+            re.escape(label) + r"by (\S+) vs (.+?)(\d+)-(\d+)", text
+        )
+        if match:
+            stats[key] = VenueRecord(
+                match.group(1), match.group(2).strip(), int(match.group(3)), int(match.group(4))
+            )
+    return stats or None
+
+
+def parse_pace_vs_spin(text):
+    """ "Pace83 Wkt74%26%Spin29 Wkt" -> wickets and share for pace/spin."""
+    match = re.search(r"Pace(\d+) Wkt(\d+)%(\d+)%Spin(\d+) Wkt", text or "")
+    if not match:
+        return None
+    return {
+        "pace_wickets": int(match.group(1)),
+        "pace_pct": int(match.group(2)),
+        "spin_pct": int(match.group(3)),
+        "spin_wickets": int(match.group(4)),
+    }
+
+
+def parse_weather(text):
+    """ "...24.7˚CCloudyCloudy73% (Humidity)55 % Chance" -> numbers."""
+    if not text or text == "N/A":
+        return None
+    temp = re.search(r"(-?\d+(?:\.\d+)?)\s*[˚°]C", text)
+    humidity = re.search(r"(\d+)%\s*\(Humidity\)", text)
+    rain = re.search(r"(\d+)\s*%\s*Chance", text)
+    return {
+        "temperature_c": float(temp.group(1)) if temp else None,
+        "humidity_pct": int(humidity.group(1)) if humidity else None,
+        "rain_chance_pct": int(rain.group(1)) if rain else None,
+    }
+
+
+def normalize_info(info_data):
+    """
+    Typed form of scrape_match_info() output, or None on error. Holds
+    only what is parsed out of the text; plain strings (venue, date,
+    teams, series, toss) are read from info_data, stored alongside.
+    """
+    if not isinstance(info_data, dict) or "match_venue" not in info_data:
+        return None
+    h2h = info_data.get("head_to_head") or []
+    return {
+        "head_to_head": [to_int(x) for x in h2h],
+        "recent_results": [parse_match_result(r) for r in info_data.get("match_result", [])],
+        "h2h_table": parse_h2h_table(info_data.get("scorecard_table")),
+        "weather": parse_weather(info_data.get("venue_details")),
+        "venue_stats": parse_venue_stats(info_data.get("venue_stats")),
+        "pace_vs_spin": parse_pace_vs_spin(info_data.get("pace_vs_spin_on_venue")),
+    }
+
+
+# ----------------------------------------------------------------------
+# 5) FIXTURE CARDS
+# ----------------------------------------------------------------------
+def normalize_fixture(match_dict):
+    """Typed scores/overs for a live or concluded fixture card."""
+    scores = [parse_score(s) for s in match_dict.get("scores", [])]
+    overs = match_dict.get("over") or match_dict.get("overs") or []
+    return {
+        "runs": [r for r, _ in scores],
+        "wickets": [w for _, w in scores],
+        "balls": [overs_to_balls(o) for o in overs],
+    }
+
+
+# ----------------------------------------------------------------------
+# 6) NORMALIZATION STAGE
+# ----------------------------------------------------------------------
+def normalize_snapshot(live_data, scorecard_data):
+    """
+    Typed records for one poll of a live match, i.e. the output of
+    scrape_live_data() and get_scorecard_data().
+    """
+    return {
+        "live": normalize_live(live_data),
+        "scorecard": normalize_scorecard(scorecard_data),
+    }
@@ -0,0 +1,68 @@
+from bs4 import BeautifulSoup
+
+from metrics import METRICS
+
+try:
+    import lxml  # noqa: F401
+
+    DEFAULT_BACKEND = "lxml"
+except ImportError:
+    DEFAULT_BACKEND = "html.parser"
+
+
+def make_soup(html, backend=None):
+    """
+    Parses `html` with the selected BeautifulSoup tree builder
+    ("lxml" when installed, otherwise "html.parser").
+    """
+    with METRICS.timer("parse"):
+        return BeautifulSoup(html, backend or DEFAULT_BACKEND)
+
+
+# ----------------------------------------------------------------------
+# PARSE-ONCE DOCUMENT WITH A CLASS INDEX
+# ----------------------------------------------------------------------
+class ParsedPage:
+    """
+    Parses a page once and indexes every element by class in a single
+    walk, so repeated lookups are dict hits instead of full-tree scans.
+
+    Lookups follow BeautifulSoup's class_ semantics: a single class name
+    matches any element carrying that class, while a value containing a
+    space ("match-date match-venue") must match the whole class attribute.
+    """
+
+    def __init__(self, html, backend=None):
+        self.soup = make_soup(html, backend)
+        self._by_class = {}
+        self._by_class_attr = {}
+
+        for el in self.soup.find_all(True):
+            classes = el.get("class")
+            if not classes:
+                continue
+            for class_name in classes:
+                self._by_class.setdefault(class_name, []).append(el)
+            if len(classes) > 1:
+                self._by_class_attr.setdefault(" ".join(classes), []).append(el)
+
+    def all(self, class_, name=None):
+        """Every element with `class_` (optionally only <name> tags)."""
+        if " " in class_:
+            elements = self._by_class_attr.get(class_, [])
+        else:
+            elements = self._by_class.get(class_, [])
+        if name is None:
+            return list(elements)
+        return [el for el in elements if el.name == name]
+
+    def first(self, class_, name=None):
+        """First element with `class_` in document order, or None."""
+        if " " in class_:
+            elements = self._by_class_attr.get(class_, ())
+        else:
+            elements = self._by_class.get(class_, ())
+        for el in elements:
+            if name is None or el.name == name:
+                return el
+        return None
@@ -0,0 +1,177 @@
+import heapq
+import itertools
+import re
+import time
+
+from datetime import datetime, timedelta
+
+# Info and squads are fetched this long before the scheduled start
+# (toss is usually 30 minutes before the first ball)...
+WARMUP_LEAD = 35 * 60
+# ...and fetched again after the toss, when the playing XIs are out
+REFRESH_LEAD = 5 * 60
+# Matches move to live tracking this long before the scheduled start
+PROMOTE_LEAD = 60
+# Fixtures still listed as upcoming this long after their start time are
+# left to the fixture list (abandoned, or the card time was misread)
+MAX_OVERDUE = 3 * 60 * 60
+
+_DATE_FORMATS = (
+    "%b %d, %Y, %I:%M:%S %p",  # Jan 1, 2025, 1:45:00 PM
+    "%b %d, %Y, %I:%M %p",
+    "%d %b %Y, %I:%M %p",
+    "%I:%M %p",  # 1:45 PM (next occurrence)
+)
+
+
+# ----------------------------------------------------------------------
+# 1) START TIMES FROM FIXTURE CARDS
+# ----------------------------------------------------------------------
+def parse_start_time(text, now=None):
+    """
+    Start time of an upcoming fixture from its card text, as a local
+    datetime. Understands full dates ("Jan 1, 2025, 1:45:00 PM"),
+    "Today, 7:30 PM" / "Tomorrow, 7:30 PM", bare times (their next
+    occurrence) and countdowns ("Starts in 2h 15m"). Returns None if the
+    text is not recognised.
+    """
+    if not text or text == "N/A":
+        return None
+    now = now or datetime.now()
+    text = " ".join(text.split())
+
+    countdown = re.search(r"(?:(\d+)\s*h)?\s*(\d+)\s*m(?:in)?\b", text, re.I)
+    if countdown and re.search(r"\bin\b", text, re.I):
+        hours, minutes = int(countdown.group(1) or 0), int(countdown.group(2))
+        return now + timedelta(hours=hours, minutes=minutes)
+
+    day_offset = 0
+    relative = re.match(r"(today|tomorrow)\W*", text, re.I)
+    if relative:
+        day_offset = 1 if relative.group(1).lower() == "tomorrow" else 0
+        text = text[relative.end():]
+
+    for fmt in _DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+        if fmt == "%I:%M %p":
+            parsed = datetime.combine(now.date(), parsed.time())
+            # A bare time already past is tomorrow's: a fixture that has
+            # started is listed as live, not with its start time
+            if not relative and parsed < now:
+                parsed += timedelta(days=1)
+        return parsed + timedelta(days=day_offset)
+    return None
+
+
+# ----------------------------------------------------------------------
+# 2) TIME-ORDERED SCHEDULE OF UPCOMING MATCHES
+# ----------------------------------------------------------------------
+class PrestartSchedule:
+    """
+    Heap of (due, kind, link) actions for upcoming fixtures, in epoch
+    seconds:
+
+      warmup    fetch info + squads before the toss (and again after it)
+      promote   hand the match to live tracking at its start time
+
+    update() adds fixtures the first time they show up; pop_due()
+    returns the actions whose time has come. Fixtures without a
+    parseable start time are left to the fixture list (liveTag).
+    """
+
+    def __init__(self, warmup_lead=WARMUP_LEAD, refresh_lead=REFRESH_LEAD,
+                 promote_lead=PROMOTE_LEAD, max_overdue=MAX_OVERDUE):
+        self.warmup_lead = warmup_lead
+        self.refresh_lead = refresh_lead
+        self.promote_lead = promote_lead
+        self.max_overdue = max_overdue
+
+        self._heap = []
+        self._seq = itertools.count()
+        self.matches = {}  # link -> {"match_dict", "start", "info_data", "squads_data"}
+        self._promoted = set()
+
+    def __len__(self):
+        return len(self.matches)
+
+    def update(self, upcoming_matches, now=None):
+        """Schedules newly listed upcoming fixtures; returns how many."""
+        now = time.time() if now is None else now
+        added = 0
+        for m in upcoming_matches:
+            link = m.get("link")
+            if not link:
+                continue
+            if link in self._promoted:
+                continue
+            if link in self.matches:
+                self.matches[link]["match_dict"] = m
+                continue
+            start = parse_start_time(m.get("time_start"), datetime.fromtimestamp(now))
+            if start is None or start.timestamp() < now - self.max_overdue:
+                continue
+            start = start.timestamp()
+            self.matches[link] = {
+                "match_dict": m,
+                "start": start,
+                "info_data": None,
+                "squads_data": None,
+            }
+            for lead in (self.warmup_lead, self.refresh_lead):
+                self._push(max(now, start - lead), "warmup", link)
+            self._push(start - self.promote_lead, "promote", link)
+            added += 1
+        return added
+
+    def forget(self, link):
+        """Drops the fixture, scheduled or promoted (its heap items lapse)."""
+        self.matches.pop(link, None)
+        self._promoted.discard(link)
+
+    def __contains__(self, link):
+        """Whether `link` is scheduled or was already promoted."""
+        return link in self.matches or link in self._promoted
+
+    def __iter__(self):
+        """Links of the scheduled and the promoted fixtures."""
+        return iter(list(self.matches) + list(self._promoted))
+
+    def _push(self, due, kind, link):
+        heapq.heappush(self._heap, (due, next(self._seq), kind, link))
+
+    def pop_due(self, now=None):
+        """
+        Returns (warmups, promotions): match dicts whose warmup is due, and
+        the schedule entries (match_dict, start, prefetched info/squads) of
+        matches to start tracking as live. Promoted matches are dropped
+        from the schedule.
+        """
+        now = time.time() if now is None else now
+        warmups, promotions = [], []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, kind, link = heapq.heappop(self._heap)
+            entry = self.matches.get(link)
+            if entry is None:
+                continue
+            if kind == "promote":
+                promotions.append(entry)
+                self.matches.pop(link)
+                self._promoted.add(link)
+            elif entry["match_dict"] not in warmups:
+                warmups.append(entry["match_dict"])
+        return warmups, promotions
+
+    def next_due(self):
+        """Epoch time of the next pending action, or None."""
+        while self._heap and self._heap[0][3] not in self.matches:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def record_warmup(self, link, info_data, squads_data):
+        entry = self.matches.get(link)
+        if entry is not None:
+            entry["info_data"] = info_data
+            entry["squads_data"] = squads_data
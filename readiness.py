@@ -0,0 +1,241 @@
+import threading
+import time
+from collections import deque
+
+from selenium.common.exceptions import WebDriverException
+
+from metrics import METRICS
+
+
+READY = "ready"  # a ready selector is present and the DOM went quiet
+NO_DATA = "no_data"  # the page says there is nothing to show yet
+ABSENT = "absent"  # page finished loading and settled without the selector
+TIMEOUT = "timeout"  # budget ran out
+
+
+# ----------------------------------------------------------------------
+# 1) PER-TAB READINESS RULES
+# ----------------------------------------------------------------------
+# ready:        CSS selectors; any one present means the content rendered
+# no_data:      CSS selectors that mean "nothing here yet"
+# no_data_text: page texts that mean the same
+# budget:       default timeout (s) until enough history is recorded
+# min/max:      bounds for the learned timeout
+# settle:       whether a loaded page that went quiet without the ready
+#               selector ends the wait as ABSENT (optional, default True)
+TAB_RULES = {
+    "match_list": {
+        "ready": [".match-card-container"],
+        "no_data": [],
+        "no_data_text": ["No matches found"],
+        # Never empty in practice: a quiet page without cards is the app
+        # still fetching them, so wait for the cards or the budget
+        "settle": False,
+        "budget": 10,
+        "min": 3,
+        "max": 10,
+    },
+    "info": {
+        "ready": [".match-info-card"],
+        "no_data": [],
+        "no_data_text": [],
+        "budget": 20,
+        "min": 3,
+        "max": 20,
+    },
+    "live": {
+        "ready": [".container.live-screen-wrap", ".live-container-wrapper"],
+        "no_data": [".not-started"],
+        "no_data_text": ["Match yet to begin", "Match not started"],
+        "budget": 20,
+        "min": 3,
+        "max": 20,
+    },
+    "scorecard": {
+        "ready": [".score"],
+        "no_data": [".not-started"],
+        "no_data_text": ["Scorecard not available", "Match yet to begin"],
+        "budget": 10,
+        "min": 3,
+        "max": 10,
+    },
+    "squads": {
+        "ready": [".info-right-wrapper .playingxi-button"],
+        "no_data": [],
+        "no_data_text": ["Squads will be updated"],
+        "budget": 30,
+        "min": 5,
+        "max": 30,
+    },
+}
+
+# How long the DOM must stay unchanged before we call it settled (ms)
+QUIET_MS = 300
+# Live pages may never go fully quiet; once the ready selector shows up we
+# wait at most this long (s) for quiescence before parsing anyway
+READY_SETTLE_MAX = 1.0
+# A fully loaded page that stays unchanged this long without the ready
+# selector is treated as ABSENT instead of waiting out the whole budget
+SETTLED_ABSENT_MS = 1500
+POLL_INTERVAL = 0.1
+
+# One round trip per poll: installs a MutationObserver on first call and
+# reports what is on the page and how long the DOM has been quiet.
+_PROBE_JS = """
+const ready = arguments[0], noData = arguments[1], noDataText = arguments[2];
+if (!window.__crexMutation) {
+  window.__crexMutation = {last: performance.now()};
+  new MutationObserver(function () {
+    window.__crexMutation.last = performance.now();
+  }).observe(document.documentElement, {
+    childList: true, subtree: true, attributes: true, characterData: true
+  });
+}
+const isReady = ready.some(function (sel) { return document.querySelector(sel); });
+let empty = noData.some(function (sel) { return document.querySelector(sel); });
+if (!empty && noDataText.length && document.body) {
+  const text = document.body.textContent;
+  empty = noDataText.some(function (t) { return text.indexOf(t) !== -1; });
+}
+return {
+  ready: isReady,
+  noData: empty,
+  quietMs: performance.now() - window.__crexMutation.last,
+  state: document.readyState
+};
+"""
+
+
+# ----------------------------------------------------------------------
+# 2) TIMEOUT BUDGETS LEARNED FROM RECENT WAITS
+# ----------------------------------------------------------------------
+class WaitBudgets:
+    """
+    Records how long each tab took to become ready and derives the next
+    timeout from recent history: twice the 95th percentile of successful
+    waits, clamped to the tab's [min, max]. Until `min_samples` waits are
+    recorded the tab's default budget is used.
+    """
+
+    def __init__(self, history=50, min_samples=5, rules=TAB_RULES):
+        self.rules = rules
+        self.min_samples = min_samples
+        self._history = history
+        self._ready_waits = {}
+        self._all_waits = {}
+        self._lock = threading.Lock()
+
+    def record(self, tab, elapsed, outcome):
+        with self._lock:
+            self._all_waits.setdefault(tab, deque(maxlen=self._history)).append(
+                (elapsed, outcome)
+            )
+            if outcome == READY:
+                self._ready_waits.setdefault(tab, deque(maxlen=self._history)).append(
+                    elapsed
+                )
+
+    def budget(self, tab):
+        rule = self.rules[tab]
+        with self._lock:
+            waits = sorted(self._ready_waits.get(tab, ()))
+        if len(waits) < self.min_samples:
+            return rule["budget"]
+        p95 = waits[min(len(waits) - 1, int(len(waits) * 0.95))]
+        return max(rule["min"], min(rule["max"], p95 * 2))
+
+    def stats(self):
+        """
+        Per-tab summary of recorded waits: count, mean seconds, outcome
+        counts and the current budget.
+        """
+        with self._lock:
+            snapshot = {tab: list(waits) for tab, waits in self._all_waits.items()}
+        summary = {}
+        for tab, waits in snapshot.items():
+            outcomes = {}
+            for _, outcome in waits:
+                outcomes[outcome] = outcomes.get(outcome, 0) + 1
+            summary[tab] = {
+                "count": len(waits),
+                "mean_wait": sum(e for e, _ in waits) / len(waits),
+                "outcomes": outcomes,
+                "budget": self.budget(tab),
+            }
+        return summary
+
+
+DEFAULT_BUDGETS = WaitBudgets()
+
+
+# ----------------------------------------------------------------------
+# 3) WAITING
+# ----------------------------------------------------------------------
+def wait_for_ready(driver, tab, budgets=None, timeout=None):
+    """
+    Waits until the tab's content is ready, the page reports it has no
+    data, or the page has settled without the expected content (for tabs
+    whose rule allows it) - whichever comes first - instead of sleeping
+    for a fixed time.
+
+    Returns (outcome, elapsed_seconds); outcome is one of READY, NO_DATA,
+    ABSENT or TIMEOUT. The wait is recorded in `budgets`.
+    """
+    budgets = budgets or DEFAULT_BUDGETS
+    rule = budgets.rules[tab]
+    timeout = budgets.budget(tab) if timeout is None else timeout
+
+    start = time.monotonic()
+    first_ready = None
+    outcome = TIMEOUT
+    while True:
+        try:
+            probe = driver.execute_script(
+                _PROBE_JS, rule["ready"], rule["no_data"], rule["no_data_text"]
+            )
+        except WebDriverException:
+            probe = None
+
+        if probe:
+            if probe["ready"]:
+                now = time.monotonic()
+                first_ready = first_ready or now
+                if probe["quietMs"] >= QUIET_MS or now - first_ready >= READY_SETTLE_MAX:
+                    outcome = READY
+                    break
+            if probe["noData"] and not probe["ready"]:
+                outcome = NO_DATA
+                break
+            if (
+                rule.get("settle", True)
+                and not probe["ready"]
+                and probe["state"] == "complete"
+                and probe["quietMs"] >= SETTLED_ABSENT_MS
+            ):
+                outcome = ABSENT
+                break
+
+        if time.monotonic() - start >= timeout:
+            break
+        time.sleep(POLL_INTERVAL)
+
+    elapsed = time.monotonic() - start
+    budgets.record(tab, elapsed, outcome)
+    METRICS.observe("readiness_wait", elapsed, tab=tab, outcome=outcome)
+    return outcome, elapsed
+
+
+def wait_for_quiet(driver, timeout=1.0, quiet_ms=QUIET_MS):
+    """
+    Waits (at most `timeout` seconds) until the DOM has not changed for
+    `quiet_ms`. Used after clicks instead of a fixed sleep.
+    """
+    start = time.monotonic()
+    while time.monotonic() - start < timeout:
+        try:
+            probe = driver.execute_script(_PROBE_JS, [], [], [])
+        except WebDriverException:
+            return
+        if probe and probe["quietMs"] >= quiet_ms:
+            return
+        time.sleep(POLL_INTERVAL)
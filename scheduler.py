@@ -0,0 +1,198 @@
+import heapq
+import itertools
+import time
+
+from normalize import format_balls, normalize_fixture, scrape_failed
+
+# Seconds between polls of one match, by match state:
+#   death      last fifth of a limited-overs innings
+#   chase      second innings, result still open late in the chase
+#   play       anything else in play
+#   break      live tab shows no batsmen (innings break, rain)
+#   prestart   promoted at its start time, first ball not bowled yet
+STATE_INTERVALS = {
+    "death": 15,
+    "chase": 15,
+    "play": 30,
+    "break": 180,
+    "prestart": 15,
+}
+MAX_INTERVAL = 300
+# Each poll in a row that found nothing new stretches the interval
+UNCHANGED_BACKOFF = 1.5
+
+# A chase is close while the required rate is at least the current one,
+# or the chasing side is down to this many wickets
+CHASE_WICKETS_IN_HAND = 3
+
+
+# ----------------------------------------------------------------------
+# 1) MATCH STATE FROM THE LATEST SCRAPE
+# ----------------------------------------------------------------------
+def innings_balls(match_dict, info_data=None):
+    """
+    Balls per innings of the match's format (normalize.FORMAT_BALLS), from the
+    fixture card's "type" text, its link and the series name in
+    `info_data`; None for unlimited or unknown formats.
+    """
+    series = info_data.get("series_name") if isinstance(info_data, dict) else None
+    for text in (match_dict.get("type"), match_dict.get("link"), series):
+        recognised, balls = format_balls(text)
+        if recognised:
+            return balls
+    return None
+
+
+def assess_match(match_dict, live_data, info_data=None):
+    """
+    Classifies a tracked match as "death", "chase", "play", "break" or
+    "prestart" from its fixture card (format, scores/overs), the match
+    info and the /live tab output. A /live scrape that failed is "play"
+    (retried soon); only a loaded page without batsmen is a break.
+    """
+    failed = scrape_failed(live_data) or not isinstance(live_data, dict)
+    # Promoted from the upcoming list and still waiting for the first ball
+    if match_dict.get("status") == "Upcoming" and (failed or not live_data.get("batsmen")):
+        return "prestart"
+    if failed:
+        return "play"
+    if not live_data.get("batsmen"):
+        return "break"
+
+    fixture = normalize_fixture(match_dict)
+    runs, wickets, balls = fixture["runs"], fixture["wickets"], fixture["balls"]
+    bowled = [b for b in balls if b is not None]
+    if not bowled:
+        return "play"
+
+    limit = innings_balls(match_dict, info_data)
+    if limit is None:
+        return "play"
+
+    def complete(i):
+        return balls[i] is not None and (balls[i] >= limit or (wickets[i] or 0) >= 10)
+
+    batting = [i for i in range(len(balls)) if balls[i] is not None and not complete(i)]
+    if not batting:
+        return "play"
+    current = batting[-1]
+    balls_left = limit - balls[current]
+
+    # Second innings, second half: close unless the chasing side is ahead
+    # of the rate with wickets in hand (and not out of reach: at most 2 a
+    # ball)
+    finished = [i for i in range(len(balls)) if complete(i) and i != current]
+    if finished and runs[finished[0]] is not None and runs[current] is not None:
+        needed = runs[finished[0]] + 1 - runs[current]
+        if 0 < needed <= 2 * balls_left and balls_left <= limit // 2:
+            required_rate = needed / balls_left
+            current_rate = runs[current] / balls[current] if balls[current] else 0
+            wickets_in_hand = 10 - (wickets[current] or 0)
+            if required_rate >= current_rate or wickets_in_hand <= CHASE_WICKETS_IN_HAND:
+                return "chase"
+
+    if balls_left <= limit // 5:
+        return "death"
+    return "play"
+
+
+# ----------------------------------------------------------------------
+# 2) PER-MATCH NEXT-DUE TIMES ON A PRIORITY QUEUE
+# ----------------------------------------------------------------------
+class PollScheduler:
+    """
+    Min-heap of (next_due, link). Each match is rescheduled relative to
+    the time its own poll started, so a slow match does not push every
+    other match back (no cycle drift), and busy matches are polled more
+    often than idle ones.
+
+    A match popped by pop_due() stays "in flight" until schedule() is
+    called for it again; add() ignores matches that are queued or in
+    flight. Entries of removed or rescheduled matches are skipped lazily.
+    """
+
+    def __init__(self, intervals=STATE_INTERVALS, max_interval=MAX_INTERVAL,
+                 backoff=UNCHANGED_BACKOFF):
+        self.intervals = intervals
+        self.max_interval = max_interval
+        self.backoff = backoff
+
+        self._heap = []
+        self._seq = itertools.count()
+        self._due = {}  # link -> due time, or None while in flight
+        self._unchanged = {}  # link -> polls in a row without changes
+
+    def __contains__(self, link):
+        return link in self._due
+
+    def __len__(self):
+        return len(self._due)
+
+    def add(self, link, due=None):
+        """Starts tracking `link`, due immediately unless `due` is given."""
+        if link not in self._due:
+            self.schedule(link, time.monotonic() if due is None else due)
+
+    def schedule(self, link, due):
+        self._due[link] = due
+        heapq.heappush(self._heap, (due, next(self._seq), link))
+
+    def remove(self, link):
+        self._due.pop(link, None)
+        self._unchanged.pop(link, None)
+
+    def _is_current(self, entry):
+        due, _, link = entry
+        return self._due.get(link) == due
+
+    def pop_due(self, now=None):
+        """Returns the links whose next poll is due, most overdue first."""
+        now = time.monotonic() if now is None else now
+        links = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if self._is_current(entry):
+                links.append(entry[2])
+                self._due[entry[2]] = None
+        return links
+
+    def next_due(self):
+        """Monotonic time of the earliest queued poll, or None."""
+        while self._heap and not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def export(self, now=None):
+        """
+        {link: {"due_at", "unchanged"}} with due times as epoch seconds
+        (monotonic clocks do not survive a restart); in-flight matches
+        are due right away.
+        """
+        now = time.monotonic() if now is None else now
+        offset = time.time() - now
+        return {
+            link: {
+                "due_at": (now if due is None else due) + offset,
+                "unchanged": self._unchanged.get(link, 0),
+            }
+            for link, due in self._due.items()
+        }
+
+    def restore(self, entries, now=None):
+        """Re-queues matches from export(); overdue ones are due at once."""
+        now = time.monotonic() if now is None else now
+        offset = time.time() - now
+        for link, entry in entries.items():
+            self._due.pop(link, None)
+            self.add(link, due=max(now, entry["due_at"] - offset))
+            self._unchanged[link] = entry.get("unchanged", 0)
+
+    def interval_for(self, link, state, changed):
+        """
+        Poll interval for a match in `state`, stretched by `backoff` for
+        every consecutive poll that found no change.
+        """
+        streak = 0 if changed else self._unchanged.get(link, 0) + 1
+        self._unchanged[link] = streak
+        interval = self.intervals[state] * self.backoff ** streak
+        return min(self.max_interval, interval)
@@ -1,168 +1,264 @@
 import json
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
+import os
 from selenium.common.exceptions import ElementClickInterceptedException
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException, WebDriverException
 import time
 from datetime import datetime
 import pytz
 from pymongo import MongoClient
 
+from checkpoint import TrackerCheckpoint
+from concurrency import ConcurrentRunner, DeadlineExceeded
+from diffing import ChangeDetector, FixtureIndex
+from driver_pool import DriverPool, checkout_driver, release_driver
+from fetcher import HttpFetcher
+from live_stream import LiveBroker, StreamServer
+from live_watch import LiveWatcher
+from metrics import METRICS, MetricsServer
+from mongo_writer import BatchedWriter
+from normalize import normalize_snapshot, scrape_failed
+from parsing import ParsedPage, make_soup
+from prestart import PrestartSchedule
+from readiness import NO_DATA, READY, wait_for_quiet, wait_for_ready
+from scheduler import PollScheduler, STATE_INTERVALS, assess_match
+from sharding import MongoShardQueue, ShardWorker, publish_fixtures
+from static_cache import StaticTabCache
+from storage import CricketStore, match_id_from_url
+from tab_pool import TabPool
+
+CREX_BASE_URL = "https://crex.live"
+
+# Number of warm headless Chrome sessions kept by main(), and how many
+# pages each one serves before it is recycled.
+DRIVER_POOL_SIZE = 4
+DRIVER_MAX_PAGES = 50
+
+# With TABS_PER_BROWSER > 0, main() uses a TabPool instead: TAB_BROWSERS
+# Chrome sessions with up to TABS_PER_BROWSER tabs each (one per scrape or
+# watched match), which needs far less memory than one Chrome per session.
+TAB_BROWSERS = 2
+TABS_PER_BROWSER = 0
+
+# Live matches scraped in parallel per poll, and how long one match may
+# take before it is skipped for that cycle.
+LIVE_WORKERS = 4
+LIVE_MATCH_DEADLINE = 45
+
+# Pages loaded in parallel during the initial scrape, and how long a
+# single tab may take before it is recorded as "N/A".
+BOOTSTRAP_WORKERS = 4
+BOOTSTRAP_TAB_DEADLINE = 60
+
+# Stage timings are served at http://127.0.0.1:<METRICS_PORT>/metrics
+# (None disables the endpoint); METRICS_JSON_LOG, if set, is a file that
+# gets one JSON line per timed stage.
+METRICS_PORT = 9108
+METRICS_JSON_LOG = None
+
+# Live updates are pushed to readers as Server-Sent Events at
+# http://127.0.0.1:<STREAM_PORT>/stream (None disables the endpoint).
+STREAM_PORT = 9109
+
+# Live matches whose /live page stays open in its own session and is read
+# only when its DOM changes (0 reloads the page on every poll). Each one
+# holds a pool session, so keep it below DRIVER_POOL_SIZE. Watched pages
+# are read with _LIVE_JS, so this needs LIVE_IN_PAGE.
+WATCH_MATCHES = 0
+
+# Distributed mode (main(role=...)): a coordinator publishes the fixture
+# list by shard every COORDINATOR_INTERVAL seconds; workers re-read their
+# shards' lists every WORKER_LIST_REFRESH seconds (a cheap Mongo read).
+COORDINATOR_INTERVAL = 60
+WORKER_LIST_REFRESH = 15
+
+# Several roles can share a host: workers serve metrics and the stream on
+# free ports (0; the URLs are printed at start) and checkpoint to
+# TRACKER_CHECKPOINT with their worker ID added. The coordinator only
+# loads the fixture list: COORDINATOR_POOL_SIZE sessions, no stream.
+WORKER_METRICS_PORT = 0
+WORKER_STREAM_PORT = 0
+COORDINATOR_POOL_SIZE = 1
+
+# Info/squads already scraped are kept here across restarts (None keeps
+# them in memory only).
+STATIC_CACHE_DIR = "static_cache"
+
+# Tracker state is checkpointed here, so a restart resumes the tracked
+# matches and skips their initial scrape (None always starts cold).
+TRACKER_CHECKPOINT = "tracker_state.json"
+
 
 # ----------------------------------------------------------------------
 # 1) SCRAPE MAIN FIXTURE LIST (live, upcoming, concluded)
 # ----------------------------------------------------------------------
-def get_match_data():
+def get_match_data(pool=None, fetcher=None, base_url=CREX_BASE_URL):
     """
     Scrapes the main fixture list page (https://crex.live/fixtures/match-list).
     Returns three lists:
       - live_data: Info about currently live matches
       - upcoming_data: Info about future matches
       - concluded_data: Info about recently finished matches
+
+    If `pool` (a DriverPool) is given, a warm session is borrowed from it
+    instead of launching a new Chrome. If `fetcher` (an HttpFetcher) is
+    given, a plain HTTP GET is tried first and the browser is only used
+    when the match cards are not in the static HTML.
     """
-    webdriver_path = "chromedriver.exe"
-    service = Service(webdriver_path)
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
+    url = base_url + "/fixtures/match-list"
 
-    driver = webdriver.Chrome(service=service, options=options)
-    url = "https://crex.live/fixtures/match-list"
-    driver.get(url)
+    page_source = None
+    if fetcher is not None:
+        with METRICS.timer("http_fetch", tab="match_list"):
+            page_source = fetcher.fetch(url, required_classes=("match-card-container",))
 
+    if page_source is None:
+        driver = checkout_driver(pool)
+        broken = False
+        try:
+            with METRICS.timer("navigate", tab="match_list"):
+                driver.get(url)
+
+            # Wait for the match cards (fails fast if the list is empty)
+            outcome, _ = wait_for_ready(driver, "match_list")
+            if outcome not in (READY, NO_DATA):
+                raise TimeoutException("Fixture list did not load")
+            with METRICS.timer("page_source", tab="match_list"):
+                page_source = driver.page_source
+        except WebDriverException as exc:
+            # A crashed session is replaced, not handed out again
+            broken = not isinstance(exc, TimeoutException)
+            raise
+        finally:
+            release_driver(pool, driver, broken=broken)
+
+    with METRICS.timer("extract", exclusive=True, tab="match_list"):
+        return parse_match_list(page_source, base_url=base_url)
+
+
+def parse_match_list(page_source, base_url=CREX_BASE_URL):
+    """
+    Classifies every .match-card-container of the fixture list HTML into
+    (live_data, upcoming_data, concluded_data).
+    """
     live_data = []
     upcoming_data = []
     concluded_data = []
 
-    try:
-        # Wait up to 10 seconds for the match cards
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CLASS_NAME, "match-card-container"))
-        )
+    # Parse the page
+    page = ParsedPage(page_source)
+    matches = page.all("match-card-container")
+
+    for match in matches:
+        # 1) Check if match is LIVE
+        if match.find(class_="liveTag"):
+            link_tag = match.find("a", href=True)
+            href = base_url + link_tag["href"] if link_tag else ""
+
+            # Extract team info
+            teams_div = match.find_all("div", class_="team-info")
+            team_name = []
+            team_overs = []
+            team_scores = []
 
-        # Parse the page
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        matches = soup.find_all(class_="match-card-container")
+            for t_div in teams_div:
+                name_el = t_div.find(class_="team-name")
+                over_el = t_div.find(class_="total-overs")
+                score_el = t_div.find(class_="team-score")
 
-        for match in matches:
-            # 1) Check if match is LIVE
-            if match.find(class_="liveTag"):
+                name = name_el.text.strip() if name_el else "N/A"
+                over = over_el.text.strip() if over_el else "Yet to bat"
+                score = score_el.text.strip() if score_el else "N/A"
+
+                team_name.append(name)
+                team_overs.append(over)
+                team_scores.append(score)
+
+            live_data.append(
+                {
+                    "status": "Live",
+                    "name": team_name,
+                    "over": team_overs,
+                    "scores": team_scores,
+                    "link": href,
+                }
+            )
+
+        # 2) Check if match is UPCOMING
+        elif match.find(class_="not-started"):
+            link_tag = match.find("a", href=True)
+            href = base_url + link_tag["href"] if link_tag else ""
+
+            time_start_el = match.find(class_="start-text")
+            match_type_el = match.find(class_="time")
+
+            time_start = time_start_el.text.strip() if time_start_el else "N/A"
+            match_type = match_type_el.text.strip() if match_type_el else "N/A"
+
+            teams_div = match.find_all("div", class_="team-info")
+            team_name = []
+            for t_div in teams_div:
+                name_el = t_div.find(class_="team-name")
+                team_name.append(name_el.text.strip() if name_el else "N/A")
+
+            upcoming_data.append(
+                {
+                    "status": "Upcoming",
+                    "time_start": time_start,
+                    "type": match_type,
+                    "name": team_name,
+                    "link": href,
+                }
+            )
+
+        # 3) Otherwise, consider it CONCLUDED if there's a .result block
+        else:
+            result_div = match.find(class_="result")
+            if result_div:
                 link_tag = match.find("a", href=True)
-                href = "https://crex.live" + link_tag["href"] if link_tag else ""
+                href = base_url + link_tag["href"] if link_tag else ""
+
+                # Winner info in the .result <span>
+                winner_span = result_div.find("span")
+                winner_text = winner_span.text.strip() if winner_span else "N/A"
 
-                # Extract team info
+                # Reason or match info (like "4th T20, BPL 2024-25")
+                reason_span = result_div.find("span", class_="reason")
+                reason_text = reason_span.text.strip() if reason_span else "N/A"
+
+                # Extract final scores from both teams
                 teams_div = match.find_all("div", class_="team-info")
-                team_name = []
-                team_overs = []
+                team_names = []
                 team_scores = []
+                team_overs = []
 
                 for t_div in teams_div:
                     name_el = t_div.find(class_="team-name")
-                    over_el = t_div.find(class_="total-overs")
                     score_el = t_div.find(class_="team-score")
+                    over_el = t_div.find(class_="total-overs")
 
                     name = name_el.text.strip() if name_el else "N/A"
-                    over = over_el.text.strip() if over_el else "Yet to bat"
                     score = score_el.text.strip() if score_el else "N/A"
+                    overs = over_el.text.strip() if over_el else "N/A"
 
-                    team_name.append(name)
-                    team_overs.append(over)
+                    team_names.append(name)
                     team_scores.append(score)
+                    team_overs.append(overs)
 
-                live_data.append(
+                concluded_data.append(
                     {
-                        "status": "Live",
-                        "name": team_name,
-                        "over": team_overs,
+                        "status": "Concluded",
+                        "winner": winner_text,
+                        "reason": reason_text,
+                        "teams": team_names,
                         "scores": team_scores,
+                        "overs": team_overs,
                         "link": href,
                     }
                 )
-
-            # 2) Check if match is UPCOMING
-            elif match.find(class_="not-started"):
-                link_tag = match.find("a", href=True)
-                href = "https://crex.live" + link_tag["href"] if link_tag else ""
-
-                time_start_el = match.find(class_="start-text")
-                match_type_el = match.find(class_="time")
-
-                time_start = time_start_el.text.strip() if time_start_el else "N/A"
-                match_type = match_type_el.text.strip() if match_type_el else "N/A"
-
-                teams_div = match.find_all("div", class_="team-info")
-                team_name = []
-                for t_div in teams_div:
-                    name_el = t_div.find(class_="team-name")
-                    team_name.append(name_el.text.strip() if name_el else "N/A")
-
-                upcoming_data.append(
-                    {
-                        "status": "Upcoming",
-                        "time_start": time_start,
-                        "type": match_type,
-                        "name": team_name,
-                        "link": href,
-                    }
-                )
-
-            # 3) Otherwise, consider it CONCLUDED if there's a .result block
             else:
-                result_div = match.find(class_="result")
-                if result_div:
-                    link_tag = match.find("a", href=True)
-                    href = "https://crex.live" + link_tag["href"] if link_tag else ""
-
-                    # Winner info in the .result <span>
-                    winner_span = result_div.find("span")
-                    winner_text = winner_span.text.strip() if winner_span else "N/A"
-
-                    # Reason or match info (like "4th T20, BPL 2024-25")
-                    reason_span = result_div.find("span", class_="reason")
-                    reason_text = reason_span.text.strip() if reason_span else "N/A"
-
-                    # Extract final scores from both teams
-                    teams_div = match.find_all("div", class_="team-info")
-                    team_names = []
-                    team_scores = []
-                    team_overs = []
-
-                    for t_div in teams_div:
-                        name_el = t_div.find(class_="team-name")
-                        score_el = t_div.find(class_="team-score")
-                        over_el = t_div.find(class_="total-overs")
-
-                        name = name_el.text.strip() if name_el else "N/A"
-                        score = score_el.text.strip() if score_el else "N/A"
-                        overs = over_el.text.strip() if over_el else "N/A"
-
-                        team_names.append(name)
-                        team_scores.append(score)
-                        team_overs.append(overs)
-
-                    concluded_data.append(
-                        {
-                            "status": "Concluded",
-                            "winner": winner_text,
-                            "reason": reason_text,
-                            "teams": team_names,
-                            "scores": team_scores,
-                            "overs": team_overs,
-                            "link": href,
-                        }
-                    )
-                else:
-                    # If you want to handle any other edge case, do it here
-                    pass
-
-    finally:
-        driver.quit()
+                # If you want to handle any other edge case, do it here
+                pass
 
     return live_data, upcoming_data, concluded_data
 
@@ -170,107 +266,116 @@ def get_match_data():
 # ----------------------------------------------------------------------
 # 2) SCRAPE “MATCH INFO” TAB => /info
 # ----------------------------------------------------------------------
-def scrape_match_info(info_url):
+def scrape_match_info(info_url, pool=None, fetcher=None):
     """
     Scrapes data from the "Match Info" tab at (match_url + "/info").
     Typically includes toss, venue, series, date, etc.
+    Tries `fetcher` (plain HTTP) first when given, then the browser.
     """
-    webdriver_path = "chromedriver.exe"
-    service = Service(webdriver_path)
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
+    page_source = None
+    if fetcher is not None:
+        with METRICS.timer("http_fetch", tab="info"):
+            page_source = fetcher.fetch(info_url, required_classes=("match-info-card",))
+
+    if page_source is None:
+        driver = checkout_driver(pool)
+        broken = False
+        try:
+            with METRICS.timer("navigate", tab="info"):
+                driver.get(info_url)
 
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.get(info_url)
+            # Wait for .match-info-card and for the DOM to go quiet. If it
+            # never shows up (upcoming match or different layout) we still
+            # parse whatever is in the page.
+            wait_for_ready(driver, "info")
+
+            with METRICS.timer("page_source", tab="info"):
+                page_source = driver.page_source
 
-    try:
-        # Attempt to wait for .match-info-card
-        try:
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "match-info-card"))
-            )
         except TimeoutException:
-            # Possibly an upcoming match or different layout
-            # We'll still parse whatever is in the page:
-            pass
+            # If even the body didn't load in time
+            return {"Error": "Match Info page did not load in time."}
 
-        # We can also do a short sleep to ensure any dynamic content has loaded
-        time.sleep(2)
+        except WebDriverException:
+            broken = True
+            raise
 
-        soup = BeautifulSoup(driver.page_source, "html.parser")
+        finally:
+            release_driver(pool, driver, broken=broken)
 
-        match_venue_el = soup.find(class_="match-date match-venue")
-        match_venue = match_venue_el.text.strip() if match_venue_el else "N/A"
+    with METRICS.timer("extract", exclusive=True, tab="info"):
+        return parse_match_info(page_source)
 
-        match_date_el = soup.find(class_="match-info-date") or soup.find(
-            "div", class_="match-date"
-        )
-        match_date = match_date_el.text.strip() if match_date_el else "N/A"
 
-        teams_name = []
-        teams_el = soup.find_all(class_="form-team-name")
-        for team_el in teams_el:
-            teams_name.append(team_el.get_text(strip=True) if team_el else "N/A")
+def parse_match_info(page_source):
+    """
+    Extracts venue, toss, head-to-head and venue stats from /info HTML.
+    """
+    page = ParsedPage(page_source)
 
-        series_name_el = soup.find(class_="s-name")
-        series_name = series_name_el.text.strip() if series_name_el else "N/A"
+    match_venue_el = page.first("match-date match-venue")
+    match_venue = match_venue_el.text.strip() if match_venue_el else "N/A"
 
-        toss_el = soup.find(class_="toss-wrap")
-        if toss_el:
-            toss_p = toss_el.find("p")
-            toss_info = toss_p.get_text(strip=True) if toss_p else "N/A"
-        else:
-            toss_info = "N/A"
+    match_date_el = page.first("match-info-date") or page.first(
+        "match-date", name="div"
+    )
+    match_date = match_date_el.text.strip() if match_date_el else "N/A"
 
-        head_to_head = []
-        team1_wins_el = soup.find(class_="team1-wins")
-        team2_wins_el = soup.find(class_="team2-wins")
-        head_to_head.append(team1_wins_el.text if team1_wins_el else "N/A")
-        head_to_head.append(team2_wins_el.text if team2_wins_el else "N/A")
+    teams_name = []
+    teams_el = page.all("form-team-name")
+    for team_el in teams_el:
+        teams_name.append(team_el.get_text(strip=True) if team_el else "N/A")
 
-        match_result = []
-        matches = soup.find_all(class_="global-match-card gmc-without-logo")
-        for m in matches:
-            match_result.append(m.text.strip() if m else "N/A")
+    series_name_el = page.first("s-name")
+    series_name = series_name_el.text.strip() if series_name_el else "N/A"
 
-        table_el = soup.find(class_="table table-borderless colHeader")
-        table = table_el.text.strip() if table_el else "N/A"
+    toss_el = page.first("toss-wrap")
+    if toss_el:
+        toss_p = toss_el.find("p")
+        toss_info = toss_p.get_text(strip=True) if toss_p else "N/A"
+    else:
+        toss_info = "N/A"
 
-        venue_details_el = soup.find(class_="align-center weather-wrap")
-        venue_details = venue_details_el.text.strip() if venue_details_el else "N/A"
+    head_to_head = []
+    team1_wins_el = page.first("team1-wins")
+    team2_wins_el = page.first("team2-wins")
+    head_to_head.append(team1_wins_el.text if team1_wins_el else "N/A")
+    head_to_head.append(team2_wins_el.text if team2_wins_el else "N/A")
 
-        venue_stats_el = soup.find(class_="venue-left-wrapper")
-        venue_stats = venue_stats_el.text.strip() if venue_stats_el else "N/A"
+    match_result = []
+    matches = page.all("global-match-card gmc-without-logo")
+    for m in matches:
+        match_result.append(m.text.strip() if m else "N/A")
 
-        pace_vs_spin_on_venue_el = soup.find(class_="venue-pace-wrap")
-        pace_vs_spin_on_venue = (
-            pace_vs_spin_on_venue_el.text.strip() if pace_vs_spin_on_venue_el else "N/A"
-        )
+    table_el = page.first("table table-borderless colHeader")
+    table = table_el.text.strip() if table_el else "N/A"
 
-        match_info_data = {
-            "match_venue": match_venue,
-            "match_date": match_date,
-            "teams_name": teams_name,
-            "series_name": series_name,
-            "toss_info": toss_info,
-            "head_to_head": head_to_head,
-            "match_result": match_result,
-            "scorecard_table": table,
-            "venue_details": venue_details,
-            "venue_stats": venue_stats,
-            "pace_vs_spin_on_venue": pace_vs_spin_on_venue,
-        }
+    venue_details_el = page.first("align-center weather-wrap")
+    venue_details = venue_details_el.text.strip() if venue_details_el else "N/A"
 
-        return match_info_data
+    venue_stats_el = page.first("venue-left-wrapper")
+    venue_stats = venue_stats_el.text.strip() if venue_stats_el else "N/A"
 
-    except TimeoutException:
-        # If even the body didn't load in time
-        return {"Error": "Match Info page did not load in time."}
+    pace_vs_spin_on_venue_el = page.first("venue-pace-wrap")
+    pace_vs_spin_on_venue = (
+        pace_vs_spin_on_venue_el.text.strip() if pace_vs_spin_on_venue_el else "N/A"
+    )
 
-    finally:
-        driver.quit()
+    match_info_data = {
+        "match_venue": match_venue,
+        "match_date": match_date,
+        "teams_name": teams_name,
+        "series_name": series_name,
+        "toss_info": toss_info,
+        "head_to_head": head_to_head,
+        "match_result": match_result,
+        "scorecard_table": table,
+        "venue_details": venue_details,
+        "venue_stats": venue_stats,
+        "pace_vs_spin_on_venue": pace_vs_spin_on_venue,
+    }
+
+    return match_info_data
 
 
 # ----------------------------------------------------------------------
@@ -278,7 +383,128 @@ def scrape_match_info(info_url):
 # ----------------------------------------------------------------------
 
 
-def scrape_live_data(live_url, match_info=None):
+# In-page counterpart of parse_live_data(): same selectors and the same
+# text normalization (BeautifulSoup's get_text(strip=True) joins the
+# stripped text nodes), returned as one JSON object instead of shipping
+# driver.page_source over the wire. Returns null if the page has none of
+# the live containers.
+_LIVE_JS = """
+const text = function (el) {
+  if (!el) return '';
+  const parts = [];
+  const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+  while (walker.nextNode()) {
+    const t = walker.currentNode.nodeValue.trim();
+    if (t) parts.push(t);
+  }
+  return parts.join('');
+};
+const all = function (root, sel) { return Array.from(root.querySelectorAll(sel)); };
+const live = {batsmen: [], bowler: {}, overs_timeline: [], win_probability: 'N/A'};
+
+const wrapper = document.querySelector('div.playing-batsmen-wrapper');
+if (wrapper) {
+  all(wrapper, 'div.batsmen-partnership').forEach(function (div) {
+    const nameEl = div.querySelector('div.batsmen-name');
+    const strike = div.querySelector('div.player-strike-wrapper');
+    const bowler = div.querySelector('div.batsmen-score.bowler');
+    if (bowler) {
+      const p = all(bowler, 'p');
+      let economy = 'N/A';
+      const econ = strike && all(strike, 'span').find(function (span) {
+        return span.children.length === 0 && span.textContent.indexOf('Econ:') !== -1;
+      });
+      const econDiv = econ && econ.closest('div.strike-rate');
+      if (econDiv) {
+        const spans = all(econDiv, 'span');
+        if (spans.length >= 2) economy = text(spans[1]);
+      }
+      live.bowler = {
+        name: nameEl ? text(nameEl) : 'N/A',
+        figures: p.length > 0 ? text(p[0]) : 'N/A',
+        overs: p.length > 1 ? text(p[1]) : 'N/A',
+        economy: economy
+      };
+      return;
+    }
+    const nameP = nameEl && nameEl.querySelector('p');
+    const score = div.querySelector('div.batsmen-score');
+    let runs = '0', balls = '0', onStrike = false;
+    if (score) {
+      const p = all(score, 'p');
+      runs = p.length > 0 ? text(p[0]) : '0';
+      balls = (p.length > 1 ? text(p[1]) : '(0)').replace(/^[()]+|[()]+$/g, '');
+      onStrike = !!score.querySelector('div.circle-strike-icon');
+    }
+    const stats = {fours: '0', sixes: '0', sr: 'N/A'};
+    if (strike) {
+      all(strike, 'div.strike-rate').forEach(function (sdiv) {
+        const parts = text(sdiv).split(':');
+        if (parts.length !== 2) return;
+        const key = {'4s': 'fours', '6s': 'sixes', 'sr': 'sr'}[parts[0].toLowerCase()];
+        if (key) stats[key] = parts[1].trim();
+      });
+    }
+    live.batsmen.push({
+      name: nameP ? text(nameP) : 'N/A',
+      runs: runs, balls: balls,
+      fours: stats.fours, sixes: stats.sixes, sr: stats.sr,
+      on_strike: onStrike
+    });
+  });
+}
+
+const timeline = document.querySelector('div.overs-timeline');
+if (timeline) {
+  all(timeline, 'div.overs-slide').forEach(function (slide) {
+    const content = slide.querySelector('div.content');
+    if (!content) return;
+    const span = content.querySelector('span');
+    const balls = all(content, 'div[class*="over-ball"]').map(text).filter(function (t) {
+      return t.charAt(0) !== '=';
+    });
+    const total = text(content.querySelector('div.total'));
+    live.overs_timeline.push({
+      over_title: span ? text(span) : 'N/A',
+      balls: balls,
+      total: total ? total.split('=').join('').trim() : 'N/A'
+    });
+  });
+}
+
+const prob = document.querySelector('div.progressBarContainer');
+if (prob) {
+  const names = all(prob, 'div.teamNameScreenText');
+  const pcts = all(prob, 'div.percentageScreenText');
+  if (names.length >= 2 && pcts.length >= 2) {
+    live.win_probability = {};
+    live.win_probability[text(names[0])] = text(pcts[0]).split('%').join('');
+    live.win_probability[text(names[1])] = text(pcts[1]).split('%').join('');
+  }
+}
+return live;
+"""
+
+# True extracts the live tab in the page with _LIVE_JS instead of
+# transferring driver.page_source to parse_live_data(). Parity with the
+# parser is tested on the corpus by tests/test_live_extractor.py; False
+# also turns off watch mode (WATCH_MATCHES), which only reads _LIVE_JS
+LIVE_IN_PAGE = True
+
+
+def extract_live_in_page(driver):
+    """
+    Runs _LIVE_JS in the loaded /live page. Returns the same dictionary as
+    parse_live_data(), or None if the script could not run.
+    """
+    try:
+        live_data = driver.execute_script(_LIVE_JS)
+    except WebDriverException:
+        return None
+    return live_data if isinstance(live_data, dict) else None
+
+
+def scrape_live_data(live_url, match_info=None, pool=None, in_page=None):
     """
     Scrapes data from the "Live" tab for the given match URL.
     Uses the HTML structure from your snippet, extracting:
@@ -286,236 +512,250 @@ def scrape_live_data(live_url, match_info=None):
       - Current bowler (figures, overs, economy)
       - Over-by-over timeline
       - (Optional) Win probability
-    """
-    webdriver_path = "chromedriver.exe"
-    service = Service(webdriver_path)
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
 
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.get(live_url)
+    With in_page (default LIVE_IN_PAGE) the fields are extracted in the
+    browser by one script; if that fails the page source is parsed.
+    """
+    if in_page is None:
+        in_page = LIVE_IN_PAGE
+    driver = checkout_driver(pool)
+    broken = False
 
     try:
-        # First, try waiting for the main container .container.live-screen-wrap
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, ".container.live-screen-wrap")
-                )
-            )
-        except TimeoutException:
-            # If that fails, fallback to .live-container-wrapper
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located(
-                    (By.CLASS_NAME, "live-container-wrapper")
-                )
-            )
+        with METRICS.timer("navigate", tab="live"):
+            driver.get(live_url)
 
-        soup = BeautifulSoup(driver.page_source, "html.parser")
+        # Wait for .container.live-screen-wrap or .live-container-wrapper;
+        # bail out early if the page says the match has not started
+        outcome, _ = wait_for_ready(driver, "live")
+        if outcome != READY:
+            raise TimeoutException(f"Live container not found ({outcome})")
 
-        # Prepare output structure
-        live_data = {
-            "batsmen": [],
-            "bowler": {},
-            "overs_timeline": [],
-            "win_probability": "N/A",  # default if not found
-        }
+        if in_page:
+            with METRICS.timer("extract", tab="live"):
+                live_data = extract_live_in_page(driver)
+            if live_data is not None:
+                return live_data
 
-        # ----------------------------------------------------------------------
-        # 1) Parse Currently Batting (and Bowler)
-        # ----------------------------------------------------------------------
-        playing_batsmen_wrapper = soup.find("div", class_="playing-batsmen-wrapper")
-        if playing_batsmen_wrapper:
-            partnership_divs = playing_batsmen_wrapper.find_all(
-                "div", class_="batsmen-partnership"
-            )
+        with METRICS.timer("page_source", tab="live"):
+            page_source = driver.page_source
 
-            def parse_batsman_block(div):
-                """
-                Distinguish between a batsman block vs a bowler block
-                based on whether we find `class="batsmen-score bowler"`
-                or not.
-                """
-                # Check if it's the bowler block
-                bowler_info = div.find("div", class_="batsmen-score bowler")
-                if bowler_info:
-                    # BOWLER section
-                    name_el = div.find("div", class_="batsmen-name")
-                    bowler_name = name_el.get_text(strip=True) if name_el else "N/A"
-
-                    # Usually <p>1-35</p><p>(2.0)</p>
-                    p_tags = bowler_info.find_all("p")
-                    figures = (
-                        p_tags[0].get_text(strip=True) if len(p_tags) > 0 else "N/A"
-                    )
-                    overs = p_tags[1].get_text(strip=True) if len(p_tags) > 1 else "N/A"
-
-                    # Find economy
-                    econ_el = div.find("div", class_="player-strike-wrapper")
-                    economy = "N/A"
-                    if econ_el:
-                        # Look for <span>Econ:</span><span>17.50</span>
-                        econ_span = econ_el.find(
-                            "span", text=lambda t: t and "Econ:" in t
-                        )
-                        if econ_span:
-                            parent_div = econ_span.find_parent(
-                                "div", class_="strike-rate"
-                            )
-                            if parent_div:
-                                econ_vals = parent_div.find_all("span")
-                                # e.g. [" Econ: ", " 17.50 "]
-                                if len(econ_vals) >= 2:
-                                    economy = econ_vals[1].get_text(strip=True)
-
-                    return {
-                        "name": bowler_name,
-                        "figures": figures,  # e.g. "1-35"
-                        "overs": overs,  # e.g. "(2.0)"
-                        "economy": economy,  # e.g. "17.50"
-                    }
-                else:
-                    # BATSMAN section
-                    name_el = div.find("div", class_="batsmen-name")
-                    name_p = name_el.find("p") if name_el else None
-                    batter_name = name_p.get_text(strip=True) if name_p else "N/A"
-
-                    score_el = div.find("div", class_="batsmen-score")
-                    if score_el:
-                        p_tags = score_el.find_all("p")
-                        runs = (
-                            p_tags[0].get_text(strip=True) if len(p_tags) > 0 else "0"
-                        )
-                        balls_raw = (
-                            p_tags[1].get_text(strip=True) if len(p_tags) > 1 else "(0)"
-                        )
-                        balls = balls_raw.strip("()")
+    except TimeoutException:
+        print("Timeout: Could not find live container on the page.")
+        return {"live_data": "N/A"}
 
-                        # Is there a circle-strike-icon => on strike
-                        on_strike_icon = score_el.find(
-                            "div", class_="circle-strike-icon"
-                        )
-                        on_strike = True if on_strike_icon else False
-                    else:
-                        runs, balls, on_strike = "0", "0", False
-
-                    # Now parse 4s, 6s, SR
-                    wrapper_el = div.find("div", class_="player-strike-wrapper")
-                    fours, sixes, sr = "0", "0", "N/A"
-                    if wrapper_el:
-                        strike_rate_divs = wrapper_el.find_all(
-                            "div", class_="strike-rate"
-                        )
-                        for sdiv in strike_rate_divs:
-                            txt = sdiv.get_text(strip=True)
-                            # e.g. "4s: 2", "6s: 2", "SR: 300.00"
-                            if txt.lower().startswith("4s:"):
-                                _, val = txt.split(":")
-                                fours = val.strip()
-                            elif txt.lower().startswith("6s:"):
-                                _, val = txt.split(":")
-                                sixes = val.strip()
-                            elif txt.lower().startswith("sr:"):
-                                _, val = txt.split(":")
-                                sr = val.strip()
-
-                    return {
-                        "name": batter_name,
-                        "runs": runs,
-                        "balls": balls,
-                        "fours": fours,
-                        "sixes": sixes,
-                        "sr": sr,
-                        "on_strike": on_strike,
-                    }
+    except WebDriverException:
+        broken = True
+        raise
 
-            batsmen_parsed = []
-            bowler_parsed = {}
+    finally:
+        release_driver(pool, driver, broken=broken)
 
-            for partnership_div in partnership_divs:
-                parsed_block = parse_batsman_block(partnership_div)
-                if "figures" in parsed_block:  # means it's the bowler
-                    bowler_parsed = parsed_block
-                else:
-                    batsmen_parsed.append(parsed_block)
-
-            live_data["batsmen"] = batsmen_parsed
-            live_data["bowler"] = bowler_parsed
-
-        # ----------------------------------------------------------------------
-        # 2) Parse the overs timeline
-        # ----------------------------------------------------------------------
-        overs_timeline_div = soup.find("div", class_="overs-timeline")
-        if overs_timeline_div:
-            slides = overs_timeline_div.find_all("div", class_="overs-slide")
-            overs_list = []
-            for slide in slides:
-                content_div = slide.find("div", class_="content")
-                if not content_div:
-                    continue
+    with METRICS.timer("extract", exclusive=True, tab="live"):
+        return parse_live_data(page_source)
 
-                over_span = content_div.find("span")
-                over_title = over_span.get_text(strip=True) if over_span else "N/A"
 
-                # Gather each .over-ball
-                ball_divs = content_div.find_all(
-                    "div", class_=lambda c: c and "over-ball" in c
-                )
-                balls = []
-                for bd in ball_divs:
-                    txt = bd.get_text(strip=True)
-                    # skip if it starts with '=' (the total)
-                    if txt.startswith("="):
-                        continue
-                    balls.append(txt)
-
-                total_div = content_div.find("div", class_="total")
-                over_total_txt = total_div.get_text(strip=True) if total_div else ""
-                over_total = (
-                    over_total_txt.replace("=", "").strip() if over_total_txt else "N/A"
-                )
+def parse_live_data(page_source):
+    """
+    Extracts batsmen, bowler, overs timeline and win probability from
+    /live HTML.
+    """
+    page = ParsedPage(page_source)
+
+    # Prepare output structure
+    live_data = {
+        "batsmen": [],
+        "bowler": {},
+        "overs_timeline": [],
+        "win_probability": "N/A",  # default if not found
+    }
 
-                overs_list.append(
-                    {
-                        "over_title": over_title,
-                        "balls": balls,
-                        "total": over_total,
-                    }
+    # ----------------------------------------------------------------------
+    # 1) Parse Currently Batting (and Bowler)
+    # ----------------------------------------------------------------------
+    playing_batsmen_wrapper = page.first("playing-batsmen-wrapper", name="div")
+    if playing_batsmen_wrapper:
+        partnership_divs = playing_batsmen_wrapper.find_all(
+            "div", class_="batsmen-partnership"
+        )
+
+        def parse_batsman_block(div):
+            """
+            Distinguish between a batsman block vs a bowler block
+            based on whether we find `class="batsmen-score bowler"`
+            or not.
+            """
+            # Check if it's the bowler block
+            bowler_info = div.find("div", class_="batsmen-score bowler")
+            if bowler_info:
+                # BOWLER section
+                name_el = div.find("div", class_="batsmen-name")
+                bowler_name = name_el.get_text(strip=True) if name_el else "N/A"
+
+                # Usually <p>1-35</p><p>(2.0)</p>
+                p_tags = bowler_info.find_all("p")
+                figures = (
+                    p_tags[0].get_text(strip=True) if len(p_tags) > 0 else "N/A"
                 )
-            live_data["overs_timeline"] = overs_list
-
-        # ----------------------------------------------------------------------
-        # 3) (Optional) Parse Win Probability
-        # ----------------------------------------------------------------------
-        # If your site displays a progressBar or percentage bars, handle it here
-        prob_container = soup.find("div", class_="progressBarContainer")
-        if prob_container:
-            # Example logic if you see teamNameScreenText => team names
-            # and percentageScreenText => "84%", "16%"
-            # This code is illustrative; adjust to your actual markup if different
-            team_names = prob_container.find_all("div", class_="teamNameScreenText")
-            percents = prob_container.find_all("div", class_="percentageScreenText")
-            if len(team_names) >= 2 and len(percents) >= 2:
-                team1_name = team_names[0].get_text(strip=True)
-                team2_name = team_names[1].get_text(strip=True)
-                team1_pct = percents[0].get_text(strip=True).replace("%", "")
-                team2_pct = percents[1].get_text(strip=True).replace("%", "")
-
-                live_data["win_probability"] = {
-                    team1_name: team1_pct,
-                    team2_name: team2_pct,
+                overs = p_tags[1].get_text(strip=True) if len(p_tags) > 1 else "N/A"
+
+                # Find economy
+                econ_el = div.find("div", class_="player-strike-wrapper")
+                economy = "N/A"
+                if econ_el:
+                    # Look for <span>Econ:</span><span>17.50</span>
+                    econ_span = econ_el.find(
+                        "span", text=lambda t: t and "Econ:" in t
+                    )
+                    if econ_span:
+                        parent_div = econ_span.find_parent(
+                            "div", class_="strike-rate"
+                        )
+                        if parent_div:
+                            econ_vals = parent_div.find_all("span")
+                            # e.g. [" Econ: ", " 17.50 "]
+                            if len(econ_vals) >= 2:
+                                economy = econ_vals[1].get_text(strip=True)
+
+                return {
+                    "name": bowler_name,
+                    "figures": figures,  # e.g. "1-35"
+                    "overs": overs,  # e.g. "(2.0)"
+                    "economy": economy,  # e.g. "17.50"
+                }
+            else:
+                # BATSMAN section
+                name_el = div.find("div", class_="batsmen-name")
+                name_p = name_el.find("p") if name_el else None
+                batter_name = name_p.get_text(strip=True) if name_p else "N/A"
+
+                score_el = div.find("div", class_="batsmen-score")
+                if score_el:
+                    p_tags = score_el.find_all("p")
+                    runs = (
+                        p_tags[0].get_text(strip=True) if len(p_tags) > 0 else "0"
+                    )
+                    balls_raw = (
+                        p_tags[1].get_text(strip=True) if len(p_tags) > 1 else "(0)"
+                    )
+                    balls = balls_raw.strip("()")
+
+                    # Is there a circle-strike-icon => on strike
+                    on_strike_icon = score_el.find(
+                        "div", class_="circle-strike-icon"
+                    )
+                    on_strike = True if on_strike_icon else False
+                else:
+                    runs, balls, on_strike = "0", "0", False
+
+                # Now parse 4s, 6s, SR
+                wrapper_el = div.find("div", class_="player-strike-wrapper")
+                fours, sixes, sr = "0", "0", "N/A"
+                if wrapper_el:
+                    strike_rate_divs = wrapper_el.find_all(
+                        "div", class_="strike-rate"
+                    )
+                    for sdiv in strike_rate_divs:
+                        txt = sdiv.get_text(strip=True)
+                        # e.g. "4s: 2", "6s: 2", "SR: 300.00"
+                        if txt.lower().startswith("4s:"):
+                            _, val = txt.split(":")
+                            fours = val.strip()
+                        elif txt.lower().startswith("6s:"):
+                            _, val = txt.split(":")
+                            sixes = val.strip()
+                        elif txt.lower().startswith("sr:"):
+                            _, val = txt.split(":")
+                            sr = val.strip()
+
+                return {
+                    "name": batter_name,
+                    "runs": runs,
+                    "balls": balls,
+                    "fours": fours,
+                    "sixes": sixes,
+                    "sr": sr,
+                    "on_strike": on_strike,
                 }
 
-        return live_data
+        batsmen_parsed = []
+        bowler_parsed = {}
 
-    except TimeoutException:
-        print("Timeout: Could not find live container on the page.")
-        return {"live_data": "N/A"}
+        for partnership_div in partnership_divs:
+            parsed_block = parse_batsman_block(partnership_div)
+            if "figures" in parsed_block:  # means it's the bowler
+                bowler_parsed = parsed_block
+            else:
+                batsmen_parsed.append(parsed_block)
+
+        live_data["batsmen"] = batsmen_parsed
+        live_data["bowler"] = bowler_parsed
+
+    # ----------------------------------------------------------------------
+    # 2) Parse the overs timeline
+    # ----------------------------------------------------------------------
+    overs_timeline_div = page.first("overs-timeline", name="div")
+    if overs_timeline_div:
+        slides = overs_timeline_div.find_all("div", class_="overs-slide")
+        overs_list = []
+        for slide in slides:
+            content_div = slide.find("div", class_="content")
+            if not content_div:
+                continue
 
-    finally:
-        driver.quit()
+            over_span = content_div.find("span")
+            over_title = over_span.get_text(strip=True) if over_span else "N/A"
+
+            # Gather each .over-ball
+            ball_divs = content_div.find_all(
+                "div", class_=lambda c: c and "over-ball" in c
+            )
+            balls = []
+            for bd in ball_divs:
+                txt = bd.get_text(strip=True)
+                # skip if it starts with '=' (the total)
+                if txt.startswith("="):
+                    continue
+                balls.append(txt)
+
+            total_div = content_div.find("div", class_="total")
+            over_total_txt = total_div.get_text(strip=True) if total_div else ""
+            over_total = (
+                over_total_txt.replace("=", "").strip() if over_total_txt else "N/A"
+            )
+
+            overs_list.append(
+                {
+                    "over_title": over_title,
+                    "balls": balls,
+                    "total": over_total,
+                }
+            )
+        live_data["overs_timeline"] = overs_list
+
+    # ----------------------------------------------------------------------
+    # 3) (Optional) Parse Win Probability
+    # ----------------------------------------------------------------------
+    # If your site displays a progressBar or percentage bars, handle it here
+    prob_container = page.first("progressBarContainer", name="div")
+    if prob_container:
+        # Example logic if you see teamNameScreenText => team names
+        # and percentageScreenText => "84%", "16%"
+        # This code is illustrative; adjust to your actual markup if different
+        team_names = prob_container.find_all("div", class_="teamNameScreenText")
+        percents = prob_container.find_all("div", class_="percentageScreenText")
+        if len(team_names) >= 2 and len(percents) >= 2:
+            team1_name = team_names[0].get_text(strip=True)
+            team2_name = team_names[1].get_text(strip=True)
+            team1_pct = percents[0].get_text(strip=True).replace("%", "")
+            team2_pct = percents[1].get_text(strip=True).replace("%", "")
+
+            live_data["win_probability"] = {
+                team1_name: team1_pct,
+                team2_name: team2_pct,
+            }
+
+    return live_data
 
 
 # ----------------------------------------------------------------------
@@ -619,158 +859,304 @@ def scrape_fall_of_wickets(soup):
     return fall_of_wickets_data
 
 
-def get_scorecard_data(scorecard_url):
+def get_scorecard_data(scorecard_url, pool=None, fetcher=None):
     """
     Scrapes details from the "Scorecard" tab (match_url + "/scorecard").
     Extracts batting, bowling, fall of wickets, partnerships, and
     the 'Yet to bat' section.
+    Tries `fetcher` (plain HTTP) first when given, then the browser.
     """
-    webdriver_path = "chromedriver.exe"
-    service = Service(webdriver_path)
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
-
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.get(scorecard_url)
+    page_source = None
+    if fetcher is not None:
+        with METRICS.timer("http_fetch", tab="scorecard"):
+            page_source = fetcher.fetch(scorecard_url, required_classes=("score",))
+
+    if page_source is None:
+        driver = checkout_driver(pool)
+        broken = False
+        try:
+            with METRICS.timer("navigate", tab="scorecard"):
+                driver.get(scorecard_url)
 
-    try:
-        # Wait for the scorecard page to load
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CLASS_NAME, "score"))
-        )
+            # Wait for the scorecard page to load
+            outcome, _ = wait_for_ready(driver, "scorecard")
+            if outcome != READY:
+                raise TimeoutException(f"Scorecard not found ({outcome})")
 
-        soup = BeautifulSoup(driver.page_source, "html.parser")
+            with METRICS.timer("page_source", tab="scorecard"):
+                page_source = driver.page_source
 
-        scorecard_data = {
-            "batting": [],
-            "bowling": [],
-            "fall_of_wickets": [],
-            "partnerships": [],
-            "yet_to_bat": [],  # NEW KEY FOR STORING 'YET TO BAT' PLAYERS
-        }
+        except TimeoutException:
+            return {"Error": "Scorecard not available or match not started."}
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            release_driver(pool, driver, broken=broken)
 
-        # ----------------------------------------------------------------
-        # 1) SCRAPE BATTING & BOWLING SECTIONS
-        # ----------------------------------------------------------------
-        table_headings = soup.find_all("div", class_="table-heading")
-        for table_heading in table_headings:
-            heading_text_el = table_heading.find("h3")
-            if not heading_text_el:
-                continue
-            heading_text = heading_text_el.text.strip().lower()
+    with METRICS.timer("extract", exclusive=True, tab="scorecard"):
+        return parse_scorecard(page_source)
 
-            # Find the next sibling div containing the score-card
-            score_card = table_heading.find_next_sibling(
-                "div", class_="card score-card"
-            )
-            if not score_card:
-                continue
 
-            score_table = score_card.find("table", class_="bowler-table")
-            if not score_table:
-                continue
+def parse_scorecard(page_source):
+    """
+    Extracts batting, bowling, yet-to-bat, fall of wickets and
+    partnerships from /scorecard HTML.
+    """
+    page = ParsedPage(page_source)
+    soup = page.soup
+
+    scorecard_data = {
+        "batting": [],
+        "bowling": [],
+        "fall_of_wickets": [],
+        "partnerships": [],
+        "yet_to_bat": [],  # NEW KEY FOR STORING 'YET TO BAT' PLAYERS
+    }
 
-            rows = score_table.find("tbody").find_all("tr")
-            section_data = []
-
-            # Identify batting or bowling by heading text
-            if heading_text == "batting":
-                for row in rows:
-                    cells = row.find_all("td")
-                    if len(cells) >= 6:
-                        section_data.append(
-                            {
-                                "batter": cells[0]
-                                .find("span", class_="player-name")
-                                .text.strip(),
-                                "runs": cells[1].text.strip(),
-                                "balls": cells[2].text.strip(),
-                                "fours": cells[3].text.strip(),
-                                "sixes": cells[4].text.strip(),
-                                "strike_rate": cells[5].text.strip(),
-                            }
-                        )
-                scorecard_data["batting"].append(section_data)
-
-            elif heading_text == "bowling":
-                for row in rows:
-                    cells = row.find_all("td")
-                    if len(cells) >= 6:
-                        section_data.append(
-                            {
-                                "bowler": cells[0]
-                                .find("span", class_="player-name")
-                                .text.strip(),
-                                "overs": cells[1].text.strip(),
-                                "maidens": cells[2].text.strip(),
-                                "runs_conceded": cells[3].text.strip(),
-                                "wickets": cells[4].text.strip(),
-                                "economy": cells[5].text.strip(),
-                            }
-                        )
-                scorecard_data["bowling"].append(section_data)
+    # ----------------------------------------------------------------
+    # 1) SCRAPE BATTING & BOWLING SECTIONS
+    # ----------------------------------------------------------------
+    table_headings = page.all("table-heading", name="div")
+    for table_heading in table_headings:
+        heading_text_el = table_heading.find("h3")
+        if not heading_text_el:
+            continue
+        heading_text = heading_text_el.text.strip().lower()
 
-        # ----------------------------------------------------------------
-        # 2) SCRAPE THE 'YET TO BAT' SECTION
-        # ----------------------------------------------------------------
-        yet_to_bat_heading = soup.find(
-            "h3", text=lambda t: t and "yet to bat" in t.lower()
+        # Find the next sibling div containing the score-card
+        score_card = table_heading.find_next_sibling(
+            "div", class_="card score-card"
         )
-        if yet_to_bat_heading:
-            # Find the next container that holds the 'yet-to-bat' players
-            yet_to_bat_wrapper = yet_to_bat_heading.find_next(
-                "div", class_="yet-to-bat"
-            )
-            if yet_to_bat_wrapper:
-                # Each player entry seems to be under 'div.custom-width > div.content'
-                player_divs = yet_to_bat_wrapper.find_all("div", class_="content")
-                for player_div in player_divs:
-                    # Extract player name
-                    name_div = player_div.find("div", class_="name")
-                    player_name = name_div.text.strip() if name_div else "N/A"
-
-                    # Optional: extract batting average (or any other info)
-                    # In your snippet, it looks like: <p>Avg: <span>0.00</span></p>
-                    avg_p = player_div.find("p")
-                    # E.g. "Avg: 0.00" => you can parse the exact text if you prefer
-                    # Or just store the entire text in a single field
-                    avg_text = "N/A"
-                    if avg_p:
-                        avg_span = avg_p.find("span")
-                        if avg_span:
-                            avg_text = avg_span.text.strip() or "N/A"
-
-                    scorecard_data["yet_to_bat"].append(
+        if not score_card:
+            continue
+
+        score_table = score_card.find("table", class_="bowler-table")
+        if not score_table:
+            continue
+
+        rows = score_table.find("tbody").find_all("tr")
+        section_data = []
+
+        # Identify batting or bowling by heading text
+        if heading_text == "batting":
+            for row in rows:
+                cells = row.find_all("td")
+                if len(cells) >= 6:
+                    section_data.append(
                         {
-                            "name": player_name,
-                            "average": avg_text,  # or any other detail
+                            "batter": cells[0]
+                            .find("span", class_="player-name")
+                            .text.strip(),
+                            "runs": cells[1].text.strip(),
+                            "balls": cells[2].text.strip(),
+                            "fours": cells[3].text.strip(),
+                            "sixes": cells[4].text.strip(),
+                            "strike_rate": cells[5].text.strip(),
                         }
                     )
+            scorecard_data["batting"].append(section_data)
 
-        # ----------------------------------------------------------------
-        # 3) SCRAPE FALL OF WICKETS
-        # ----------------------------------------------------------------
-        scorecard_data["fall_of_wickets"] = scrape_fall_of_wickets(soup)
+        elif heading_text == "bowling":
+            for row in rows:
+                cells = row.find_all("td")
+                if len(cells) >= 6:
+                    section_data.append(
+                        {
+                            "bowler": cells[0]
+                            .find("span", class_="player-name")
+                            .text.strip(),
+                            "overs": cells[1].text.strip(),
+                            "maidens": cells[2].text.strip(),
+                            "runs_conceded": cells[3].text.strip(),
+                            "wickets": cells[4].text.strip(),
+                            "economy": cells[5].text.strip(),
+                        }
+                    )
+            scorecard_data["bowling"].append(section_data)
+
+    # ----------------------------------------------------------------
+    # 2) SCRAPE THE 'YET TO BAT' SECTION
+    # ----------------------------------------------------------------
+    yet_to_bat_heading = soup.find(
+        "h3", text=lambda t: t and "yet to bat" in t.lower()
+    )
+    if yet_to_bat_heading:
+        # Find the next container that holds the 'yet-to-bat' players
+        yet_to_bat_wrapper = yet_to_bat_heading.find_next(
+            "div", class_="yet-to-bat"
+        )
+        if yet_to_bat_wrapper:
+            # Each player entry seems to be under 'div.custom-width > div.content'
+            player_divs = yet_to_bat_wrapper.find_all("div", class_="content")
+            for player_div in player_divs:
+                # Extract player name
+                name_div = player_div.find("div", class_="name")
+                player_name = name_div.text.strip() if name_div else "N/A"
+
+                # Optional: extract batting average (or any other info)
+                # In your snippet, it looks like: <p>Avg: <span>0.00</span></p>
+                avg_p = player_div.find("p")
+                # E.g. "Avg: 0.00" => you can parse the exact text if you prefer
+                # Or just store the entire text in a single field
+                avg_text = "N/A"
+                if avg_p:
+                    avg_span = avg_p.find("span")
+                    if avg_span:
+                        avg_text = avg_span.text.strip() or "N/A"
+
+                scorecard_data["yet_to_bat"].append(
+                    {
+                        "name": player_name,
+                        "average": avg_text,  # or any other detail
+                    }
+                )
 
-        # ----------------------------------------------------------------
-        # 4) SCRAPE PARTNERSHIPS
-        # ----------------------------------------------------------------
-        scorecard_data["partnerships"] = scrape_partnerships(soup)
+    # ----------------------------------------------------------------
+    # 3) SCRAPE FALL OF WICKETS
+    # ----------------------------------------------------------------
+    scorecard_data["fall_of_wickets"] = scrape_fall_of_wickets(soup)
 
-        return scorecard_data
+    # ----------------------------------------------------------------
+    # 4) SCRAPE PARTNERSHIPS
+    # ----------------------------------------------------------------
+    scorecard_data["partnerships"] = scrape_partnerships(soup)
 
-    except TimeoutException:
-        return {"Error": "Scorecard not available or match not started."}
-    finally:
-        driver.quit()
+    return scorecard_data
 
 
 # ----------------------------------------------------------------------
 # 5) SCRAPE “SQUADS” => /squads (with button clicks)
 # ----------------------------------------------------------------------
-def scrape_squads_with_clicks(match_url):
+# One round trip for every team: clicks each team button in the page,
+# waits a frame for the tab to re-render and reads the rows, so nothing
+# is re-serialized or re-parsed on the Python side. Returns null if the
+# panel is missing or the script fails. Selectors and text handling
+# mirror _squads_by_clicking() and parse_squad_rows(): a row's text is
+# BeautifulSoup's get_text(strip=True) (the stripped text nodes, joined),
+# a team's name the button's rendered text, like WebElement.text.
+_SQUADS_JS = """
+const done = arguments[arguments.length - 1];
+const wrapper = document.querySelector('.info-right-wrapper');
+if (!wrapper) { done(null); return; }
+const text = function (el) {
+  if (!el) return 'N/A';
+  const parts = [];
+  const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+  while (walker.nextNode()) {
+    const t = walker.currentNode.nodeValue.trim();
+    if (t) parts.push(t);
+  }
+  return parts.join('');
+};
+const rows = function (card) {
+  if (!card) return [];
+  return Array.from(card.querySelectorAll('div.playingxi-card-row')).map(function (row) {
+    return {
+      player_name: text(row.querySelector('div.p-name')),
+      player_type: text(row.querySelector('div.bat-ball-type'))
+    };
+  });
+};
+const nextFrame = function () {
+  return new Promise(function (resolve) {
+    requestAnimationFrame(function () { setTimeout(resolve, 0); });
+  });
+};
+(async function () {
+  const teams = [];
+  for (const btn of document.querySelectorAll('.playingxi-button')) {
+    btn.click();
+    await nextFrame();
+    teams.push({
+      team_name: btn.innerText.trim(),
+      playing_11: rows(wrapper.querySelector('div.playingxi-card')),
+      on_bench: rows(wrapper.querySelector('div[class="playingxi-card on-bench-wrap"]'))
+    });
+  }
+  done(teams);
+})().catch(function () { done(null); });
+"""
+
+# True reads squads with _SQUADS_JS instead of clicking each team button
+# from Python and re-parsing the panel after every click (falls back to
+# clicking if the script fails). Parity with the clicking path is tested
+# on the corpus by tests/test_squads_extractor.py
+SQUADS_SINGLE_PASS = True
+
+
+def parse_squad_rows(card):
+    """Players ({"player_name", "player_type"}) of one .playingxi-card."""
+    players = []
+    if card:
+        for row in card.find_all("div", class_="playingxi-card-row"):
+            name_div = row.find("div", class_="p-name")
+            type_div = row.find("div", class_="bat-ball-type")
+            players.append(
+                {
+                    "player_name": name_div.get_text(strip=True) if name_div else "N/A",
+                    "player_type": type_div.get_text(strip=True) if type_div else "N/A",
+                }
+            )
+    return players
+
+
+def extract_squads_in_page(driver):
+    """
+    Every team's playing XI and bench from the loaded page in a single
+    injected script. Returns the list of teams, or None if the script
+    could not run (caller falls back to clicking).
+    """
+    try:
+        teams = driver.execute_async_script(_SQUADS_JS)
+    except WebDriverException:
+        return None
+    return teams if isinstance(teams, list) else None
+
+
+def _squads_by_clicking(driver):
+    """
+    Clicks each team button and parses the squads panel after each click.
+    """
+    team_buttons = driver.find_elements(By.CLASS_NAME, "playingxi-button")
+
+    all_teams = []
+
+    # Click each team button to reveal the squads
+    for btn in team_buttons:
+        team_name = btn.text.strip()
+
+        # Use JavaScript click
+        try:
+            driver.execute_script("arguments[0].click();", btn)
+        except ElementClickInterceptedException:
+            driver.execute_script("arguments[0].scrollIntoView(true);", btn)
+            wait_for_quiet(driver, timeout=1)
+            driver.execute_script("arguments[0].click();", btn)
+
+        # Grab the updated squads panel only (not the whole page)
+        with METRICS.timer("page_source", tab="squads"):
+            page_content = driver.find_element(
+                By.CLASS_NAME, "info-right-wrapper"
+            ).get_attribute("outerHTML")
+        soup = make_soup(page_content)
+
+        # Identify containers for playing XI vs bench
+        playing_div = soup.find("div", class_="playingxi-card")
+        bench_div = soup.find("div", class_="playingxi-card on-bench-wrap")
+
+        all_teams.append(
+            {
+                "team_name": team_name,
+                "playing_11": parse_squad_rows(playing_div),
+                "on_bench": parse_squad_rows(bench_div),
+            }
+        )
+
+    return all_teams
+
+
+def scrape_squads(match_url, pool=None, single_pass=None):
     """
     Scrapes the squads via /squads.
     Within .info-right-wrapper there are:
@@ -778,113 +1164,59 @@ def scrape_squads_with_clicks(match_url):
       - 'playingxi-card' containers for playing XI
       - 'playingxi-card on-bench-wrap' containers for bench
       - Rows with class 'playingxi-card-row', each containing .p-name and .bat-ball-type
+
+    With single_pass (default SQUADS_SINGLE_PASS) all teams are read by
+    one injected script; otherwise, or if that fails, button by button.
     """
-    webdriver_path = "chromedriver.exe"
-    service = Service(webdriver_path)
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
-
-    driver = webdriver.Chrome(service=service, options=options)
+    if single_pass is None:
+        single_pass = SQUADS_SINGLE_PASS
+    driver = checkout_driver(pool)
+    broken = False
     squads_url = match_url
-    driver.get(squads_url)
 
     data = {}
 
     try:
-        # Wait for .info-right-wrapper
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.CLASS_NAME, "info-right-wrapper"))
-        )
+        with METRICS.timer("navigate", tab="squads"):
+            driver.get(squads_url)
 
-        # Wait for the team buttons
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_all_elements_located((By.CLASS_NAME, "playingxi-button"))
-        )
-
-        try:
-            team_buttons = driver.find_elements(By.CLASS_NAME, "playingxi-button")
-        except TimeoutException:
+        # Wait for the team buttons inside .info-right-wrapper
+        outcome, _ = wait_for_ready(driver, "squads")
+        if outcome != READY:
             return {"squads": "N/A"}
 
-        all_teams = []
-
-        # Click each team button to reveal the squads
-        for btn in team_buttons:
-            team_name = btn.text.strip()
-
-            # Use JavaScript click
-            try:
-                driver.execute_script("arguments[0].click();", btn)
-            except ElementClickInterceptedException:
-                driver.execute_script("arguments[0].scrollIntoView(true);", btn)
-                time.sleep(1)
-                driver.execute_script("arguments[0].click();", btn)
-
-            # Grab updated DOM
-            page_content = driver.page_source
-            soup = BeautifulSoup(page_content, "html.parser")
-
-            # Identify containers for playing XI vs bench
-            playing_div = soup.find("div", class_="playingxi-card")
-            bench_div = soup.find("div", class_="playingxi-card on-bench-wrap")
-
-            playing_players = []
-            if playing_div:
-                rows = playing_div.find_all("div", class_="playingxi-card-row")
-                for row in rows:
-                    name_div = row.find("div", class_="p-name")
-                    type_div = row.find("div", class_="bat-ball-type")
-                    player_name = name_div.get_text(strip=True) if name_div else "N/A"
-                    player_type = type_div.get_text(strip=True) if type_div else "N/A"
-                    playing_players.append(
-                        {
-                            "player_name": player_name,
-                            "player_type": player_type,
-                        }
-                    )
-
-            bench_players = []
-            if bench_div:
-                rows = bench_div.find_all("div", class_="playingxi-card-row")
-                for row in rows:
-                    name_div = row.find("div", class_="p-name")
-                    type_div = row.find("div", class_="bat-ball-type")
-                    player_name = name_div.get_text(strip=True) if name_div else "N/A"
-                    player_type = type_div.get_text(strip=True) if type_div else "N/A"
-                    bench_players.append(
-                        {
-                            "player_name": player_name,
-                            "player_type": player_type,
-                        }
-                    )
-
-            all_teams.append(
-                {
-                    "team_name": team_name,
-                    "playing_11": playing_players,
-                    "on_bench": bench_players,
-                }
-            )
+        all_teams = None
+        if single_pass:
+            with METRICS.timer("extract", tab="squads"):
+                all_teams = extract_squads_in_page(driver)
+        if all_teams is None:
+            all_teams = _squads_by_clicking(driver)
 
         data["squads"] = all_teams if all_teams else "N/A"
 
+    except WebDriverException as exc:
+        broken = not isinstance(exc, TimeoutException)
+        raise
+
     finally:
-        driver.quit()
+        release_driver(pool, driver, broken=broken)
 
     return data
 
 
+def scrape_squads_with_clicks(match_url, pool=None):
+    """Squads by clicking each team button (no injected script)."""
+    return scrape_squads(match_url, pool=pool, single_pass=False)
+
+
 # ----------------------------------------------------------------------
 # Example usage (NOT scheduling, just direct calls)
 # ----------------------------------------------------------------------
-def scrape_all_tabs_for_match(match_dict):
+def build_tab_urls(link):
     """
-    Build the /info, /squads, /live, /scorecard URLs, scrape each tab,
-    and return a structured dictionary with all the data.
+    Builds the /info, /squads, /live, /scorecard URLs for a match link.
     """
-    original_url = match_dict["link"]
+    original_url = link
 
     # Remove '/live' or '/info' from the end of the URL if present
     if original_url.endswith("/live"):
@@ -894,22 +1226,51 @@ def scrape_all_tabs_for_match(match_dict):
     else:
         base_url = original_url
 
-    # Build tab URLs
     info_url = base_url + "/info"
-    squads_url = info_url  # or base_url + "/squads" if your site uses that structure
-    live_url = base_url + "/live"
-    scorecard_url = base_url + "/scorecard"
+    return {
+        "info": info_url,
+        "squads": info_url,  # or base_url + "/squads" if your site uses that structure
+        "live": base_url + "/live",
+        "scorecard": base_url + "/scorecard",
+    }
 
-    # Attempt scraping each tab
-    info_data = scrape_match_info(info_url)
 
-    try:
-        squads_data = scrape_squads_with_clicks(squads_url)
-    except TimeoutException:
-        squads_data = "N/A"
+def scrape_tab(tab, url, pool=None, fetcher=None, cache=None):
+    """
+    Scrapes a single tab ("info", "squads", "live" or "scorecard").
+    With a StaticTabCache, the static tabs (info, squads) are served from
+    the cache while fresh and stored there after a scrape.
+    """
+    match_id = match_id_from_url(url)
+    if cache is not None and tab in cache.tabs:
+        return scrape_static_tab(tab, url, cache, pool=pool, fetcher=fetcher)[0]
+
+    with METRICS.timer("tab_total", tab=tab, match=match_id):
+        if tab == "info":
+            return scrape_match_info(url, pool=pool, fetcher=fetcher)
+        if tab == "squads":
+            try:
+                return scrape_squads(url, pool=pool)
+            except TimeoutException:
+                return "N/A"
+        if tab == "live":
+            return scrape_live_data(url, pool=pool)
+        if tab == "scorecard":
+            return get_scorecard_data(url, pool=pool, fetcher=fetcher)
+    raise ValueError(f"Unknown tab: {tab}")
+
 
-    live_data_res = scrape_live_data(live_url, match_info=info_data)
-    scorecard_data_res = get_scorecard_data(scorecard_url)
+TABS = ("info", "squads", "live", "scorecard")
+
+
+def build_match_record(match_dict, tab_results):
+    """
+    Prints the scraped tabs and returns the structured per-match dictionary.
+    """
+    info_data = tab_results.get("info", "N/A")
+    squads_data = tab_results.get("squads", "N/A")
+    live_data_res = tab_results.get("live", "N/A")
+    scorecard_data_res = tab_results.get("scorecard", "N/A")
 
     # Print for clarity in the console
     print("\nMatch:", match_dict.get("name"))
@@ -932,146 +1293,933 @@ def scrape_all_tabs_for_match(match_dict):
     }
 
 
-def real_time_scraping_loop(poll_interval=60, db_collection=None):
+def scrape_all_tabs_for_match(match_dict, pool=None, fetcher=None, cache=None):
+    """
+    Build the /info, /squads, /live, /scorecard URLs, scrape each tab,
+    and return a structured dictionary with all the data. Info and squads
+    come from `cache` (StaticTabCache) when it has them.
+    """
+    urls = build_tab_urls(match_dict["link"])
+
+    # Attempt scraping each tab
+    with METRICS.timer("match_total", match=match_id_from_url(match_dict["link"])):
+        tab_results = {
+            tab: scrape_tab(tab, urls[tab], pool=pool, fetcher=fetcher, cache=cache)
+            for tab in TABS
+        }
+
+    return build_match_record(match_dict, tab_results)
+
+
+# ----------------------------------------------------------------------
+# PARALLEL BOOTSTRAP (fan out across matches AND tabs)
+# ----------------------------------------------------------------------
+def bootstrap_matches(
+    matches_by_category, runner, pool=None, fetcher=None, on_match_done=None,
+    cache=None,
+):
+    """
+    Scrapes every tab of every match as independent jobs on `runner`, so
+    one slow page only delays its own match.
+
+    Args:
+      matches_by_category (dict): e.g. {"live": [...], "upcoming": [...]}
+      runner (ConcurrentRunner): bounds how many pages load at once
+      pool (DriverPool): browser sessions for the scrapers
+      fetcher (HttpFetcher): optional HTTP path tried before the browser
+      on_match_done (callable): on_match_done(category, record), called as
+        soon as all four tabs of a match are finished (or failed)
+      cache (StaticTabCache): optional; info/squads found there are not
+        scraped again (e.g. after a restart)
+
+    Returns:
+      dict category -> list of match records (in the original order)
+    """
+    jobs = {}
+    pending_tabs = {}
+    tab_results = {}
+    records = {category: [None] * len(ms) for category, ms in matches_by_category.items()}
+
+    for category, matches in matches_by_category.items():
+        for idx, match_dict in enumerate(matches):
+            urls = build_tab_urls(match_dict["link"])
+            pending_tabs[(category, idx)] = len(TABS)
+            tab_results[(category, idx)] = {}
+            for tab in TABS:
+                jobs[(category, idx, tab)] = (
+                    lambda cancel, tab=tab, url=urls[tab]: scrape_tab(
+                        tab, url, pool=pool, fetcher=fetcher, cache=cache
+                    )
+                )
+
+    total_matches = len(pending_tabs)
+    finished = [0]
+
+    def handle_result(key, result, error):
+        category, idx, tab = key
+        if error is not None:
+            print(f"[bootstrap] {tab} tab failed for {category}[{idx}]: {error!r}")
+            result = "N/A"
+        tab_results[(category, idx)][tab] = result
+        pending_tabs[(category, idx)] -= 1
+
+        if pending_tabs[(category, idx)] == 0:
+            match_dict = matches_by_category[category][idx]
+            record = build_match_record(match_dict, tab_results.pop((category, idx)))
+            records[category][idx] = record
+            finished[0] += 1
+            print(f"[bootstrap] {finished[0]}/{total_matches} matches done")
+            if on_match_done is not None:
+                on_match_done(category, record)
+
+    runner.run(jobs, on_result=handle_result)
+    return records
+
+
+def tab_loaded(data):
+    """
+    Whether a scrape_tab() result holds any data, rather than an error or
+    only "N/A" placeholders and empty lists (page loaded without content).
+    """
+    if isinstance(data, dict):
+        return "Error" not in data and any(tab_loaded(v) for v in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(tab_loaded(v) for v in data)
+    return data not in (None, "", "N/A")
+
+
+def record_scraped(category, record):
+    """
+    Whether an initial scrape produced a snapshot: the info tab, plus the
+    live or scorecard tab for matches that have started.
+    """
+    if not tab_loaded(record["info_data"]):
+        return False
+    return category == "upcoming" or (
+        tab_loaded(record["live_data"]) or tab_loaded(record["scorecard_data"])
+    )
+
+
+def scrape_static_tab(tab, url, cache, pool=None, fetcher=None):
+    """
+    scrape_tab() for a tab kept in `cache` (StaticTabCache): served from
+    it while fresh, stored there after a scrape. Returns (data, changed),
+    changed being False on a cache hit, for a failed scrape and when the
+    scraped content hashes the same as the cached copy.
+    """
+    match_id = match_id_from_url(url)
+    cached = cache.get(match_id, tab)
+    if cached is not None:
+        return cached, False
+    result = scrape_tab(tab, url, pool=pool, fetcher=fetcher)
+    return result, cache.put(match_id, tab, result)
+
+
+def prefetch_static_tabs(match_dict, pool=None, fetcher=None, cache=None, cancel_event=None):
+    """
+    Scrapes the tabs that do not change once play starts (info and
+    squads) for an upcoming match. Returns (info_data, squads_data,
+    changed), changed telling whether either tab differs from the cached
+    copy (always True without a cache). If `cancel_event` is set after
+    the info tab, squads are skipped.
+    """
+    urls = build_tab_urls(match_dict["link"])
+
+    def scrape(tab):
+        if cache is None:
+            return scrape_tab(tab, urls[tab], pool=pool, fetcher=fetcher), True
+        return scrape_static_tab(tab, urls[tab], cache, pool=pool, fetcher=fetcher)
+
+    info_data, info_changed = scrape("info")
+    if cancel_event is not None and cancel_event.is_set():
+        raise DeadlineExceeded(match_dict["link"])
+    squads_data, squads_changed = scrape("squads")
+    return info_data, squads_data, info_changed or squads_changed
+
+
+def scrape_tracked_match(link, pool=None, cancel_event=None, fetcher=None, watcher=None):
+    """
+    Scrapes the /live and /scorecard tabs for one tracked match.
+    Returns (live_data, scorecard_data). If `cancel_event` is set after
+    the live tab (deadline passed), the scorecard is skipped.
+
+    With a LiveWatcher that has room for the match, the /live page stays
+    open and is only read when its DOM changed; returns None (nothing
+    scraped) if it did not.
+    """
+    # Build live/scorecard URLs
+    live_url = link
+    if live_url.endswith("/info"):
+        live_url = live_url.rsplit("/info", 1)[0] + "/live"
+    if live_url.endswith("/scorecard"):
+        live_url = live_url.rsplit("/scorecard", 1)[0] + "/live"
+    scorecard_url = live_url.rsplit("/live", 1)[0] + "/scorecard"
+
+    # Scrape
+    with METRICS.timer("match_total", match=match_id_from_url(link)):
+        with METRICS.timer("tab_total", tab="live"):
+            live_data_res = LiveWatcher.NOT_WATCHED
+            if watcher is not None:
+                live_data_res = watcher.poll(link, live_url)
+                if live_data_res is None:
+                    return None
+            if live_data_res is LiveWatcher.NOT_WATCHED:
+                live_data_res = scrape_live_data(live_url, pool=pool)
+        if cancel_event is not None and cancel_event.is_set():
+            raise DeadlineExceeded(link)
+        with METRICS.timer("tab_total", tab="scorecard"):
+            scorecard_data_res = get_scorecard_data(scorecard_url, pool=pool, fetcher=fetcher)
+
+    return live_data_res, scorecard_data_res
+
+
+def real_time_scraping_loop(
+    poll_interval=60,
+    db_collection=None,
+    pool=None,
+    max_workers=1,
+    match_deadline=None,
+    fetcher=None,
+    writer=None,
+    store=None,
+    base_url=CREX_BASE_URL,
+    max_cycles=None,
+    scheduler=None,
+    prestart=None,
+    cache=None,
+    watcher=None,
+    shard=None,
+    checkpoint=None,
+    broker=None,
+):
     """
     Continuously poll the match list by calling get_match_data(),
     detect state changes (live/upcoming -> live),
     and scrape real-time data for ongoing (live) matches.
 
+    Each live match has its own next-due time in a PollScheduler: close
+    finishes are polled every few seconds, innings breaks and matches
+    where nothing changed back off (see scheduler.STATE_INTERVALS). The
+    loop sleeps until the next match or fixture-list refresh is due.
+
+    The fixture list is refreshed every `poll_interval` seconds, independently
+    of the per-match polls, and diffed against a FixtureIndex: only cards that
+    are new, moved to another category or changed are acted on. Tracked
+    matches are keyed by match ID, so a card whose link moves from /live to
+    /scorecard still ends tracking; so does a match dropping off the list.
+
+    Upcoming fixtures go into a PrestartSchedule by their start time:
+    info and squads are fetched before (and just after) the toss, and the
+    match is tracked as live from its start time, without waiting for the
+    fixture list to show it as live.
+
     Args:
       poll_interval (int): how many seconds to wait between checks of the match list.
       db_collection (pymongo.collection.Collection): If provided, store real-time updates in Mongo.
+      writer (BatchedWriter): Write-behind writer to use instead of a private
+        one around `db_collection`.
+      pool (DriverPool): If provided, reuse warm browser sessions across polls.
+      max_workers (int): >1 scrapes tracked matches concurrently on that many threads.
+      match_deadline (float): seconds one match may take before it is cancelled
+        for this cycle (concurrent mode only).
+      fetcher (HttpFetcher): If provided, try plain HTTP before the browser.
+      store (CricketStore): If provided, keep per-match state, snapshots and
+        ball events in the normalized collections instead of `db_collection`.
+      base_url (str): Site to poll (e.g. a local replay server in benchmarks).
+      max_cycles (int): Stop after this many wake-ups; None polls forever.
+      scheduler (PollScheduler): Per-match poll scheduling policy.
+      prestart (PrestartSchedule): Warmup/promotion schedule for upcoming matches.
+      cache (StaticTabCache): Info/squads cache used by the pre-start warmups;
+        pre-toss entries are dropped at the post-toss warmup and when a
+        match goes live.
+      watcher (LiveWatcher): Keeps /live tabs open and reads them only when
+        their DOM changed; watched matches are checked every `watcher.tick`
+        seconds instead of on the scheduler's intervals.
+      shard (ShardWorker): Worker mode: fixture lists come from the shards
+        this worker leases (published by a coordinator) instead of
+        get_match_data(), and matches whose shard is lost are dropped.
+      checkpoint (TrackerCheckpoint): Tracked matches, last snapshots and
+        poll schedule are restored from it at start and saved to it every
+        `checkpoint.interval` seconds.
+      broker (LiveBroker): Changed polls are published to it (typed records
+        and delta events, one topic per match ID) for streaming readers.
     """
 
-    tracked_matches = {}
-
-    while True:
-        print("\n=== Checking match list by calling get_match_data()... ===")
-
-        # 1) Re-fetch the current list of matches
-        live_matches, upcoming_matches, concluded_matches = get_match_data()
+    if store is None and writer is None and db_collection is not None:
+        writer = BatchedWriter(db_collection).start()
+
+    tracked_matches = {}  # match_id -> {"link", "status", "match_dict", ...}
+    fixtures = FixtureIndex()
+    detector = ChangeDetector()
+    if scheduler is None:
+        scheduler = PollScheduler()
+    if prestart is None:
+        prestart = PrestartSchedule()
+    next_list_refresh = time.monotonic()
+    runner = None
+    if max_workers > 1:
+        runner = ConcurrentRunner(max_workers=max_workers, job_deadline=match_deadline)
+
+    def stop_tracking(match_id):
+        state = tracked_matches.pop(match_id)
+        detector.forget(match_id)
+        scheduler.remove(match_id)
+        if watcher is not None:
+            watcher.unwatch(state["link"])
+        return state
+
+    # Warm resume: pick up where the previous run stopped
+    if checkpoint is not None:
+        resumed = checkpoint.restore(tracked_matches, detector, scheduler)
+        if resumed:
+            print(f"Resumed {resumed} tracked matches from {checkpoint.path}")
+            # Reconciled by the first refresh: a resumed match that is no
+            # longer listed lands in "removed"
+            fixtures.seed(tracked_matches)
+
+    live_matches, upcoming_matches, concluded_matches = [], [], []
+    cycle = 0
+    while max_cycles is None or cycle < max_cycles:
+        cycle += 1
+        cycle_start = time.monotonic()
+
+        if cycle_start >= next_list_refresh:
+            next_list_refresh = cycle_start + poll_interval
+            print("\n=== Checking match list by calling get_match_data()... ===")
+
+            # 1) Re-fetch the current list of matches
+            list_loaded = True
+            if shard is not None:
+                live_matches, upcoming_matches, concluded_matches = shard.match_lists()
+            else:
+                try:
+                    live_matches, upcoming_matches, concluded_matches = get_match_data(
+                        pool=pool, fetcher=fetcher, base_url=base_url
+                    )
+                except (WebDriverException, TimeoutError) as exc:
+                    # Session failure, or no pool session free in time:
+                    # keep the previous list (so nothing changes) and keep
+                    # polling the tracked matches; retried at the next refresh
+                    print(f"Fixture list did not load ({exc!r}), retrying in {poll_interval}s")
+                    list_loaded = False
+
+            # Only cards that are new, moved or changed since the last refresh
+            changes = fixtures.update(live_matches, upcoming_matches, concluded_matches)
+            print(
+                f"Fixture list: {len(changes['live'])} live, {len(changes['upcoming'])} upcoming, "
+                f"{len(changes['concluded'])} concluded changed; {len(changes['removed'])} removed, "
+                f"{changes['unchanged']} unchanged"
+            )
 
-        # Show what's live
-        print("\n=== LATEST LIVE MATCHES (FROM GET_MATCH_DATA) ===")
-        for lm in live_matches:
-            print("  ->", lm)
+            # Show what's live
+            print("\n=== NEW OR UPDATED LIVE MATCHES (FROM GET_MATCH_DATA) ===")
+            for lm in changes["live"]:
+                print("  ->", lm)
+
+            # 2) Add new live matches (due for a scrape right away), and
+            # refresh tracked ones whose card changed
+            for m in changes["live"]:
+                link = m["link"]
+                match_id = match_id_from_url(link)
+                if match_id in tracked_matches:
+                    previous = tracked_matches[match_id]["match_dict"]
+                    if "type" not in m and "type" in previous:
+                        # Live cards show no format; keep the upcoming card's
+                        m = dict(m, type=previous["type"])
+                    tracked_matches[match_id]["match_dict"] = m
+                    print(f"-> Refreshed match_dict for {link} from get_match_data()")
+                    if store is not None:
+                        store.save_fixture(m)
+                else:
+                    print(f"\nDiscovered new LIVE match => Tracking: {link}")
+                    tracked_matches[match_id] = {
+                        "link": link,
+                        "status": "Live",
+                        "match_dict": m,
+                        "last_scraped": None,
+                        "poll_state": None,
+                    }
+                    scheduler.add(match_id, due=cycle_start)
+                    if cache is not None:
+                        cache.invalidate(match_id, provisional_only=True)
+                    if store is not None:
+                        store.save_fixture(m)
+
+            # Keep the stored fixture list current (read by the dashboard)
+            if store is not None:
+                for m in changes["upcoming"] + changes["concluded"]:
+                    store.save_fixture(m)
+                if list_loaded:
+                    store.mark_list_refreshed()
+
+            # 3) Schedule warmups and promotions for upcoming matches: the
+            # changed cards, and listed ones that are not scheduled yet (a
+            # card skipped once, e.g. with an unreadable time, gets retried)
+            unscheduled = [m for m in upcoming_matches if m.get("link") not in prestart]
+            added = prestart.update(changes["upcoming"] + unscheduled)
+            if added:
+                print(f"Scheduled {added} upcoming matches for pre-start warmup")
+
+            # 4) Remove concluded from tracking (by match ID: the card's
+            # link moves from /live to /scorecard when the match ends)
+            for m in changes["concluded"]:
+                match_id = match_id_from_url(m["link"])
+                if match_id in tracked_matches:
+                    print(f"Match concluded, removing from tracking: {m['link']}")
+                    link = stop_tracking(match_id)["link"]
+                    if store is not None:
+                        store.mark_concluded(link)
+                    if broker is not None:
+                        broker.conclude(match_id)
+
+            # 4.1) ...and matches that dropped off the list altogether (an
+            # empty list is more likely a failed load than the end of play)
+            if live_matches or upcoming_matches or concluded_matches:
+                for match_id in changes["removed"]:
+                    if match_id in tracked_matches:
+                        print(f"Match no longer listed, removing from tracking: {match_id}")
+                        link = stop_tracking(match_id)["link"]
+                        # Gone from the list: over (or abandoned) as far as
+                        # readers of the store are concerned
+                        if store is not None:
+                            store.mark_concluded(link)
+                        if broker is not None:
+                            broker.conclude(match_id)
+
+            # 4.2) Drop concluded and unlisted matches from the pre-start
+            # schedule too, promoted ones included
+            ended = {match_id_from_url(m["link"]) for m in changes["concluded"]}
+            if live_matches or upcoming_matches or concluded_matches:
+                ended.update(changes["removed"])
+            for link in [l for l in prestart if match_id_from_url(l) in ended]:
+                prestart.forget(link)
+
+            # 4.5) Worker mode: let go of matches whose shard moved elsewhere
+            if shard is not None:
+                for match_id in [m for m in tracked_matches if not shard.owns(m)]:
+                    print(f"Shard handed over, no longer tracking: {match_id}")
+                    stop_tracking(match_id)
+                    # Reported as new again if the shard comes back
+                    fixtures.forget(match_id)
+                for link in [l for l in prestart.matches if not shard.owns(l)]:
+                    fixtures.forget(match_id_from_url(link))
+                    prestart.forget(link)
+
+            # Browser memory per tracked match, for capacity planning
+            memory = pool.memory_bytes() if pool is not None else None
+            if memory is not None and tracked_matches:
+                print(
+                    f"Browser memory: {memory / 2**20:.0f} MB, "
+                    f"{memory / 2**20 / len(tracked_matches):.0f} MB per tracked match"
+                )
 
-        # 2) Add new live matches
-        for m in live_matches:
-            link = m["link"]
-            if link not in tracked_matches:
-                print(f"\nDiscovered new LIVE match => Tracking: {link}")
-                tracked_matches[link] = {
+        # 3.5) Pre-start: fetch info/squads before the toss (alongside the
+        # live polls in step 5), and start tracking matches at their start time
+        warmups, promotions = prestart.pop_due()
+        warmups = [m for m in warmups if shard is None or shard.owns(m["link"])]
+        for m in warmups:
+            entry = prestart.matches.get(m["link"])
+            if cache is not None and entry is not None and entry["info_data"] is not None:
+                # Post-toss refresh: drop what was cached before the toss
+                cache.invalidate(match_id_from_url(m["link"]), provisional_only=True)
+        for entry in promotions:
+            m = entry["match_dict"]
+            live_link = build_tab_urls(m["link"])["live"]
+            match_id = match_id_from_url(live_link)
+            if shard is not None and not shard.owns(live_link):
+                continue
+            if match_id not in tracked_matches:
+                print(f"\nScheduled start reached => Tracking: {live_link}")
+                tracked_matches[match_id] = {
+                    "link": live_link,
                     "status": "Live",
                     "match_dict": m,
                     "last_scraped": None,
+                    "poll_state": None,
+                    "info_data": entry["info_data"],
+                    "squads_data": entry["squads_data"],
                 }
+                scheduler.add(match_id, due=cycle_start)
+
+        # 5) Re-scrape the tracked live matches whose next poll is due
+        due_ids = [
+            match_id for match_id in scheduler.pop_due(cycle_start)
+            if match_id in tracked_matches
+        ]
+        if shard is not None:
+            # Shard lost since the list refresh, or leases unconfirmed: skip
+            # for now; dropped (or resumed) at the next refresh
+            for match_id in [m for m in due_ids if not shard.owns(m)]:
+                due_ids.remove(match_id)
+                scheduler.schedule(match_id, cycle_start + STATE_INTERVALS["play"])
+        if runner is None:
+            results = {}
+            for match_id in due_ids:
+                state = tracked_matches[match_id]
+                print(
+                    f"\nScraping real-time data for {state['match_dict']['name']} "
+                    f"(link={state['link']})"
+                )
+                try:
+                    results[match_id] = (
+                        scrape_tracked_match(
+                            state["link"], pool=pool, fetcher=fetcher, watcher=watcher
+                        ),
+                        None,
+                    )
+                except (WebDriverException, TimeoutError) as exc:
+                    # Reported like a failed job of the concurrent runner
+                    results[match_id] = (None, exc)
+            # Warmups after the polls, so they never hold up a due match
+            for m in warmups:
+                print(f"\nPre-start warmup (info + squads) for {m['name']}")
+                try:
+                    results[("warmup", m["link"])] = (
+                        prefetch_static_tabs(m, pool=pool, fetcher=fetcher, cache=cache),
+                        None,
+                    )
+                except (WebDriverException, TimeoutError) as exc:
+                    results[("warmup", m["link"])] = (None, exc)
+        else:
+            print(
+                f"\nScraping {len(due_ids)} due live matches and "
+                f"{len(warmups)} pre-start warmups concurrently..."
+            )
+            jobs = {
+                match_id: (
+                    lambda cancel, link=tracked_matches[match_id]["link"]: scrape_tracked_match(
+                        link, pool, cancel, fetcher=fetcher, watcher=watcher
+                    )
+                )
+                for match_id in due_ids
+            }
+            for m in warmups:
+                jobs[("warmup", m["link"])] = lambda cancel, m=m: prefetch_static_tabs(
+                    m, pool=pool, fetcher=fetcher, cache=cache, cancel_event=cancel
+                )
+            results = runner.run(jobs)
+
+        # Pre-start warmups: keep info/squads for the promotion (or for the
+        # match just promoted, when the schedule was joined late)
+        for m in warmups:
+            res, error = results.pop(("warmup", m["link"]))
+            if error is not None:
+                print(f"Pre-start warmup failed for {m['link']}: {error!r}")
+                continue
+            info_data, squads_data, changed = res
+            prestart.record_warmup(m["link"], info_data, squads_data)
+            promoted = tracked_matches.get(match_id_from_url(m["link"]))
+            if promoted is not None and promoted.get("info_data") is None:
+                promoted["info_data"] = info_data
+                promoted["squads_data"] = squads_data
+            if not changed:
+                # Cache hit, failed scrape or same content: stored already
+                continue
+            if store is not None and promoted is not None:
+                # Already live: keep its status and live state
+                store.save_static_tabs(promoted["link"], info_data, squads_data)
+            elif store is not None:
+                store.save_initial_match(
+                    "upcoming",
+                    {
+                        "status": "Upcoming",
+                        "teams": m.get("name"),
+                        "match_link": m["link"],
+                        "info_data": info_data,
+                        "squads_data": squads_data,
+                    },
+                )
 
-        # 2.5) Refresh tracked live matches with the new data
-        tracked_links = set(tracked_matches.keys())
-        current_live_links = {m["link"] for m in live_matches}
-        still_live_links = tracked_links & current_live_links
-        for link in still_live_links:
-            updated_m = next((x for x in live_matches if x["link"] == link), None)
-            if updated_m:
-                tracked_matches[link]["match_dict"] = updated_m
-                print(f"-> Refreshed match_dict for {link} from get_match_data()")
-
-        # 3) Check upcoming matches => if started, treat as live (pseudo-code)...
-
-        # 4) Remove concluded from tracking
-        for m in concluded_matches:
-            link = m["link"]
-            if link in tracked_matches:
-                print(f"Match concluded, removing from tracking: {link}")
-                del tracked_matches[link]
-
-        # 5) Re-scrape each tracked live match
-        for link, state in list(tracked_matches.items()):
-            match_dict = state["match_dict"]
-            print(f"\nScraping real-time data for {match_dict['name']} (link={link})")
-
-            # Build live/scorecard URLs
-            live_url = link
-            if live_url.endswith("/info"):
-                live_url = live_url.rsplit("/info", 1)[0] + "/live"
-            if live_url.endswith("/scorecard"):
-                live_url = live_url.rsplit("/scorecard", 1)[0] + "/live"
-            scorecard_url = live_url.rsplit("/live", 1)[0] + "/scorecard"
-
-            # Scrape
-            live_data_res = scrape_live_data(live_url)
-            scorecard_data_res = get_scorecard_data(scorecard_url)
+        for match_id, (res, error) in results.items():
+            if match_id not in tracked_matches:
+                continue
+            link = tracked_matches[match_id]["link"]
+            if error is not None:
+                print(f"Scrape failed for {link}: {error!r}")
+                scheduler.schedule(match_id, cycle_start + STATE_INTERVALS["play"])
+                continue
+            if res is None:
+                # Watched tab, DOM unchanged since the last tick
+                scheduler.schedule(match_id, cycle_start + watcher.tick)
+                continue
+            live_data_res, scorecard_data_res = res
+            tracked_matches[match_id]["last_scraped"] = datetime.now()
+
+            # A tab that failed (timeout, no data) is left out: the last good
+            # copy stays current and nothing is published or stored for it
+            live_ok = not scrape_failed(live_data_res)
+            scorecard_ok = not scrape_failed(scorecard_data_res)
+            if not live_ok and not scorecard_ok:
+                print(f"No data scraped for {link}, retrying")
+                scheduler.schedule(match_id, cycle_start + STATE_INTERVALS["play"])
+                continue
+
+            # Next poll: sooner near the end of an innings or in a close
+            # chase, later in breaks or while nothing changes
+            change = detector.detect(
+                match_id,
+                live_data_res if live_ok else None,
+                scorecard_data_res if scorecard_ok else None,
+            )
+            poll_state = assess_match(
+                tracked_matches[match_id]["match_dict"],
+                live_data_res,
+                tracked_matches[match_id].get("info_data"),
+            )
+            if live_ok:
+                interval = scheduler.interval_for(match_id, poll_state, change["changed"])
+            else:
+                # Live tab failed: retry at the state's interval, no backoff
+                interval = STATE_INTERVALS[poll_state]
+            if watcher is not None and link in watcher:
+                interval = watcher.tick
+            scheduler.schedule(match_id, cycle_start + interval)
+            tracked_matches[match_id]["poll_state"] = poll_state
+            print(f"{link}: {poll_state}, next poll in {interval:.0f}s")
+
+            # Skip matches where nothing happened since the last poll
+            if not change["changed"]:
+                print(f"No change for {link}, skipping")
+                continue
+
+            # Typed records (ints, legal-ball counts) for storage, of the
+            # current snapshot (failed tabs: the last good copy)
+            live_data_res, scorecard_data_res = detector.latest(match_id)
+            typed = normalize_snapshot(live_data_res, scorecard_data_res)
+
+            # Streaming readers get the change before it is stored
+            if broker is not None:
+                broker.publish(
+                    match_id,
+                    {
+                        "status": "Live",
+                        "name": tracked_matches[match_id]["match_dict"].get("name"),
+                        "link": link,
+                        "fingerprint": change["fingerprint"],
+                        "live": typed["live"],
+                        "scorecard": typed["scorecard"],
+                    },
+                    change["events"],
+                )
 
             # Print
+            print("EVENTS:", change["events"])
             print("LIVE DATA:", live_data_res)
             print("SCORECARD:", scorecard_data_res)
 
-            # If we have a Mongo collection, insert each real-time doc
-            if db_collection:
+            # Normalized storage: upsert current state + snapshot + events
+            if store is not None:
+                store.save_live_update(
+                    link, live_data_res, scorecard_data_res, change, typed=typed
+                )
+                print(f"[MongoDB] Queued live update for match {match_id}")
+
+            # Legacy collection: queue the changed sections only
+            elif writer is not None:
                 live_doc = {
                     "type": "live_update",
                     "match_link": link,
                     "timestamp": datetime.now(),
-                    "live_data": live_data_res,
-                    "scorecard_data": scorecard_data_res,
+                    "fingerprint": change["fingerprint"],
+                    "events": change["events"],
                 }
-                inserted_id = db_collection.insert_one(live_doc).inserted_id
-                print(f"[MongoDB] Inserted live update doc _id={inserted_id}")
-
-            tracked_matches[link]["last_scraped"] = datetime.now()
-
-        # 6) Sleep
-        print(f"\nSleeping {poll_interval} seconds before next poll...")
-        time.sleep(poll_interval)
+                if change["live_changed"]:
+                    live_doc["live_data"] = live_data_res
+                    live_doc["live"] = typed["live"]
+                if change["scorecard_changed"]:
+                    live_doc["scorecard_data"] = scorecard_data_res
+                    live_doc["scorecard"] = typed["scorecard"]
+                writer.write(live_doc)
+                print(f"[MongoDB] Queued live update doc for {link}")
+
+        if checkpoint is not None and checkpoint.due():
+            checkpoint.save(tracked_matches, detector, scheduler)
+
+        # 6) Sleep until the next match or the fixture list is due
+        if max_cycles is not None and cycle >= max_cycles:
+            break
+        wake = next_list_refresh
+        next_due = scheduler.next_due()
+        if next_due is not None:
+            wake = min(wake, next_due)
+        next_prestart = prestart.next_due()
+        if next_prestart is not None:
+            wake = min(wake, time.monotonic() + next_prestart - time.time())
+        delay = max(0.0, wake - time.monotonic())
+        print(f"\nSleeping {delay:.1f} seconds until the next poll is due...")
+        time.sleep(delay)
+
+    if runner is not None:
+        runner.shutdown()
+    if checkpoint is not None:
+        checkpoint.save(tracked_matches, detector, scheduler)
+    return tracked_matches
 
 
 # ----------------------------------------------------------------------
 # MAIN ENTRY POINT
 # ----------------------------------------------------------------------
-def main():
+def main(role="standalone", worker_id=None, metrics_port=None, stream_port=None):
     """
     1) Connect to MongoDB
     2) Do initial scrape, store in DB
     3) Start the real-time loop
+
+    role "coordinator" only fetches the fixture list and publishes it by
+    shard; role "worker" skips the initial scrape and tracks the matches
+    of the shards it leases (see sharding.py). Run one coordinator and
+    any number of workers against the same database.
+
+    `worker_id` names a worker (and its checkpoint, so give the same one
+    to resume after a restart); `metrics_port` / `stream_port` override
+    the role's default ports.
     """
     # ------------------------------------------------------------------
     # A) CONNECT TO MONGODB
     # ------------------------------------------------------------------
     client = MongoClient("mongodb://localhost:27017")  # <--- YOUR MONGODB URI
     db = client["myCricketDB"]  # <--- YOUR DB NAME
-    matches_collection = db["matches_data"]  # <--- YOUR COLLECTION NAME
 
+    # Separate matches / snapshots / ball_events collections, indexed
+    store = CricketStore(db)
+    store.ensure_indexes()
+
+    # Ports and checkpoint of this role
+    if role == "worker":
+        default_ports = (WORKER_METRICS_PORT, WORKER_STREAM_PORT)
+    elif role == "coordinator":
+        default_ports = (METRICS_PORT, None)
+    else:
+        default_ports = (METRICS_PORT, STREAM_PORT)
+    metrics_port = default_ports[0] if metrics_port is None else metrics_port
+    stream_port = default_ports[1] if stream_port is None else stream_port
+    worker = None
+    checkpoint_path = TRACKER_CHECKPOINT if role != "coordinator" else None
+    if role == "worker":
+        worker = ShardWorker(MongoShardQueue(db), worker_id=worker_id)
+        if checkpoint_path:
+            stem, ext = os.path.splitext(checkpoint_path)
+            checkpoint_path = f"{stem}.{worker.worker_id}{ext}"
+
+    # Warm browser sessions (or tabs) shared by every scraper below
+    if role == "coordinator":
+        pool = DriverPool(size=COORDINATOR_POOL_SIZE, max_pages=DRIVER_MAX_PAGES)
+    elif TABS_PER_BROWSER:
+        pool = TabPool(
+            browsers=TAB_BROWSERS,
+            tabs_per_browser=TABS_PER_BROWSER,
+            max_pages=DRIVER_MAX_PAGES,
+        )
+    else:
+        pool = DriverPool(size=DRIVER_POOL_SIZE, max_pages=DRIVER_MAX_PAGES)
+    pool.warm_up()
+
+    # Pooled keep-alive HTTP client; the browser is only a fallback
+    fetcher = HttpFetcher()
+
+    # Per-stage timing histograms for Prometheus
+    metrics_server = None
+    if metrics_port is not None:
+        metrics_server = MetricsServer(METRICS, port=metrics_port).start()
+        print(f"Serving scraper metrics at {metrics_server.url}")
+    if METRICS_JSON_LOG:
+        METRICS.enable_json_log(METRICS_JSON_LOG)
+
+    # Live updates pushed to streaming readers (SSE)
+    broker = None
+    stream_server = None
+    if stream_port is not None:
+        broker = LiveBroker()
+        stream_server = StreamServer(broker, port=stream_port).start()
+        print(f"Streaming live updates at {stream_server.url}")
+
+    # Info/squads survive restarts, so the bootstrap does not re-scrape them
+    cache = StaticTabCache(STATIC_CACHE_DIR)
+
+    # Tracked matches survive restarts too (warm resume)
+    checkpoint = TrackerCheckpoint(checkpoint_path) if checkpoint_path else None
+
+    # Long-lived /live tabs for the first WATCH_MATCHES live matches
+    watcher = None
+    if WATCH_MATCHES and LIVE_IN_PAGE and role != "coordinator":
+        watcher = LiveWatcher(pool, _LIVE_JS, max_watched=WATCH_MATCHES)
+
+    try:
+        if role == "coordinator":
+            run_coordinator(MongoShardQueue(db), pool, fetcher)
+        elif role == "worker":
+            worker.start()
+            print(f"Started shard worker {worker.worker_id}")
+            try:
+                real_time_scraping_loop(
+                    poll_interval=WORKER_LIST_REFRESH,
+                    store=store,
+                    pool=pool,
+                    fetcher=fetcher,
+                    max_workers=LIVE_WORKERS,
+                    match_deadline=LIVE_MATCH_DEADLINE,
+                    cache=cache,
+                    watcher=watcher,
+                    shard=worker,
+                    checkpoint=checkpoint,
+                    broker=broker,
+                )
+            finally:
+                worker.stop()
+        else:
+            run_scraper(
+                store, pool, fetcher, cache=cache, watcher=watcher,
+                checkpoint=checkpoint, broker=broker,
+            )
+    finally:
+        if watcher is not None:
+            watcher.close()
+        fetcher.close()
+        pool.close()
+        # Flush whatever is still queued before exiting
+        store.close()
+        if stream_server is not None:
+            stream_server.stop()
+        if metrics_server is not None:
+            metrics_server.stop()
+        METRICS.close()
+
+
+def run_scraper(store, pool, fetcher=None, cache=None, watcher=None, checkpoint=None,
+                broker=None):
+    """
+    Initial scrape + real-time loop, using sessions from `pool` and,
+    where the static HTML is enough, plain HTTP through `fetcher`.
+    Info and squads found in `cache` are not scraped again; live matches
+    with room in `watcher` are observed instead of reloaded. Matches known
+    to `checkpoint` from a previous run skip the initial scrape. Changes
+    are published to `broker` for streaming readers.
+    """
     # ------------------------------------------------------------------
     # B) INITIAL SCRAPE
     # ------------------------------------------------------------------
     print("Performing an initial full scrape of all matches...\n")
-    live_matches, upcoming_matches, concluded_matches = get_match_data()
-
-    all_data = {"type": "initial", "live": [], "upcoming": [], "concluded": []}
+    live_matches, upcoming_matches, concluded_matches = get_match_data(
+        pool=pool, fetcher=fetcher
+    )
+    matches_by_category = {
+        "live": live_matches,
+        "upcoming": upcoming_matches,
+        "concluded": concluded_matches,
+    }
+    listed = {m["link"] for ms in matches_by_category.values() for m in ms}
+
+    # Warm resume: only matches the previous run never scraped
+    known = checkpoint.known_matches() & listed if checkpoint is not None else set()
+    if known:
+        print(f"Skipping the initial scrape of {len(known)} matches known from {checkpoint.path}")
+        matches_by_category = {
+            category: [m for m in ms if m["link"] not in known]
+            for category, ms in matches_by_category.items()
+        }
 
-    for m in live_matches:
-        all_data["live"].append(scrape_all_tabs_for_match(m))
-    for m in upcoming_matches:
-        all_data["upcoming"].append(scrape_all_tabs_for_match(m))
-    for m in concluded_matches:
-        all_data["concluded"].append(scrape_all_tabs_for_match(m))
+    def store_match(category, record):
+        # Queued as soon as the match is done, not after the whole bootstrap
+        store.save_initial_match(category, record)
+        print(f"[MongoDB] Queued initial {category} match {record['match_link']}")
 
-    # Optionally save to JSON
-    with open("initial_scrape.json", "w", encoding="utf-8") as f:
-        json.dump(all_data, f, ensure_ascii=False, indent=2)
+    runner = ConcurrentRunner(
+        max_workers=BOOTSTRAP_WORKERS, job_deadline=BOOTSTRAP_TAB_DEADLINE
+    )
+    try:
+        all_data = bootstrap_matches(
+            matches_by_category,
+            runner,
+            pool=pool,
+            fetcher=fetcher,
+            on_match_done=store_match,
+            cache=cache,
+        )
+    finally:
+        runner.shutdown()
+    if checkpoint is not None:
+        # Failed scrapes are retried by the next run
+        scraped = {
+            record["match_link"]
+            for category, records in all_data.items()
+            for record in records
+            if record is not None and record_scraped(category, record)
+        }
+        checkpoint.mark_bootstrapped(known | scraped)
 
-    # Insert the entire initial doc into Mongo (or you could store each match individually)
-    inserted_id = matches_collection.insert_one(all_data).inserted_id
-    print(f"[MongoDB] Inserted initial scrape data with _id={inserted_id}\n")
+    # Optionally save to JSON (only what was scraped in this run)
+    if any(all_data.values()):
+        with open("initial_scrape.json", "w", encoding="utf-8") as f:
+            json.dump(all_data, f, ensure_ascii=False, indent=2)
 
     # ------------------------------------------------------------------
     # C) START REAL-TIME LOOP
     # ------------------------------------------------------------------
     print("\nStarting real-time loop for live matches...\n")
-    # Pass the matches_collection (or a different one) to store real-time updates
-    real_time_scraping_loop(poll_interval=60, db_collection=matches_collection)
+    real_time_scraping_loop(
+        poll_interval=60,
+        store=store,
+        pool=pool,
+        fetcher=fetcher,
+        max_workers=LIVE_WORKERS,
+        match_deadline=LIVE_MATCH_DEADLINE,
+        cache=cache,
+        watcher=watcher,
+        checkpoint=checkpoint,
+        broker=broker,
+    )
+
 
+def run_coordinator(queue, pool=None, fetcher=None, poll_interval=COORDINATOR_INTERVAL,
+                    base_url=CREX_BASE_URL, max_cycles=None):
+    """
+    Fetches the fixture list every `poll_interval` seconds and publishes
+    it to `queue` split into shards by match ID, for the workers.
+    """
+    cycle = 0
+    while max_cycles is None or cycle < max_cycles:
+        cycle += 1
+        started = time.monotonic()
+        try:
+            live_matches, upcoming_matches, concluded_matches = get_match_data(
+                pool=pool, fetcher=fetcher, base_url=base_url
+            )
+        except (WebDriverException, TimeoutError) as exc:
+            # Workers keep the last published lists; retried next cycle
+            print(f"[coordinator] Fixture list did not load ({exc!r}), retrying in {poll_interval}s")
+        else:
+            publish_fixtures(queue, live_matches, upcoming_matches, concluded_matches)
+            print(
+                f"[coordinator] Published {len(live_matches)} live, "
+                f"{len(upcoming_matches)} upcoming, {len(concluded_matches)} concluded matches"
+            )
+        if max_cycles is not None and cycle >= max_cycles:
+            break
+        time.sleep(max(0.0, poll_interval - (time.monotonic() - started)))
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="crex.live scraper")
+    parser.add_argument(
+        "--role",
+        choices=("standalone", "coordinator", "worker"),
+        default="standalone",
+        help="standalone (default), or one part of a sharded deployment",
+    )
+    parser.add_argument(
+        "--worker-id", help="worker name; reuse it to resume the worker's checkpoint"
+    )
+    parser.add_argument(
+        "--metrics-port", type=int, help="metrics port (0 picks a free one)"
+    )
+    parser.add_argument(
+        "--stream-port", type=int, help="live stream port (0 picks a free one)"
+    )
+    args = parser.parse_args()
+    main(
+        role=args.role,
+        worker_id=args.worker_id,
+        metrics_port=args.metrics_port,
+        stream_port=args.stream_port,
+    )
@@ -0,0 +1,302 @@
+import math
+import threading
+import time
+import uuid
+import zlib
+
+from pymongo import ReturnDocument
+
+from storage import match_id_from_url
+
+NUM_SHARDS = 16
+# A worker owns a shard until this long (s) after its last heartbeat...
+LEASE_SECONDS = 90
+# ...and renews its leases this often
+HEARTBEAT_SECONDS = 20
+# Workers without a heartbeat this long no longer count for balancing
+# (their shards expire at the same time and are picked up by the rest)
+WORKER_TTL = LEASE_SECONDS
+
+LIST_KEYS = ("live", "upcoming", "concluded")
+
+
+def shard_of(link, num_shards=NUM_SHARDS):
+    """Shard number of a match, stable across processes and machines."""
+    return zlib.crc32(match_id_from_url(link).encode("utf-8")) % num_shards
+
+
+def split_into_shards(live, upcoming, concluded, num_shards=NUM_SHARDS):
+    """{shard: {"live": [...], "upcoming": [...], "concluded": [...]}} for every shard."""
+    shards = {s: {key: [] for key in LIST_KEYS} for s in range(num_shards)}
+    for key, matches in zip(LIST_KEYS, (live, upcoming, concluded)):
+        for m in matches:
+            if m.get("link"):
+                shards[shard_of(m["link"], num_shards)][key].append(m)
+    return shards
+
+
+# ----------------------------------------------------------------------
+# 1) SHARD QUEUES: MONGO, AND AN IN-PROCESS STAND-IN
+# ----------------------------------------------------------------------
+class MongoShardQueue:
+    """
+    Shard assignments in Mongo, so coordinator and workers can run on
+    different machines:
+
+      shards   _id = shard number; the coordinator's latest fixture lists
+               for the shard, plus owner / lease_until (epoch seconds)
+      workers  _id = worker ID, heartbeat_at
+
+    Leases are taken and renewed with conditional updates, so at most one
+    worker owns a shard at any time.
+    """
+
+    def __init__(self, db):
+        self.shards = db["shards"]
+        self.workers = db["workers"]
+
+    def publish(self, shard_lists, now=None):
+        now = time.time() if now is None else now
+        for shard, lists in shard_lists.items():
+            self.shards.update_one(
+                {"_id": shard},
+                {
+                    "$set": dict(lists, published_at=now),
+                    "$setOnInsert": {"owner": None, "lease_until": 0},
+                },
+                upsert=True,
+            )
+
+    def acquire(self, worker_id, count, lease_seconds, now=None):
+        """Takes up to `count` free or expired shards; returns their numbers."""
+        now = time.time() if now is None else now
+        acquired = []
+        for _ in range(count):
+            doc = self.shards.find_one_and_update(
+                {"$or": [{"owner": None}, {"lease_until": {"$lt": now}}]},
+                {"$set": {"owner": worker_id, "lease_until": now + lease_seconds}},
+                projection={"_id": 1},
+                sort=[("_id", 1)],
+                return_document=ReturnDocument.AFTER,
+            )
+            if doc is None:
+                break
+            acquired.append(doc["_id"])
+        return acquired
+
+    def renew(self, worker_id, lease_seconds, now=None):
+        """Extends the worker's leases; returns the shards it still owns."""
+        now = time.time() if now is None else now
+        self.shards.update_many(
+            {"owner": worker_id, "lease_until": {"$gte": now}},
+            {"$set": {"lease_until": now + lease_seconds}},
+        )
+        owned = self.shards.find(
+            {"owner": worker_id, "lease_until": {"$gte": now}}, {"_id": 1}
+        )
+        return {doc["_id"] for doc in owned}
+
+    def release(self, worker_id, shards):
+        self.shards.update_many(
+            {"_id": {"$in": list(shards)}, "owner": worker_id},
+            {"$set": {"owner": None, "lease_until": 0}},
+        )
+
+    def heartbeat(self, worker_id, now=None):
+        now = time.time() if now is None else now
+        self.workers.update_one(
+            {"_id": worker_id}, {"$set": {"heartbeat_at": now}}, upsert=True
+        )
+
+    def remove_worker(self, worker_id):
+        self.workers.delete_one({"_id": worker_id})
+
+    def live_workers(self, ttl, now=None):
+        now = time.time() if now is None else now
+        return self.workers.count_documents({"heartbeat_at": {"$gte": now - ttl}})
+
+    def shard_count(self):
+        return self.shards.count_documents({})
+
+    def lists(self, shards):
+        """Merged fixture lists of `shards`."""
+        merged = {key: [] for key in LIST_KEYS}
+        for doc in self.shards.find({"_id": {"$in": list(shards)}}):
+            for key in LIST_KEYS:
+                merged[key].extend(doc.get(key) or [])
+        return merged
+
+
+class LocalShardQueue:
+    """
+    Same interface as MongoShardQueue, held in memory: coordinator and
+    workers as threads of one process (development, benchmarks).
+    """
+
+    def __init__(self):
+        self._shards = {}
+        self._workers = {}
+        self._lock = threading.Lock()
+
+    def publish(self, shard_lists, now=None):
+        now = time.time() if now is None else now
+        with self._lock:
+            for shard, lists in shard_lists.items():
+                doc = self._shards.setdefault(shard, {"owner": None, "lease_until": 0})
+                doc.update(lists, published_at=now)
+
+    def acquire(self, worker_id, count, lease_seconds, now=None):
+        now = time.time() if now is None else now
+        acquired = []
+        with self._lock:
+            for shard in sorted(self._shards):
+                if len(acquired) >= count:
+                    break
+                doc = self._shards[shard]
+                if doc["owner"] is None or doc["lease_until"] < now:
+                    doc["owner"], doc["lease_until"] = worker_id, now + lease_seconds
+                    acquired.append(shard)
+        return acquired
+
+    def renew(self, worker_id, lease_seconds, now=None):
+        now = time.time() if now is None else now
+        owned = set()
+        with self._lock:
+            for shard, doc in self._shards.items():
+                if doc["owner"] == worker_id and doc["lease_until"] >= now:
+                    doc["lease_until"] = now + lease_seconds
+                    owned.add(shard)
+        return owned
+
+    def release(self, worker_id, shards):
+        with self._lock:
+            for shard in shards:
+                doc = self._shards.get(shard)
+                if doc is not None and doc["owner"] == worker_id:
+                    doc["owner"], doc["lease_until"] = None, 0
+
+    def heartbeat(self, worker_id, now=None):
+        with self._lock:
+            self._workers[worker_id] = time.time() if now is None else now
+
+    def remove_worker(self, worker_id):
+        with self._lock:
+            self._workers.pop(worker_id, None)
+
+    def live_workers(self, ttl, now=None):
+        now = time.time() if now is None else now
+        with self._lock:
+            return sum(1 for seen in self._workers.values() if seen >= now - ttl)
+
+    def shard_count(self):
+        return len(self._shards)
+
+    def lists(self, shards):
+        merged = {key: [] for key in LIST_KEYS}
+        with self._lock:
+            for shard in shards:
+                doc = self._shards.get(shard, {})
+                for key in LIST_KEYS:
+                    merged[key].extend(doc.get(key) or [])
+        return merged
+
+
+# ----------------------------------------------------------------------
+# 2) COORDINATOR: FIXTURE LIST -> SHARDS
+# ----------------------------------------------------------------------
+def publish_fixtures(queue, live, upcoming, concluded, num_shards=NUM_SHARDS):
+    """Splits one fixture-list fetch by match ID and publishes every shard."""
+    queue.publish(split_into_shards(live, upcoming, concluded, num_shards))
+
+
+# ----------------------------------------------------------------------
+# 3) WORKER: LEASES, HEARTBEATS, REBALANCING
+# ----------------------------------------------------------------------
+class ShardWorker:
+    """
+    Holds leases on a fair share of the shards (ceil(shards / live
+    workers)) and renews them from a heartbeat thread. Shards of a worker
+    that stops heartbeating expire after `lease_seconds` and are taken over
+    by the others; a worker holding more than its share (e.g. after a new
+    worker joined) releases the surplus.
+
+    The real-time loop reads its fixture lists from match_lists() and
+    stops tracking matches for which owns() turns False.
+    """
+
+    def __init__(self, queue, worker_id=None, lease_seconds=LEASE_SECONDS,
+                 heartbeat_seconds=HEARTBEAT_SECONDS, worker_ttl=WORKER_TTL,
+                 num_shards=NUM_SHARDS):
+        self.queue = queue
+        self.worker_id = worker_id or f"worker-{uuid.uuid4().hex[:8]}"
+        self.lease_seconds = lease_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.worker_ttl = worker_ttl
+        self.num_shards = num_shards
+
+        self.owned = frozenset()
+        self._valid_until = 0.0  # leases are only trusted until then
+        self._stop = threading.Event()
+        self._thread = None
+
+    def heartbeat(self, now=None):
+        """Renews leases, sheds or takes shards to reach the fair share."""
+        now = time.time() if now is None else now
+        self.queue.heartbeat(self.worker_id, now)
+        owned = self.queue.renew(self.worker_id, self.lease_seconds, now)
+
+        workers = max(1, self.queue.live_workers(self.worker_ttl, now))
+        shards = self.queue.shard_count() or self.num_shards
+        fair = math.ceil(shards / workers)
+        if len(owned) > fair:
+            surplus = sorted(owned)[fair:]
+            self.queue.release(self.worker_id, surplus)
+            owned -= set(surplus)
+        elif len(owned) < fair:
+            owned |= set(
+                self.queue.acquire(self.worker_id, fair - len(owned), self.lease_seconds, now)
+            )
+
+        if owned != self.owned:
+            print(f"[{self.worker_id}] owns shards {sorted(owned)}")
+        self.owned = frozenset(owned)
+        self._valid_until = now + self.lease_seconds
+        return self.owned
+
+    def owns(self, link):
+        """
+        True if the match's shard is leased to this worker. Once the last
+        successful renewal is a lease old (queue unreachable), nothing is
+        owned any more: another worker may have taken the shards over.
+        """
+        if time.time() >= self._valid_until:
+            return False
+        return shard_of(link, self.num_shards) in self.owned
+
+    def match_lists(self):
+        """(live, upcoming, concluded) of the owned shards."""
+        owned = self.owned if time.time() < self._valid_until else ()
+        lists = self.queue.lists(owned)
+        return tuple(lists[key] for key in LIST_KEYS)
+
+    def start(self):
+        self.heartbeat()
+        self._thread = threading.Thread(target=self._run, name="shard-heartbeat", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.heartbeat_seconds):
+            try:
+                self.heartbeat()
+            except Exception as exc:
+                print(f"[{self.worker_id}] heartbeat failed: {exc!r}")
+
+    def stop(self):
+        """Stops heartbeating and hands the shards back right away."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.queue.release(self.worker_id, self.owned)
+        self.queue.remove_worker(self.worker_id)
+        self.owned = frozenset()
@@ -0,0 +1,169 @@
+import json
+import os
+import re
+import threading
+import time
+
+from collections import OrderedDict
+
+from diffing import fingerprint
+
+# How long a complete entry stays fresh, per tab (seconds)
+TAB_TTLS = {
+    "info": 6 * 60 * 60,
+    "squads": 6 * 60 * 60,
+}
+# Entries captured before the toss / XI announcement expire much sooner
+PROVISIONAL_TTL = 10 * 60
+MEMORY_ENTRIES = 256
+STATIC_CACHE_DIR = "static_cache"
+
+
+def is_provisional(tab, data):
+    """
+    True if `data` was scraped before the toss or the playing-XI
+    announcement, i.e. it is expected to change soon.
+    """
+    if tab == "info":
+        toss = data.get("toss_info") if isinstance(data, dict) else None
+        return not toss or toss == "N/A"
+    if tab == "squads":
+        squads = data.get("squads") if isinstance(data, dict) else None
+        return not isinstance(squads, list) or not all(t.get("playing_11") for t in squads)
+    return False
+
+
+def is_cacheable(data):
+    """Failed scrapes ("N/A", {"Error": ...}) are never cached."""
+    return isinstance(data, dict) and "Error" not in data
+
+
+# ----------------------------------------------------------------------
+# IN-MEMORY LRU + ON-DISK CACHE OF STATIC TABS
+# ----------------------------------------------------------------------
+class StaticTabCache:
+    """
+    Cache of the tabs that barely change during a match (info, squads),
+    keyed by (match ID, tab).
+
+    - Lookups hit an in-memory LRU of `capacity` entries first, then one
+      JSON file per entry under `directory` (so restarts start warm).
+    - Entries expire after the tab's TTL, or after PROVISIONAL_TTL if they
+      were scraped before the toss / playing XI (see is_provisional()).
+    - invalidate() drops entries on events such as the toss (post-toss
+      warmup) or a match going live.
+    - put() reports whether the content hash changed, also across an
+      invalidate() (the hashes of dropped entries are kept in memory).
+
+    `directory=None` keeps the cache in memory only.
+    """
+
+    def __init__(self, directory=STATIC_CACHE_DIR, capacity=MEMORY_ENTRIES,
+                 ttls=TAB_TTLS, provisional_ttl=PROVISIONAL_TTL):
+        self.directory = directory
+        self.capacity = capacity
+        self.ttls = ttls
+        self.provisional_ttl = provisional_ttl
+
+        self._memory = OrderedDict()
+        self._dropped = OrderedDict()  # (match_id, tab) -> hash of the dropped entry
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def tabs(self):
+        return tuple(self.ttls)
+
+    def _path(self, match_id, tab):
+        safe_id = re.sub(r"[^\w-]", "_", match_id)
+        return os.path.join(self.directory, f"{safe_id}.{tab}.json")
+
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.capacity:
+            self._memory.popitem(last=False)
+
+    def _load(self, match_id, tab):
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(match_id, tab), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _expired(self, tab, entry, now):
+        ttl = self.provisional_ttl if entry.get("provisional") else self.ttls[tab]
+        return now - entry["stored_at"] > ttl
+
+    def get(self, match_id, tab):
+        """Returns the cached data, or None if missing or expired."""
+        if tab not in self.ttls:
+            return None
+        key = (match_id, tab)
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                entry = self._load(match_id, tab)
+            if entry is None or self._expired(tab, entry, now):
+                self.misses += 1
+                return None
+            self._remember(key, entry)
+            self.hits += 1
+            return entry["data"]
+
+    def put(self, match_id, tab, data):
+        """
+        Stores `data` unless it is a failed scrape. Returns True if the
+        content differs from what was cached before.
+        """
+        if tab not in self.ttls or not is_cacheable(data):
+            return False
+        key = (match_id, tab)
+        entry = {
+            "data": data,
+            "stored_at": time.time(),
+            "hash": fingerprint(data),
+            "provisional": is_provisional(tab, data),
+        }
+        with self._lock:
+            previous = self._memory.get(key) or self._load(match_id, tab)
+            previous_hash = previous["hash"] if previous else self._dropped.pop(key, None)
+            self._remember(key, entry)
+            if self.directory:
+                path = self._path(match_id, tab)
+                tmp = path + ".tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(entry, f, ensure_ascii=False)
+                os.replace(tmp, path)
+        return previous_hash != entry["hash"]
+
+    def invalidate(self, match_id, tab=None, provisional_only=False):
+        """
+        Drops the match's entries (all static tabs, or just `tab`). With
+        provisional_only=True, entries scraped after the toss / XI are kept.
+        """
+        tabs = self.ttls if tab is None else (tab,)
+        with self._lock:
+            for t in tabs:
+                entry = self._memory.get((match_id, t)) or self._load(match_id, t)
+                if entry is None or (provisional_only and not entry.get("provisional")):
+                    continue
+                self._dropped[(match_id, t)] = entry["hash"]
+                while len(self._dropped) > self.capacity:
+                    self._dropped.popitem(last=False)
+                self._memory.pop((match_id, t), None)
+                if self.directory:
+                    try:
+                        os.remove(self._path(match_id, t))
+                    except OSError:
+                        pass
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "in_memory": len(self._memory)}
@@ -0,0 +1,222 @@
+from datetime import datetime
+from urllib.parse import urlparse
+
+from pymongo import ASCENDING, DESCENDING
+
+from mongo_writer import BatchedWriter, Upsert
+from normalize import normalize_fixture, normalize_info, normalize_snapshot
+
+TAB_SUFFIXES = ("/live", "/info", "/scorecard", "/squads")
+# Card fields kept in a match's summary besides scores and overs
+FIXTURE_DETAILS = ("time_start", "type", "winner", "reason")
+
+
+def match_id_from_url(url):
+    """
+    Stable match ID from a crex URL. Match links look like
+    /scoreboard/<series>/<match>/<title>/.../<slug>/<tab>; the series and
+    match codes identify the fixture regardless of which tab the link
+    points at, e.g. "QCY-1MV". Other paths fall back to the whole path.
+    """
+    path = urlparse(url).path.rstrip("/")
+    for suffix in TAB_SUFFIXES:
+        if path.endswith(suffix):
+            path = path[: -len(suffix)]
+            break
+
+    parts = [p for p in path.split("/") if p]
+    if len(parts) >= 3 and parts[0] == "scoreboard":
+        return f"{parts[1]}-{parts[2]}"
+    return "/".join(parts)
+
+
+# ----------------------------------------------------------------------
+# NORMALIZED STORAGE: matches / snapshots / ball_events
+# ----------------------------------------------------------------------
+class CricketStore:
+    """
+    Stores matches as separate documents instead of one monolithic blob:
+
+      matches      one document per match, _id = match ID, upserted with
+                   the current state (status, teams, latest live/scorecard,
+                   both as scraped and as typed records)
+      snapshots    one document per changed poll of a live match, holding
+                   only the typed records of the changed sections
+      ball_events  one document per delta event (new ball, wicket, ...)
+      scraper_status  when the scraper last refreshed the fixture list
+
+    Writes go through BatchedWriters (write-behind); reads are indexed
+    lookups, e.g. current_live_scores() uses the (status, updated_at) index.
+    """
+
+    def __init__(self, db, writer_options=None):
+        self.db = db
+        self.matches = db["matches"]
+        self.snapshots = db["snapshots"]
+        self.ball_events = db["ball_events"]
+        self.scraper_status = db["scraper_status"]
+
+        options = writer_options or {}
+        self._match_writer = BatchedWriter(self.matches, **options).start()
+        self._snapshot_writer = BatchedWriter(self.snapshots, **options).start()
+        self._event_writer = BatchedWriter(self.ball_events, **options).start()
+        self._status_writer = BatchedWriter(self.scraper_status, **options).start()
+
+    def ensure_indexes(self):
+        """Creates the compound indexes used by the read paths (idempotent)."""
+        self.matches.create_index([("status", ASCENDING), ("updated_at", DESCENDING)])
+        self.snapshots.create_index([("match_id", ASCENDING), ("timestamp", DESCENDING)])
+        self.ball_events.create_index([("match_id", ASCENDING), ("timestamp", ASCENDING)])
+        self.ball_events.create_index([("type", ASCENDING), ("timestamp", DESCENDING)])
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def upsert_match(self, link, fields):
+        """Sets `fields` on the match document, creating it if needed."""
+        now = datetime.now()
+        self._match_writer.write(
+            Upsert(
+                {"_id": match_id_from_url(link)},
+                {
+                    "$set": dict(fields, match_link=link, updated_at=now),
+                    "$setOnInsert": {"created_at": now},
+                },
+            )
+        )
+
+    def save_initial_match(self, category, record):
+        """Stores one bootstrap record (all four tabs) as the match's state."""
+        self.upsert_match(
+            record["match_link"],
+            {
+                "status": record.get("status"),
+                "category": category,
+                "teams": record.get("teams"),
+                "info_data": record.get("info_data"),
+                "squads_data": record.get("squads_data"),
+                "live_data": record.get("live_data"),
+                "scorecard_data": record.get("scorecard_data"),
+                "info": normalize_info(record.get("info_data")),
+                **normalize_snapshot(record.get("live_data"), record.get("scorecard_data")),
+            },
+        )
+
+    def save_static_tabs(self, link, info_data, squads_data):
+        """Refreshes only the info / squads tabs (e.g. a post-toss warmup)."""
+        self.upsert_match(
+            link,
+            {
+                "info_data": info_data,
+                "squads_data": squads_data,
+                "info": normalize_info(info_data),
+            },
+        )
+
+    def save_fixture(self, match_dict):
+        """
+        Refreshes the fixture-list summary of a match: names, scores and
+        overs, plus start time / type (upcoming) or result (concluded).
+        """
+        self.upsert_match(
+            match_dict["link"],
+            {
+                "status": match_dict.get("status"),
+                "teams": match_dict.get("name") or match_dict.get("teams"),
+                "summary": {
+                    "scores": match_dict.get("scores"),
+                    "overs": match_dict.get("over") or match_dict.get("overs"),
+                    **normalize_fixture(match_dict),
+                    **{k: match_dict[k] for k in FIXTURE_DETAILS if k in match_dict},
+                },
+            },
+        )
+
+    def save_live_update(self, link, live_data, scorecard_data, change, typed=None):
+        """
+        Records a changed poll: current state on the match document, a
+        snapshot with only the changed sections, and one doc per event.
+        `typed` is normalize_snapshot() output, computed here if not given.
+        """
+        match_id = match_id_from_url(link)
+        now = datetime.now()
+        if typed is None:
+            typed = normalize_snapshot(live_data, scorecard_data)
+
+        state = {"status": "Live", "fingerprint": change["fingerprint"]}
+        snapshot = {
+            "match_id": match_id,
+            "timestamp": now,
+            "fingerprint": change["fingerprint"],
+            "events": change["events"],
+        }
+        if change["live_changed"]:
+            state["live_data"] = live_data
+            state["live"] = snapshot["live"] = typed["live"]
+        if change["scorecard_changed"]:
+            state["scorecard_data"] = scorecard_data
+            state["scorecard"] = snapshot["scorecard"] = typed["scorecard"]
+
+        self.upsert_match(link, state)
+        self._snapshot_writer.write(snapshot)
+        for event in change["events"]:
+            self._event_writer.write(dict(event, match_id=match_id, timestamp=now))
+
+    def mark_concluded(self, link):
+        self.upsert_match(link, {"status": "Concluded"})
+
+    def mark_list_refreshed(self):
+        """
+        Records that the fixture list was just refreshed, so readers can
+        tell an idle match from a stalled scraper.
+        """
+        self._status_writer.write(
+            Upsert({"_id": "fixture_list"}, {"$set": {"refreshed_at": datetime.now()}})
+        )
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def current_live_scores(self):
+        """Current summary and live state of every live match (indexed)."""
+        return list(
+            self.matches.find(
+                {"status": "Live"},
+                {"teams": 1, "summary": 1, "live_data": 1, "live": 1, "updated_at": 1},
+            ).sort("updated_at", DESCENDING)
+        )
+
+    def latest_snapshot(self, match_id):
+        return self.snapshots.find_one(
+            {"match_id": match_id}, sort=[("timestamp", DESCENDING)]
+        )
+
+    def events_since(self, match_id, since):
+        return list(
+            self.ball_events.find(
+                {"match_id": match_id, "timestamp": {"$gt": since}}
+            ).sort("timestamp", ASCENDING)
+        )
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def _writers(self):
+        return (self._match_writer, self._snapshot_writer, self._event_writer,
+                self._status_writer)
+
+    def flush(self):
+        for writer in self._writers():
+            writer.flush()
+
+    def close(self):
+        for writer in self._writers():
+            writer.close()
+
+    def stats(self):
+        return {
+            "matches": self._match_writer.stats(),
+            "snapshots": self._snapshot_writer.stats(),
+            "ball_events": self._event_writer.stats(),
+            "scraper_status": self._status_writer.stats(),
+        }
@@ -0,0 +1,350 @@
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.remote.webelement import WebElement
+
+from driver_pool import (
+    LEAN_BROWSER,
+    block_requests,
+    browser_memory,
+    create_driver,
+    is_driver_healthy,
+    sum_memory,
+)
+from metrics import METRICS
+
+# Seconds a tab may take to replace its document after TabDriver.get()
+NAVIGATION_TIMEOUT = 30
+# Seconds between checks for the new document (the browser is free for
+# other tabs in between)
+NAVIGATION_POLL = 0.05
+
+# Marks the current document, then navigates: the mark disappears with it
+_NAVIGATE_JS = """
+window.__tabNavigating = true;
+window.location.href = arguments[0];
+"""
+# True once the new document has replaced the marked one and is parsed
+_NAVIGATED_JS = """
+return !window.__tabNavigating && document.readyState !== 'loading';
+"""
+
+
+# ----------------------------------------------------------------------
+# 1) TAB-BOUND PROXIES
+# ----------------------------------------------------------------------
+class _Browser:
+    """One Chrome session and the window handles opened in it."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.lock = threading.RLock()
+        self.current = driver.current_window_handle
+        self.spare = [self.current]  # open tabs nobody has checked out
+        self.tabs = 1
+        self.pages = {}  # handle -> checkouts served
+        self.broken = False
+
+    def activate(self, handle):
+        """Switches the session to `handle` (caller holds `lock`)."""
+        if self.current != handle:
+            self.driver.switch_to.window(handle)
+            self.current = handle
+
+
+def _unwrap(value):
+    if isinstance(value, _OnTab):
+        return value._target
+    if isinstance(value, (list, tuple)):
+        return type(value)(_unwrap(v) for v in value)
+    return value
+
+
+class _OnTab:
+    """
+    Forwards every attribute access and call to `target` (the driver or
+    one of its elements) after switching the browser to `handle`, holding
+    the browser's lock, so scrapers on different tabs of one browser can
+    interleave their commands. Elements returned by calls are wrapped too.
+    """
+
+    def __init__(self, target, browser, handle):
+        self._target = target
+        self._browser = browser
+        self._handle = handle
+
+    def _wrap(self, value):
+        if isinstance(value, WebElement):
+            return _OnTab(value, self._browser, self._handle)
+        if isinstance(value, list):
+            return [self._wrap(v) for v in value]
+        return value
+
+    def __getattr__(self, name):
+        with self._browser.lock:
+            self._browser.activate(self._handle)
+            value = getattr(self._target, name)
+        if not callable(value):
+            return self._wrap(value)
+
+        def call(*args, **kwargs):
+            args = [_unwrap(a) for a in args]
+            with self._browser.lock:
+                self._browser.activate(self._handle)
+                return self._wrap(value(*args, **kwargs))
+
+        return call
+
+
+class TabDriver(_OnTab):
+    """A checked-out tab; use it like a WebDriver."""
+
+    def __init__(self, browser, handle, navigation_timeout=NAVIGATION_TIMEOUT):
+        super().__init__(browser.driver, browser, handle)
+        self._navigation_timeout = navigation_timeout
+
+    def get(self, url):
+        """
+        Loads `url` in this tab without holding the browser for the whole
+        page load: one command starts the navigation, then the tab is
+        polled for the new document, and the other tabs' commands run in
+        between. Raises TimeoutException if it does not arrive in time.
+        """
+        browser = self._browser
+        with browser.lock:
+            browser.activate(self._handle)
+            browser.driver.execute_script(_NAVIGATE_JS, url)
+        deadline = time.monotonic() + self._navigation_timeout
+        while True:
+            time.sleep(NAVIGATION_POLL)
+            with browser.lock:
+                browser.activate(self._handle)
+                try:
+                    if browser.driver.execute_script(_NAVIGATED_JS):
+                        return
+                except WebDriverException:
+                    # Old document unloading: scripts may fail meanwhile
+                    if not is_driver_healthy(browser.driver):
+                        raise
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"{url} did not load in {self._navigation_timeout}s")
+
+    def quit(self):
+        raise RuntimeError("Release tabs to their TabPool instead of quitting them")
+
+
+# ----------------------------------------------------------------------
+# 2) POOL OF TABS IN A FEW SHARED BROWSERS
+# ----------------------------------------------------------------------
+def create_tab_browser():
+    """
+    create_driver() with page load strategy "none": commands sent to a
+    tab never wait for its pending page load, so one tab's navigation
+    does not hold up the others (TabDriver.get() waits for it instead).
+    """
+    return create_driver(page_load_strategy="none")
+
+
+class TabPool:
+    """
+    Drop-in replacement for DriverPool that hands out tabs instead of
+    whole browsers: up to `browsers` Chrome sessions, each hosting up to
+    `tabs_per_browser` tabs. One tab per concurrent scrape (or watched
+    match) costs a renderer process instead of a full Chrome process tree.
+
+    Commands to one browser are serialized, but a page load is not one
+    command: TabDriver.get() starts the navigation and polls the tab for
+    the new document, and wait_for_ready() polls it for the content, so
+    the tabs of one browser load their pages side by side. Browsers are
+    launched without holding the pool, so checkouts of tabs in running
+    browsers never wait for a Chrome startup. Pages that update
+    themselves (watched live tabs) keep running in the background. Tabs are closed and reopened after
+    `max_pages` checkouts. With `lean`, new tabs get the same request
+    blocking as the browser's first tab (see driver_pool.create_driver()).
+    """
+
+    def __init__(self, browsers=1, tabs_per_browser=8, max_pages=50,
+                 checkout_timeout=120, driver_factory=create_tab_browser, lean=LEAN_BROWSER,
+                 navigation_timeout=NAVIGATION_TIMEOUT):
+        self.browsers = browsers
+        self.tabs_per_browser = tabs_per_browser
+        self.size = browsers * tabs_per_browser
+        self.max_pages = max_pages
+        self.checkout_timeout = checkout_timeout
+        self.driver_factory = driver_factory
+        self.lean = lean
+        self.navigation_timeout = navigation_timeout
+
+        self._browsers = []
+        self._launching = 0  # browsers being started outside _cond
+        self._checked_out = 0
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def warm_up(self, count=None):
+        """Starts `count` browsers (defaults to all of them) up front."""
+        count = self.browsers if count is None else min(count, self.browsers)
+        while True:
+            with self._cond:
+                if len(self._browsers) + self._launching >= count:
+                    return
+                self._launching += 1
+            self._launch_reserved()
+
+    def _launch(self):
+        with METRICS.timer("driver_startup"):
+            return _Browser(self.driver_factory())
+
+    def _launch_reserved(self, take_tab=False):
+        """
+        Launches a browser for a slot counted in _launching, without
+        holding _cond (Chrome takes seconds to start). With take_tab its
+        first tab is checked out to the caller. Returns (browser, handle
+        of that tab or None).
+        """
+        try:
+            browser = self._launch()
+        except Exception:
+            with self._cond:
+                self._launching -= 1
+                self._cond.notify_all()
+            raise
+        with self._cond:
+            self._launching -= 1
+            self._cond.notify_all()
+            if not self._closed:
+                self._browsers.append(browser)
+                handle = None
+                if take_tab:
+                    handle = browser.spare.pop()
+                    self._checked_out += 1
+                return browser, handle
+        self._drop_browser(browser)
+        raise RuntimeError("TabPool is closed")
+
+    def _reserve(self):
+        """Picks a running browser with room for one more tab (caller holds _cond)."""
+        for browser in self._browsers:
+            if browser.spare:
+                return browser
+        for browser in self._browsers:
+            if browser.tabs < self.tabs_per_browser:
+                return browser
+        return None
+
+    def checkout(self):
+        """
+        Returns a tab, opening one if a browser has room or launching a
+        browser if there are fewer than `browsers`, else waits.
+        """
+        deadline = time.monotonic() + self.checkout_timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("TabPool is closed")
+                browser = self._reserve()
+                if browser is not None:
+                    handle = browser.spare.pop() if browser.spare else None
+                    if handle is None:
+                        browser.tabs += 1
+                    self._checked_out += 1
+                    break
+                if len(self._browsers) + self._launching < self.browsers:
+                    self._launching += 1
+                    browser = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._cond.wait(remaining):
+                    raise TimeoutError("No browser tab became available")
+
+        if browser is None:
+            browser, handle = self._launch_reserved(take_tab=True)
+
+        try:
+            with browser.lock:
+                if handle is None:
+                    browser.driver.switch_to.new_window("tab")
+                    handle = browser.current = browser.driver.current_window_handle
+                    if self.lean:
+                        block_requests(browser.driver)
+            tab = TabDriver(browser, handle, self.navigation_timeout)
+            if not is_driver_healthy(tab):
+                raise WebDriverException("Browser session is gone")
+        except Exception:
+            self._drop_browser(browser)
+            with self._cond:
+                self._checked_out -= 1
+                self._cond.notify_all()
+            raise
+        browser.pages[handle] = browser.pages.get(handle, 0) + 1
+        return tab
+
+    def release(self, tab, broken=False):
+        """
+        Gives a tab back. A broken tab takes its whole browser down (the
+        other tabs' commands would fail too); a worn-out tab is closed.
+        """
+        browser = tab._browser
+        if broken or browser.broken:
+            self._drop_browser(browser)
+        elif self._closed or browser.pages.get(tab._handle, 0) >= self.max_pages:
+            self._close_tab(browser, tab._handle)
+        else:
+            with self._cond:
+                browser.spare.append(tab._handle)
+        with self._cond:
+            self._checked_out -= 1
+            self._cond.notify_all()
+
+    def _close_tab(self, browser, handle):
+        with browser.lock:
+            try:
+                if browser.tabs > 1:
+                    browser.activate(handle)
+                    browser.driver.close()
+                    browser.current = None
+                    browser.pages.pop(handle, None)
+                    with self._cond:
+                        browser.tabs -= 1
+                    return
+            except WebDriverException:
+                self._drop_browser(browser)
+                return
+        # Closing the last tab would end the session: keep it as a spare
+        with self._cond:
+            browser.pages.pop(handle, None)
+            browser.spare.append(handle)
+
+    def _drop_browser(self, browser):
+        with self._cond:
+            browser.broken = True
+            if browser in self._browsers:
+                self._browsers.remove(browser)
+            self._cond.notify_all()
+        try:
+            browser.driver.quit()
+        except WebDriverException:
+            pass
+
+    def memory_bytes(self):
+        """Memory of every browser (see driver_pool.browser_memory())."""
+        with self._cond:
+            browsers = list(self._browsers)
+        return sum_memory(browser_memory(b.driver) for b in browsers)
+
+    def stats(self):
+        with self._cond:
+            return {
+                "browsers": len(self._browsers),
+                "tabs": sum(b.tabs for b in self._browsers),
+                "checked_out": self._checked_out,
+            }
+
+    def close(self):
+        """Quits every browser, including tabs still checked out."""
+        with self._cond:
+            self._closed = True
+            browsers = list(self._browsers)
+        for browser in browsers:
+            self._drop_browser(browser)
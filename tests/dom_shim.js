@@ -0,0 +1,139 @@
+// Minimal DOM for running the scrapers' injected scripts under node,
+// where no browser is available. Reads {"tree", "script", "async",
+// "active"} as JSON on stdin and writes the script's result as JSON.
+//
+// The tree is the page as parsed by BeautifulSoup (see page_script.py),
+// so a script sees the same elements and text nodes the Python parsers
+// do. Supported: querySelector(All) with tag, .class, [class="..."] and
+// [class*="..."] compound selectors, textContent, innerText (whitespace
+// collapsed), children, closest(), click(), createTreeWalker(SHOW_TEXT)
+// and requestAnimationFrame. Clicking the n-th .playingxi-button shows
+// only the n-th .team-squad block, as ReplayDriver does.
+'use strict';
+
+class Text {
+  constructor(data, parent) {
+    this.nodeType = 3;
+    this.data = this.nodeValue = data;
+    this.parentNode = parent;
+    this.childNodes = [];
+  }
+  get textContent() { return this.data; }
+}
+
+class Element {
+  constructor(json, parent) {
+    this.nodeType = 1;
+    this.tagName = (json.tag || '').toUpperCase();
+    this.classList = json.cls || [];
+    this.parentNode = parent;
+    this.childNodes = (json.kids || []).map(function (kid) {
+      return typeof kid === 'string' ? new Text(kid, this) : new Element(kid, this);
+    }, this);
+  }
+  get className() { return this.classList.join(' '); }
+  get children() { return this.childNodes.filter(function (n) { return n.nodeType === 1; }); }
+  get textContent() { return this.childNodes.map(function (n) { return n.textContent; }).join(''); }
+  get innerText() { return this.hidden ? '' : this.textContent.replace(/\s+/g, ' ').trim(); }
+  get hidden() {
+    for (let el = this; el; el = el.parentNode) {
+      if (el.classList.indexOf('team-squad') !== -1 &&
+          document.teamSquads().indexOf(el) !== document.activeTeam) {
+        return true;
+      }
+    }
+    return false;
+  }
+  matches(selector) {
+    const m = /^([a-z0-9]+)?((?:\.[\w-]+)*)(?:\[class(\*?)="([^"]*)"\])?$/i.exec(selector);
+    if (!m) throw new Error('Selector not supported by the shim: ' + selector);
+    if (m[1] && m[1].toUpperCase() !== this.tagName) return false;
+    const classes = (m[2] || '').split('.').filter(Boolean);
+    for (const c of classes) {
+      if (this.classList.indexOf(c) === -1) return false;
+    }
+    if (m[4] !== undefined) {
+      if (m[3] ? this.className.indexOf(m[4]) === -1 : this.className !== m[4]) return false;
+    }
+    return true;
+  }
+  *descendants() {
+    for (const child of this.children) {
+      if (child.hidden) continue;
+      yield child;
+      yield* child.descendants();
+    }
+  }
+  querySelectorAll(selector) {
+    return Array.from(this.descendants()).filter(function (el) { return el.matches(selector); });
+  }
+  querySelector(selector) { return this.querySelectorAll(selector)[0] || null; }
+  closest(selector) {
+    for (let el = this; el && el.nodeType === 1; el = el.parentNode) {
+      if (el.matches(selector)) return el;
+    }
+    return null;
+  }
+  click() {
+    if (this.classList.indexOf('playingxi-button') !== -1) {
+      document.activeTeam = document.querySelectorAll('.playingxi-button').indexOf(this);
+    }
+  }
+}
+
+class Document extends Element {
+  constructor(json, active) {
+    super(json, null);
+    this.activeTeam = active;
+  }
+  get hidden() { return false; }
+  teamSquads() {
+    const found = [];
+    const walk = function (el) {
+      for (const child of el.children) {
+        if (child.classList.indexOf('team-squad') !== -1) found.push(child);
+        walk(child);
+      }
+    };
+    walk(this);
+    return found;
+  }
+  createTreeWalker(root) {
+    const nodes = [];
+    const walk = function (el) {
+      for (const child of el.childNodes) {
+        if (child.nodeType === 3) nodes.push(child);
+        else if (!child.hidden) walk(child);
+      }
+    };
+    walk(root);
+    let index = -1;
+    return {
+      currentNode: root,
+      nextNode: function () {
+        index += 1;
+        this.currentNode = nodes[index] || this.currentNode;
+        return index < nodes.length ? this.currentNode : null;
+      }
+    };
+  }
+}
+
+let input = '';
+process.stdin.setEncoding('utf8');
+process.stdin.on('data', function (chunk) { input += chunk; });
+process.stdin.on('end', function () {
+  const job = JSON.parse(input);
+  global.document = new Document(job.tree, job.active || 0);
+  global.NodeFilter = {SHOW_TEXT: 4};
+  global.requestAnimationFrame = function (callback) { return setTimeout(callback, 0); };
+  const write = function (result) {
+    process.stdout.write(JSON.stringify(result === undefined ? null : result));
+  };
+  const body = new Function(job.script);
+  if (job.async) {
+    body.call(null, write);
+  } else {
+    write(body.call(null));
+  }
+});
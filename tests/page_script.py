@@ -0,0 +1,38 @@
+"""
+Runs an injected scraper script (_LIVE_JS, _SQUADS_JS) against an HTML
+page under node, with the minimal DOM in dom_shim.js. The page is parsed
+by BeautifulSoup, so the script sees the same tree the Python parsers do.
+"""
+import json
+import os
+import shutil
+import subprocess
+
+from bs4 import Comment, Doctype, NavigableString
+
+from parsing import make_soup
+
+NODE = shutil.which("node")
+SHIM = os.path.join(os.path.dirname(__file__), "dom_shim.js")
+
+
+def _tree(tag):
+    kids = []
+    for child in tag.children:
+        if isinstance(child, (Comment, Doctype)):
+            continue
+        if isinstance(child, NavigableString):
+            kids.append(str(child))
+        else:
+            kids.append(_tree(child))
+    return {"tag": tag.name, "cls": tag.get("class") or [], "kids": kids}
+
+
+def run_page_script(script, html, async_script=False, timeout=10):
+    """The script's return value (or what it passes to the async callback)."""
+    job = {"tree": _tree(make_soup(html)), "script": script, "async": async_script}
+    result = subprocess.run(
+        [NODE, SHIM], input=json.dumps(job), capture_output=True, text=True,
+        timeout=timeout, check=True,
+    )
+    return json.loads(result.stdout)
@@ -0,0 +1,86 @@
+import json
+import time
+
+from datetime import datetime
+
+import checkpoint
+from checkpoint import TrackerCheckpoint
+from diffing import ChangeDetector
+from scheduler import PollScheduler
+
+LINK = "http://crex/scoreboard/QCY/1MV/19th-Match/4J/4M/brh-vs-mls/live"
+MATCH_ID = "QCY-1MV"
+LIVE = {"batsmen": [{"name": "Head"}]}
+
+
+def tracked_state():
+    tracked = {MATCH_ID: {
+        "link": LINK, "match_dict": {"link": LINK}, "last_scraped": datetime(2025, 1, 1, 18, 0),
+    }}
+    detector = ChangeDetector()
+    detector.detect(MATCH_ID, LIVE, {})
+    scheduler = PollScheduler()
+    scheduler.add(MATCH_ID)
+    return tracked, detector, scheduler
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "state.json")
+    TrackerCheckpoint(path).save(*tracked_state())
+
+    tracked, detector, scheduler = {}, ChangeDetector(), PollScheduler()
+    resumed = TrackerCheckpoint(path)
+    assert resumed.restore(tracked, detector, scheduler) == 1
+    assert tracked[MATCH_ID]["last_scraped"] == datetime(2025, 1, 1, 18, 0)
+    assert detector.latest(MATCH_ID) == (LIVE, {})
+    assert not detector.detect(MATCH_ID, LIVE, {})["changed"]
+    assert MATCH_ID in scheduler
+    assert resumed.known_matches() == {LINK}
+
+
+def test_bootstrapped_links_are_known(tmp_path):
+    path = str(tmp_path / "state.json")
+    TrackerCheckpoint(path).mark_bootstrapped(["a", "b"])
+
+    assert TrackerCheckpoint(path).known_matches() == {"a", "b"}
+
+
+def rewrite(path, **fields):
+    with open(path, encoding="utf-8") as f:
+        state = json.load(f)
+    state.update(fields)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+
+
+def test_old_checkpoint_is_ignored(tmp_path):
+    path = str(tmp_path / "state.json")
+    TrackerCheckpoint(path, max_age=60).save(*tracked_state())
+    rewrite(path, saved_at=time.time() - 61)
+
+    stale = TrackerCheckpoint(path, max_age=60)
+    assert stale.load() is None
+    assert stale.restore({}, ChangeDetector(), PollScheduler()) == 0
+    assert stale.known_matches() == set()
+
+
+def test_other_version_is_ignored(tmp_path):
+    path = str(tmp_path / "state.json")
+    TrackerCheckpoint(path).save(*tracked_state())
+    rewrite(path, version=checkpoint._VERSION - 1)
+
+    assert TrackerCheckpoint(path).load() is None
+
+
+def test_missing_or_corrupt_file_is_a_cold_start(tmp_path):
+    path = tmp_path / "state.json"
+    assert TrackerCheckpoint(str(path)).load() is None
+    path.write_text("{not json", encoding="utf-8")
+    assert TrackerCheckpoint(str(path)).load() is None
+
+
+def test_due_after_the_interval(tmp_path):
+    state = TrackerCheckpoint(str(tmp_path / "state.json"), interval=3600)
+    assert state.due()
+    state.save(*tracked_state())
+    assert not state.due()
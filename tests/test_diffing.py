@@ -0,0 +1,96 @@
+from diffing import ChangeDetector, FixtureIndex, diff_snapshots
+
+LINK = "http://crex/scoreboard/QCY/1MV/19th-Match/4J/4M/brh-vs-mls/live"
+
+
+def live(balls, bowler="Starc", batsmen=("Head", "Smith"), over="Over 3"):
+    return {
+        "overs_timeline": [{"over_title": over, "balls": list(balls)}],
+        "bowler": {"name": bowler},
+        "batsmen": [{"name": name} for name in batsmen],
+    }
+
+
+def test_new_balls_in_the_current_over():
+    events = diff_snapshots(live(["1", "4"]), live(["1", "4", "0", "6"]), {}, {})
+
+    assert events == [
+        {"type": "new_ball", "over": "Over 3", "ball": "0"},
+        {"type": "new_ball", "over": "Over 3", "ball": "6"},
+    ]
+
+
+def test_new_over_with_a_bowler_change():
+    events = diff_snapshots(
+        live(["1", "4", "0", "6", "1", "1"]), live(["W"], bowler="Cummins", over="Over 4"), {}, {}
+    )
+
+    assert events == [
+        {"type": "new_ball", "over": "Over 4", "ball": "W"},
+        {"type": "bowler_change", "from": "Starc", "to": "Cummins"},
+    ]
+
+
+def test_wickets_from_batsmen_leaving_or_the_scorecard():
+    gone = diff_snapshots(live(["1"]), live(["1"], batsmen=("Smith", "Labuschagne")), {}, {})
+    fow = diff_snapshots(
+        {}, {},
+        {"fall_of_wickets": [{"batsman": "Head", "score": "12-1"}], "batting": [[]]},
+        {"fall_of_wickets": [{"batsman": "Head", "score": "12-1"}, {"batsman": "Smith", "score": "40-2"}],
+         "batting": [[], []]},
+    )
+
+    assert gone == [{"type": "wicket", "batsman": "Head"}]
+    assert fow == [
+        {"type": "wicket", "batsman": "Smith", "score": "40-2"},
+        {"type": "innings_change", "innings": 2},
+    ]
+
+
+def test_detector_reports_changes_and_events():
+    detector = ChangeDetector()
+    first = detector.detect(LINK, live(["1"]), {})
+    same = detector.detect(LINK, live(["1"]), {})
+    later = detector.detect(LINK, live(["1", "2"]), {})
+
+    assert first["first"] and first["changed"] and first["events"] == []
+    assert not same["changed"] and same["fingerprint"] == first["fingerprint"]
+    assert later["live_changed"] and not later["scorecard_changed"]
+    assert later["events"] == [{"type": "new_ball", "over": "Over 3", "ball": "2"}]
+
+
+def test_failed_poll_keeps_the_last_good_snapshot():
+    detector = ChangeDetector()
+    detector.detect(LINK, live(["1"]), {"batting": [[]]})
+    failed = detector.detect(LINK, None, None)
+    recovered = detector.detect(LINK, live(["1", "4"]), None)
+
+    assert not failed["changed"] and failed["events"] == []
+    assert detector.latest(LINK) == (live(["1", "4"]), {"batting": [[]]})
+    assert recovered["events"] == [{"type": "new_ball", "over": "Over 3", "ball": "4"}]
+
+
+def test_fixture_index_reports_only_changes():
+    index = FixtureIndex()
+    a = {"link": "http://crex/scoreboard/AAA/1/m/live", "scores": ["10/0"]}
+    b = {"link": "http://crex/scoreboard/BBB/2/m/live", "scores": ["0/0"]}
+    index.update([a, b], [], [])
+
+    ended = dict(a, link="http://crex/scoreboard/AAA/1/m/scorecard")
+    changes = index.update([], [], [ended])
+
+    assert changes["concluded"] == [ended]
+    assert changes["live"] == [] and changes["unchanged"] == 0
+    assert changes["removed"] == ["BBB-2"]
+    assert "AAA-1" in index and len(index) == 1
+
+
+def test_seeded_matches_are_reported_on_the_next_update():
+    index = FixtureIndex()
+    index.seed(["AAA-1", "BBB-2"])
+    a = {"link": "http://crex/scoreboard/AAA/1/m/live"}
+
+    changes = index.update([a], [], [])
+
+    assert changes["live"] == [a]
+    assert changes["removed"] == ["BBB-2"]
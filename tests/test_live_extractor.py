@@ -0,0 +1,25 @@
+import os
+
+import pytest
+
+import scrapper
+from benchmarks.corpus import build_corpus, render_live_page, sample_live_states
+from tests.page_script import NODE, run_page_script
+
+RECORDED_PAGE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "crex.live.html")
+
+PAGES = {path: html for path, html in build_corpus().items() if path.endswith("/live")}
+PAGES.update(
+    (f"/scoreboard/sample/{i}/live", render_live_page(state))
+    for i, state in enumerate(sample_live_states(50))
+)
+with open(RECORDED_PAGE, encoding="utf-8") as f:
+    PAGES["crex.live.html"] = f.read()
+
+
+@pytest.mark.skipif(NODE is None, reason="needs node")
+@pytest.mark.parametrize("path", sorted(PAGES))
+def test_in_page_extractor_matches_parser(path):
+    expected = scrapper.parse_live_data(PAGES[path])
+
+    assert run_page_script(scrapper._LIVE_JS, PAGES[path]) == expected
@@ -0,0 +1,96 @@
+"""
+The real-time loop against the recorded corpus, served by FakeCrexServer
+and scraped with ReplayDriver (no browser).
+"""
+import contextlib
+import io
+
+import pytest
+
+import scrapper
+from benchmarks.corpus import load_recorded_matches, match_path, render_fixture_list
+from benchmarks.fake_crex import FakeCrexServer, ReplayDriver
+from checkpoint import TrackerCheckpoint
+from driver_pool import DriverPool
+from fetcher import HttpFetcher
+from storage import match_id_from_url
+
+RECORDS = load_recorded_matches()
+LIVE = [r for r in RECORDS if r["category"] == "live"]
+
+
+class RecordingStore:
+    """Stands in for MatchStore: records every call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args))
+
+
+@pytest.fixture
+def crex():
+    with FakeCrexServer() as server:
+        pool = DriverPool(size=2, driver_factory=ReplayDriver)
+        fetcher = HttpFetcher()
+        yield server, pool, fetcher
+        fetcher.close()
+        pool.close()
+
+
+def run_loop(crex, **kwargs):
+    server, pool, fetcher = crex
+    with contextlib.redirect_stdout(io.StringIO()):
+        return scrapper.real_time_scraping_loop(
+            poll_interval=0, pool=pool, fetcher=fetcher, base_url=server.base_url, **kwargs
+        )
+
+
+def list_without(server, gone, ended=None):
+    server.pages["/fixtures/match-list"] = render_fixture_list([
+        dict(r, category="concluded") if match_path(r) == ended else r
+        for r in RECORDS if match_path(r) != gone
+    ])
+
+
+def test_live_matches_are_tracked(crex):
+    store = RecordingStore()
+    tracked = run_loop(crex, max_cycles=1, store=store)
+
+    assert len(tracked) == len(LIVE)
+    stored = {args[0] for name, args in store.calls if name == "save_live_update"}
+    assert len(stored) == len(LIVE)
+
+
+def test_concluded_and_unlisted_matches_are_marked_concluded(crex, monkeypatch):
+    server = crex[0]
+    gone, ended = match_path(LIVE[0]), match_path(LIVE[1])
+    fetch_list = scrapper.get_match_data
+    calls = []
+
+    def changing_list(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 2:
+            list_without(server, gone, ended)
+        return fetch_list(**kwargs)
+
+    monkeypatch.setattr(scrapper, "get_match_data", changing_list)
+    store = RecordingStore()
+    tracked = run_loop(crex, max_cycles=2, store=store)
+
+    assert tracked == {}
+    concluded = sorted(args[0] for name, args in store.calls if name == "mark_concluded")
+    assert concluded == sorted(server.base_url + match_path(r) + "/live" for r in LIVE[:2])
+
+
+def test_resume_drops_matches_no_longer_listed(crex, tmp_path):
+    server = crex[0]
+    path = str(tmp_path / "state.json")
+    first = run_loop(crex, max_cycles=1, checkpoint=TrackerCheckpoint(path, interval=0))
+    assert len(first) == len(LIVE)
+
+    list_without(server, match_path(LIVE[0]))
+    resumed = run_loop(crex, max_cycles=1, checkpoint=TrackerCheckpoint(path, interval=0))
+
+    assert sorted(resumed) == sorted(set(first) - {match_id_from_url(match_path(LIVE[0]))})
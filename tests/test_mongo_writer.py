@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+from mongo_writer import BatchedWriter, Upsert, coalesce_upserts
+
+
+class FakeCollection:
+    name = "matches"
+
+    def __init__(self):
+        self.inserted = []
+        self.updates = []
+
+    def insert_many(self, docs, ordered=True):
+        self.inserted.extend(docs)
+        return SimpleNamespace(inserted_ids=list(range(len(docs))))
+
+    def update_one(self, filter, update, upsert=False):
+        self.updates.append((filter, update))
+
+
+def test_coalesce_merges_upserts_of_one_filter():
+    merged = coalesce_upserts([
+        Upsert({"link": "a"}, {"$set": {"score": "10/0", "overs": "1.0"}}),
+        Upsert({"link": "b"}, {"$set": {"score": "5/1"}}),
+        Upsert({"link": "a"}, {"$set": {"score": "14/0"}, "$setOnInsert": {"created": 1}}),
+    ])
+
+    assert merged == [
+        Upsert({"link": "a"}, {"$set": {"score": "14/0", "overs": "1.0"}, "$setOnInsert": {"created": 1}}),
+        Upsert({"link": "b"}, {"$set": {"score": "5/1"}}),
+    ]
+
+
+def test_coalesce_leaves_the_queued_updates_alone():
+    first = Upsert({"link": "a"}, {"$set": {"score": "10/0"}})
+    coalesce_upserts([first, Upsert({"link": "a"}, {"$set": {"score": "14/0"}})])
+
+    assert first.update == {"$set": {"score": "10/0"}}
+
+
+def test_writer_applies_one_update_per_match_and_batch():
+    collection = FakeCollection()
+    writer = BatchedWriter(collection, batch_size=10, flush_interval=0.05)
+    for runs in range(5):
+        writer.write(Upsert({"link": "a"}, {"$set": {"runs": runs}}))
+    writer.write({"type": "event", "link": "a"})
+    writer.start()
+    writer.flush()
+    writer.close()
+
+    assert collection.updates == [({"link": "a"}, {"$set": {"runs": 4}})]
+    assert collection.inserted == [{"type": "event", "link": "a"}]
+    assert writer.stats() == {"queued": 0, "written": 2, "dropped": 0, "failed": 0, "retries": 0}
+
+
+def test_writer_drops_documents_when_the_queue_stays_full():
+    writer = BatchedWriter(FakeCollection(), max_queue=1, put_timeout=0.01)
+
+    assert writer.write({"type": "event"})
+    assert not writer.write({"type": "event"})
+    assert writer.stats()["dropped"] == 1
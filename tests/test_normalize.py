@@ -0,0 +1,80 @@
+import pytest
+
+from normalize import (
+    MatchResult, format_balls, overs_to_balls, parse_match_result, parse_score,
+    scrape_failed, to_int,
+)
+
+
+@pytest.mark.parametrize("text, expected", [
+    (
+        "MLS162/620.0BRH Won 4th T20I, BBL 2024-25BRH18.1163/2",
+        MatchResult("MLS", 162, 6, 120, "BRH", 163, 2, 109, "BRH"),
+    ),
+    # All out: 103 in 9.5 overs, not 10 in 39.5 (longer than a T20)
+    (
+        "SL1039.5NZ Won 2nd T20I, New Zealand tour of Sri LankaNZ10.2104/1",
+        MatchResult("SL", 103, 10, 59, "NZ", 104, 1, 62, "NZ"),
+    ),
+    (
+        "IND250/850.0AUS Won 1st ODI, Australia tour of IndiaAUS48.3251/7",
+        MatchResult("IND", 250, 8, 300, "AUS", 251, 7, 291, "AUS"),
+    ),
+])
+def test_parse_match_result(text, expected):
+    assert parse_match_result(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    None,
+    "",
+    "N/A",
+    # No sixth ball in an over
+    "MLS162/619.6BRH Won 4th T20I, BBL 2024-25BRH18.1163/2",
+    # Longer than the format allows
+    "MLS162/620.0BRH Won 4th T20I, BBL 2024-25BRH21.1163/2",
+    # Multi-innings results are not parsed
+    "AUS474&234AUS Won 1st Test, India tour of AustraliaIND369&155",
+])
+def test_parse_match_result_rejects(text):
+    assert parse_match_result(text) is None
+
+
+@pytest.mark.parametrize("text, balls", [
+    ("18.1", 109), ("(2.0)", 12), ("20", 120), ("Yet to bat", None), (None, None),
+])
+def test_overs_to_balls(text, balls):
+    assert overs_to_balls(text) == balls
+
+
+@pytest.mark.parametrize("text, score", [
+    ("163/2", (163, 2)), ("163-2", (163, 2)), ("111", (111, None)), ("N/A", (None, None)),
+])
+def test_parse_score(text, score):
+    assert parse_score(text) == score
+
+
+def test_to_int():
+    assert to_int("1,024") == 1024
+    assert to_int("-") is None
+
+
+@pytest.mark.parametrize("data, failed", [
+    (None, True), ("N/A", True), ({"Error": "timeout"}, True), ({"live": "N/A"}, True),
+    ({"batsmen": []}, False), ([], False),
+])
+def test_scrape_failed(data, failed):
+    assert scrape_failed(data) is failed
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("T20I", (True, 120)),
+    ("/scoreboard/SN7/1Q1/10th-Match/10P/10T/set-vs-war-10th-match-barbados-t10-2024-25/live", (True, 60)),
+    ("3rd ODI", (True, 300)),
+    ("One-Day Cup", (True, 300)),
+    ("2nd Test", (True, None)),
+    ("Hundred", (False, None)),
+    ("N/A", (False, None)),
+])
+def test_format_balls(text, expected):
+    assert format_balls(text) == expected
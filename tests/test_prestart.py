@@ -0,0 +1,74 @@
+from datetime import datetime
+
+import pytest
+
+from prestart import PROMOTE_LEAD, REFRESH_LEAD, WARMUP_LEAD, PrestartSchedule, parse_start_time
+
+NOW = datetime(2025, 1, 1, 18, 0)
+
+
+@pytest.mark.parametrize("text, start", [
+    ("Jan 1, 2025, 7:45:00 PM", datetime(2025, 1, 1, 19, 45)),
+    ("Jan 2, 2025, 1:45 PM", datetime(2025, 1, 2, 13, 45)),
+    ("Today, 7:30 PM", datetime(2025, 1, 1, 19, 30)),
+    ("Tomorrow, 7:30 PM", datetime(2025, 1, 2, 19, 30)),
+    # A bare time already past is tomorrow's
+    ("7:30 PM", datetime(2025, 1, 1, 19, 30)),
+    ("9:00 AM", datetime(2025, 1, 2, 9, 0)),
+    ("Starts in 2h 15m", datetime(2025, 1, 1, 20, 15)),
+    ("Starts in 45 min", datetime(2025, 1, 1, 18, 45)),
+    ("N/A", None),
+    ("Match delayed", None),
+])
+def test_parse_start_time(text, start):
+    assert parse_start_time(text, NOW) == start
+
+
+def fixture(link, starts_in):
+    return {"link": link, "status": "Upcoming", "time_start": f"Starts in {starts_in} min"}
+
+
+def test_warmup_refresh_and_promote_in_order():
+    now = NOW.timestamp()
+    schedule = PrestartSchedule()
+    match = fixture("a", 60)
+    assert schedule.update([match, {"time_start": "7:30 PM"}, fixture("b", "?")], now) == 1
+
+    start = now + 60 * 60
+    assert schedule.pop_due(start - WARMUP_LEAD - 1) == ([], [])
+    assert schedule.pop_due(start - WARMUP_LEAD) == ([match], [])
+    schedule.record_warmup("a", {"venue": "MCG"}, {"squads": []})
+    assert schedule.pop_due(start - REFRESH_LEAD) == ([match], [])
+    assert schedule.next_due() == start - PROMOTE_LEAD
+
+    warmups, promotions = schedule.pop_due(start)
+    assert warmups == []
+    assert [(p["match_dict"], p["info_data"]) for p in promotions] == [(match, {"venue": "MCG"})]
+    assert "a" in schedule and len(schedule) == 0
+    assert schedule.next_due() is None
+
+
+def test_promoted_match_is_not_scheduled_again_until_forgotten():
+    now = NOW.timestamp()
+    schedule = PrestartSchedule()
+    schedule.update([fixture("a", 1)], now)
+    schedule.pop_due(now + 60)
+
+    assert schedule.update([fixture("a", 1)], now + 60) == 0
+    assert list(schedule) == ["a"]
+
+    schedule.forget("a")
+    assert "a" not in schedule
+    assert schedule.update([fixture("a", 1)], now + 60) == 1
+
+
+def test_late_start_times_are_left_to_the_fixture_list():
+    now = NOW.timestamp()
+    schedule = PrestartSchedule(max_overdue=60 * 60)
+
+    assert schedule.update([{"link": "a", "time_start": "Jan 1, 2025, 4:30 PM"}], now) == 0
+    assert schedule.update([{"link": "b", "time_start": "Jan 1, 2025, 5:30 PM"}], now) == 1
+    # Already started: promoted right away, live tracking fetches the rest
+    warmups, promotions = schedule.pop_due(now)
+    assert warmups == []
+    assert [p["match_dict"]["link"] for p in promotions] == ["b"]
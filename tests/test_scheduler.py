@@ -0,0 +1,66 @@
+import pytest
+
+from scheduler import MAX_INTERVAL, STATE_INTERVALS, PollScheduler, assess_match, innings_balls
+
+T20 = {"type": "T20I", "status": "Live"}
+BATTING = {"batsmen": [{"name": "Head"}, {"name": "Smith"}]}
+
+
+@pytest.mark.parametrize("match, live_data, state", [
+    # A failed scrape is retried soon, not taken for a break
+    (T20, "N/A", "play"),
+    (T20, {"Error": "timeout"}, "play"),
+    (T20, {"batsmen": []}, "break"),
+    (dict(T20, status="Upcoming"), {"batsmen": []}, "prestart"),
+    (dict(T20, status="Upcoming"), "N/A", "prestart"),
+    (dict(T20, scores=["40/1"], over=["6.0"]), BATTING, "play"),
+    (dict(T20, scores=["150/4"], over=["17.2"]), BATTING, "death"),
+    (dict(T20, scores=["180/5", "120/3"], over=["20.0", "14.0"]), BATTING, "chase"),
+    # Well ahead of the rate with wickets in hand
+    (dict(T20, scores=["120/9", "110/0"], over=["20.0", "12.0"]), BATTING, "play"),
+    (dict(T20, type="2nd Test", scores=["300/4"], over=["85.0"]), BATTING, "play"),
+])
+def test_assess_match(match, live_data, state):
+    assert assess_match(match, live_data) == state
+
+
+def test_innings_balls_falls_back_to_the_series_name():
+    assert innings_balls({"type": "10th Match", "link": "/x/live"}, {"series_name": "Barbados T10"}) == 60
+    assert innings_balls({"type": "N/A"}) is None
+
+
+def test_unchanged_polls_back_off_up_to_the_cap():
+    scheduler = PollScheduler()
+    intervals = [scheduler.interval_for("a", "play", changed=False) for _ in range(8)]
+
+    assert intervals[0] == STATE_INTERVALS["play"] * 1.5
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == MAX_INTERVAL
+    assert scheduler.interval_for("a", "death", changed=True) == STATE_INTERVALS["death"]
+
+
+def test_pop_due_keeps_matches_in_flight_until_rescheduled():
+    scheduler = PollScheduler()
+    scheduler.add("a", due=10)
+    scheduler.add("b", due=5)
+    scheduler.add("c", due=50)
+
+    assert scheduler.pop_due(now=20) == ["b", "a"]
+    scheduler.add("a")  # in flight: ignored
+    assert scheduler.pop_due(now=20) == []
+    scheduler.schedule("a", 30)
+    scheduler.remove("c")
+    assert scheduler.next_due() == 30
+    assert scheduler.pop_due(now=100) == ["a"]
+
+
+def test_export_and_restore_keep_due_times_and_streaks():
+    scheduler = PollScheduler()
+    scheduler.add("a", due=100)
+    scheduler.interval_for("a", "play", changed=False)
+
+    restored = PollScheduler()
+    restored.restore(scheduler.export(now=40), now=1000)
+
+    assert restored.next_due() == pytest.approx(1060)
+    assert restored.interval_for("a", "play", changed=False) == STATE_INTERVALS["play"] * 1.5 ** 2
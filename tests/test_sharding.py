@@ -0,0 +1,75 @@
+from sharding import LocalShardQueue, ShardWorker, publish_fixtures, shard_of, split_into_shards
+
+LEASE = 30
+
+
+def link(series, match):
+    return f"http://crex/scoreboard/{series}/{match}/1st-Match/x/y/a-vs-b/live"
+
+
+def test_matches_land_in_the_same_shard_on_every_tab():
+    live = link("QCY", "1MV")
+    scorecard = live.replace("/live", "/scorecard")
+
+    assert shard_of(live, 8) == shard_of(scorecard, 8)
+    shards = split_into_shards([{"link": live}], [], [{"link": scorecard}], 8)
+    assert sorted(shards) == list(range(8))
+    assert shards[shard_of(live, 8)]["live"] == [{"link": live}]
+
+
+def test_lease_is_exclusive_until_it_expires():
+    queue = LocalShardQueue()
+    queue.publish({0: {"live": []}, 1: {"live": []}}, now=0)
+
+    assert queue.acquire("a", 2, LEASE, now=0) == [0, 1]
+    assert queue.acquire("b", 2, LEASE, now=LEASE) == []
+    assert queue.renew("a", LEASE, now=LEASE) == {0, 1}
+    # a stops renewing: b takes over once the lease ran out
+    assert queue.acquire("b", 2, LEASE, now=2 * LEASE + 1) == [0, 1]
+    assert queue.renew("a", LEASE, now=2 * LEASE + 1) == set()
+
+
+def test_released_shards_are_free_at_once():
+    queue = LocalShardQueue()
+    queue.publish({0: {}, 1: {}}, now=0)
+    queue.acquire("a", 2, LEASE, now=0)
+    queue.release("a", [1])
+    queue.release("b", [0])  # not b's to release
+
+    assert queue.acquire("b", 2, LEASE, now=1) == [1]
+
+
+def test_workers_split_the_shards_and_take_over_a_dead_one():
+    queue = LocalShardQueue()
+    publish_fixtures(queue, [{"link": link("S%d" % i, "M")} for i in range(20)], [], [], num_shards=4)
+    a = ShardWorker(queue, "a", lease_seconds=LEASE, worker_ttl=LEASE, num_shards=4)
+    b = ShardWorker(queue, "b", lease_seconds=LEASE, worker_ttl=LEASE, num_shards=4)
+
+    assert a.heartbeat(now=0) == {0, 1, 2, 3}
+    b.heartbeat(now=1)
+    # a sheds its surplus on the next heartbeat, b picks it up on its own
+    assert a.heartbeat(now=2) == {0, 1}
+    assert b.heartbeat(now=3) == {2, 3}
+
+    # a dies: its leases lapse and b takes every shard
+    assert b.heartbeat(now=LEASE + 1) == {2, 3}
+    assert b.heartbeat(now=LEASE + 3) == {0, 1, 2, 3}
+
+
+def test_worker_owns_and_lists_only_its_shards():
+    queue = LocalShardQueue()
+    matches = [{"link": link("S%d" % i, "M")} for i in range(20)]
+    publish_fixtures(queue, matches, [], [], num_shards=4)
+    worker = ShardWorker(queue, "a", num_shards=4)
+    worker.heartbeat()
+    queue.release("a", [3])
+    worker.owned = worker.owned - {3}
+
+    live, upcoming, concluded = worker.match_lists()
+    assert sorted(m["link"] for m in live) == sorted(
+        m["link"] for m in matches if shard_of(m["link"], 4) != 3
+    )
+    assert all(worker.owns(m["link"]) == (shard_of(m["link"], 4) != 3) for m in matches)
+
+    worker.stop()
+    assert queue.acquire("b", 4, LEASE) == [0, 1, 2, 3]
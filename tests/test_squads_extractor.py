@@ -0,0 +1,37 @@
+import pytest
+
+import scrapper
+from benchmarks.check_squads_extractor import NESTED_ROWS_PAGE
+from benchmarks.corpus import build_corpus
+from benchmarks.fake_crex import FakeCrexServer, ReplayDriver
+from tests.page_script import NODE, run_page_script
+
+PAGES = {
+    path: html for path, html in build_corpus().items()
+    if path.endswith("/squads") and "playingxi-button" in html
+}
+PAGES["/scoreboard/check/nested/squads"] = NESTED_ROWS_PAGE
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeCrexServer(PAGES) as server:
+        yield server
+
+
+@pytest.mark.skipif(NODE is None, reason="needs node")
+@pytest.mark.parametrize("path", sorted(PAGES))
+def test_in_page_extractor_matches_clicking(server, path):
+    driver = ReplayDriver()
+    driver.get(server.base_url + path)
+    expected = scrapper._squads_by_clicking(driver)
+
+    actual = run_page_script(scrapper._SQUADS_JS, PAGES[path], async_script=True)
+
+    assert expected
+    assert actual == expected
+
+
+@pytest.mark.skipif(NODE is None, reason="needs node")
+def test_in_page_extractor_without_panel():
+    assert run_page_script(scrapper._SQUADS_JS, "<html><body></body></html>", async_script=True) is None
@@ -0,0 +1,109 @@
+import itertools
+import threading
+import time
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+import tab_pool
+from tab_pool import TabPool
+
+LAUNCH_SECONDS = 0.5
+LOAD_SECONDS = 0.3
+
+
+class _SwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def window(self, handle):
+        self._driver.current_window_handle = handle
+
+    def new_window(self, kind):
+        handle = f"tab-{next(self._driver._ids)}"
+        self._driver.loads[handle] = None
+        self._driver.current_window_handle = handle
+
+
+class FakeBrowser:
+    """
+    Windows whose navigations take LOAD_SECONDS to replace the document,
+    like Chrome with page load strategy "none": commands never wait.
+    Each command takes the session, as chromedriver serializes them.
+    """
+
+    def __init__(self, launch_seconds=LAUNCH_SECONDS, load_seconds=LOAD_SECONDS):
+        time.sleep(launch_seconds)
+        self.load_seconds = load_seconds
+        self._ids = itertools.count(1)
+        self._session = threading.Lock()
+        self.current_window_handle = "tab-0"
+        self.loads = {"tab-0": None}  # handle -> time its new document arrives
+        self.switch_to = _SwitchTo(self)
+
+    @property
+    def current_url(self):
+        return "about:blank"
+
+    def execute_script(self, script, *args):
+        assert self._session.acquire(blocking=False), "commands overlapped in one session"
+        try:
+            handle = self.current_window_handle
+            if script == tab_pool._NAVIGATE_JS:
+                self.loads[handle] = time.monotonic() + self.load_seconds
+                return None
+            if script == tab_pool._NAVIGATED_JS:
+                return self.loads[handle] is not None and time.monotonic() >= self.loads[handle]
+            return None
+        finally:
+            self._session.release()
+
+    def quit(self):
+        pass
+
+
+def test_tabs_of_one_browser_load_side_by_side():
+    pool = TabPool(browsers=1, tabs_per_browser=4, driver_factory=FakeBrowser)
+    pool.warm_up()
+    tabs = [pool.checkout() for _ in range(4)]
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=tab.get, args=("http://crex/live",)) for tab in tabs]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.monotonic() - start < 2 * LOAD_SECONDS
+    pool.close()
+
+
+def test_checkout_does_not_wait_for_a_browser_launch():
+    pool = TabPool(browsers=2, tabs_per_browser=2, driver_factory=FakeBrowser)
+    pool.warm_up(1)
+    first = pool.checkout()
+    # The first browser's spare tab is taken: the next checkout with room
+    # in it must not queue behind the second browser's launch
+    launching = threading.Thread(target=pool.warm_up)
+    launching.start()
+    time.sleep(0.05)
+
+    start = time.monotonic()
+    second = pool.checkout()
+    assert time.monotonic() - start < LAUNCH_SECONDS / 2
+    assert second._browser is first._browser
+
+    launching.join()
+    assert pool.stats()["browsers"] == 2
+    pool.close()
+
+
+def test_navigation_times_out():
+    pool = TabPool(
+        browsers=1, driver_factory=lambda: FakeBrowser(launch_seconds=0, load_seconds=10),
+        navigation_timeout=0.2,
+    )
+    tab = pool.checkout()
+    with pytest.raises(TimeoutException):
+        tab.get("http://crex/live")
+    pool.close()